@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+HTML 报告渲染基准
+用合成的大型当日汇总数据比较两种写法的耗时和峰值内存：
+    - 整串渲染：render_html_content 拼出完整字符串后写入报告和 index.html 两个文件
+    - 流式渲染：iter_html_content 逐段写入报告文件，index.html 通过 publish_root_index 发布
+
+用法（在项目根目录执行）：
+    python benchmarks/html_render.py [词组数] [每组新闻数]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def build_report_data(group_count: int, titles_per_group: int) -> dict:
+    """构造与 prepare_report_data 结构相同的报告数据"""
+    stats = []
+    for group_index in range(group_count):
+        titles = []
+        for title_index in range(titles_per_group):
+            titles.append(
+                {
+                    "title": f"热点新闻标题 {group_index}-{title_index} <测试> & 转义",
+                    "source_name": f"平台{title_index % 11}",
+                    "time_display": "[08时00分 ~ 23时30分]",
+                    "count": title_index % 7 + 1,
+                    "ranks": [title_index % 30 + 1, title_index % 30 + 3],
+                    "rank_threshold": 5,
+                    "url": f"https://example.com/news/{group_index}/{title_index}",
+                    "mobile_url": "",
+                    "is_new": title_index % 5 == 0,
+                }
+            )
+        stats.append(
+            {"word": f"关键词{group_index}", "count": len(titles), "titles": titles}
+        )
+
+    new_titles = [
+        {
+            "source_id": f"source{source_index}",
+            "source_name": f"平台{source_index}",
+            "titles": stats[source_index]["titles"][:20] if stats else [],
+        }
+        for source_index in range(min(group_count, 11))
+    ]
+    return {
+        "stats": stats,
+        "new_titles": new_titles,
+        "failed_ids": ["toutiao"],
+        "total_new_count": sum(len(source["titles"]) for source in new_titles),
+    }
+
+
+def write_concatenated(report_data: dict, total_titles: int, output_dir: Path) -> None:
+    """整串渲染后写两次"""
+    html_content = main.render_html_content(report_data, total_titles, True, "daily")
+    with open(output_dir / "当日汇总.html", "w", encoding="utf-8") as f:
+        f.write(html_content)
+    with open(output_dir / "index.html", "w", encoding="utf-8") as f:
+        f.write(html_content)
+
+
+def write_streaming(report_data: dict, total_titles: int, output_dir: Path) -> None:
+    """流式写入并发布 index.html"""
+    file_path = output_dir / "当日汇总.html"
+    tmp_file = file_path.with_suffix(".html.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.writelines(
+            main.iter_html_content(report_data, total_titles, True, "daily")
+        )
+    main.os.replace(tmp_file, file_path)
+    main.publish_root_index(file_path, output_dir / "index.html")
+
+
+def measure(func, report_data: dict, total_titles: int, repeat: int = 5) -> tuple:
+    """返回 (最短耗时秒, 峰值内存字节)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_dir = Path(tmp_dir)
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(report_data, total_titles, output_dir)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        func(report_data, total_titles, output_dir)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        size = (output_dir / "当日汇总.html").stat().st_size
+    return min(timings), peak, size
+
+
+def main_benchmark() -> None:
+    group_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    titles_per_group = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+    report_data = build_report_data(group_count, titles_per_group)
+    total_titles = group_count * titles_per_group
+
+    print(f"报告规模: {group_count} 个词组 × {titles_per_group} 条新闻")
+    for label, func in [
+        ("整串渲染", write_concatenated),
+        ("流式渲染", write_streaming),
+    ]:
+        elapsed, peak, size = measure(func, report_data, total_titles)
+        print(
+            f"  {label}: {elapsed * 1000:8.1f} ms  "
+            f"峰值内存 {peak / 1024 / 1024:6.1f} MiB  文件 {size / 1024 / 1024:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+main.py 启动耗时基准
+在子进程中执行 `python -X importtime -c "import main"`，统计导入总耗时和最慢的模块，
+并检查导入后配置尚未加载、邮件/Markdown/GitHub 等按需模块没有被提前导入
+
+用法（在项目根目录执行）：
+    python benchmarks/import_time.py [重复次数]
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 导入 main 后不应出现在 sys.modules 中的模块
+DEFERRED_MODULES = [
+    "smtplib",
+    "email.mime.text",
+    "yaml",
+    "webbrowser",
+    "markdown_generator",
+    "github_service",
+]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+CHECK_SCRIPT = f"""
+import sys
+import main
+print("CONFIG_LOADED", main.CONFIG.loaded)
+for name in {DEFERRED_MODULES!r}:
+    print("MODULE", name, name in sys.modules)
+"""
+
+
+def measure_import() -> tuple:
+    """执行一次导入，返回 (总耗时微秒, [(累计耗时, 模块名)])"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+
+    modules = []
+    total = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative = int(match.group(2))
+        name = match.group(4)
+        modules.append((cumulative, name))
+        # 顶层导入（无缩进）的累计耗时之和即为总耗时
+        if len(match.group(3)) == 1:
+            total += cumulative
+    return total, modules
+
+
+def check_deferred() -> bool:
+    """检查导入 main 后的配置和模块加载状态"""
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        return False
+
+    ok = True
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if parts[0] == "CONFIG_LOADED" and parts[1] != "False":
+            print("❌ 导入 main 时加载了配置")
+            ok = False
+        elif parts[0] == "MODULE" and parts[2] != "False":
+            print(f"❌ 导入 main 时提前导入了 {parts[1]}")
+            ok = False
+    return ok
+
+
+def main() -> int:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    totals = []
+    slowest = []
+    for _ in range(repeat):
+        total, modules = measure_import()
+        totals.append(total)
+        slowest = sorted(modules, reverse=True)[:10]
+
+    totals.sort()
+    print(f"import main 耗时（{repeat} 次）:")
+    print(f"  最小: {totals[0] / 1000:.1f} ms")
+    print(f"  中位: {totals[len(totals) // 2] / 1000:.1f} ms")
+    print("累计耗时最长的模块:")
+    for cumulative, name in slowest:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    if check_deferred():
+        print("✅ 配置和按需模块均未在导入时加载")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+多份频率词配置匹配基准
+比较订阅配置数量增加时两种匹配方式的耗时：
+    - 独立匹配：每份配置各自编译匹配器，每个标题按配置数扫描多次
+    - 共用扫描：MultiProfileMatcher 把所有配置的规则合并到一个自动机，
+      每个标题扫描一次，再把命中结果交给各配置的词组规则判断
+同时校验两种方式对每个标题、每份配置得到的词组完全一致
+
+用法（在项目根目录执行）：
+    python benchmarks/profile_matching.py [每份配置的词组数] [最大配置数]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frequency_config import MultiProfileMatcher, WordGroupMatcher  # noqa: E402
+
+
+def load_titles() -> list:
+    """读取 docs/ 下已保存的标题快照（去重），没有快照时生成合成标题"""
+    titles = set()
+    for txt_file in Path("docs").glob("*/txt/*.txt"):
+        for line in txt_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if ". " in line and not line.startswith("=="):
+                title = line.split(". ", 1)[1].split(" [URL:", 1)[0]
+                titles.add(title.split(" [MOBILE:", 1)[0])
+    if titles:
+        return sorted(titles)
+
+    rng = random.Random(0)
+    chars = "人工智能芯片华为苹果美国中国股市经济新能源汽车足球比赛电影发布会天气"
+    return [
+        "".join(rng.choice(chars) for _ in range(rng.randint(8, 30)))
+        for _ in range(20000)
+    ]
+
+
+def build_profile(rng: random.Random, titles: list, group_count: int) -> tuple:
+    """从标题中截取词语构造一份频率词配置，包含必须词、排除词、过滤词和整词规则"""
+
+    def sample_word() -> str:
+        title = rng.choice(titles)
+        length = rng.randint(2, 4)
+        start = rng.randint(0, max(len(title) - length, 0))
+        return title[start : start + length]
+
+    word_groups = []
+    for _ in range(group_count):
+        normal = [sample_word() for _ in range(rng.randint(1, 4))]
+        required = [sample_word()] if rng.random() < 0.2 else []
+        excluded = [sample_word()] if rng.random() < 0.2 else []
+        if rng.random() < 0.1:
+            normal.append("\\=AI")
+        word_groups.append(
+            {
+                "required": required,
+                "normal": normal,
+                "excluded": excluded,
+                "group_key": " ".join(normal),
+            }
+        )
+    filter_words = [sample_word() for _ in range(rng.randint(0, 3))]
+    return word_groups, filter_words
+
+
+def match_independent(profiles: list, titles: list) -> list:
+    matchers = [WordGroupMatcher(groups, filters) for groups, filters in profiles]
+    return [tuple(matcher.find_group(title) for matcher in matchers) for title in titles]
+
+
+def match_shared(profiles: list, titles: list) -> list:
+    multi_matcher = MultiProfileMatcher(profiles)
+    return [multi_matcher.match_all(title) for title in titles]
+
+
+def measure(func, profiles: list, titles: list, repeat: int = 3) -> tuple:
+    """返回 (最短耗时秒, 结果)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(profiles, titles)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main_benchmark() -> int:
+    group_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    max_profiles = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    titles = load_titles()
+    rng = random.Random(42)
+    all_profiles = [build_profile(rng, titles, group_count) for _ in range(max_profiles)]
+
+    print(f"标题数: {len(titles)}，每份配置 {group_count} 个词组")
+    print(f"{'配置数':>6} {'独立匹配':>12} {'共用扫描':>12} {'加速':>7}")
+
+    profile_count = 1
+    ok = True
+    while profile_count <= max_profiles:
+        profiles = all_profiles[:profile_count]
+        independent_time, independent = measure(match_independent, profiles, titles)
+        shared_time, shared = measure(match_shared, profiles, titles)
+        if independent != shared:
+            print(f"❌ {profile_count} 份配置时两种方式的匹配结果不一致")
+            ok = False
+        print(
+            f"{profile_count:>6} {independent_time * 1000:>10.1f}ms "
+            f"{shared_time * 1000:>10.1f}ms {independent_time / shared_time:>6.1f}x"
+        )
+        profile_count *= 2
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
@@ -0,0 +1,147 @@
+# coding=utf-8
+"""
+进程内 cron 调度
+解析标准 5 段 cron 表达式（分 时 日 月 周），计算下一次执行时间，
+供 main.py 的常驻模式（--daemon）使用，语义与 crontab/supercronic 一致：
+    - 支持 *、数字、a-b、*/n、a-b/n 以及逗号分隔的组合
+    - 周取值 0-7，0 和 7 都表示周日
+    - 日和周同时限定时，满足其一即执行
+"""
+
+from datetime import datetime, timedelta
+from typing import Set
+
+
+# (最小值, 最大值)
+FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+FIELD_NAMES = ["分钟", "小时", "日", "月", "周"]
+
+# 向前查找的最大天数，超过后认为表达式永远不会触发（如 2 月 30 日）
+MAX_LOOKAHEAD_DAYS = 366 * 5
+
+
+def parse_cron_field(field: str, minimum: int, maximum: int) -> Set[int]:
+    """
+    解析 cron 表达式的单个字段
+
+    Args:
+        field: 字段文本，如 "*/15"、"8-22"、"1,15"
+        minimum: 字段允许的最小值
+        maximum: 字段允许的最大值
+
+    Returns:
+        字段匹配的取值集合
+
+    Raises:
+        ValueError: 字段格式错误或取值越界
+    """
+    values = set()
+    for part in field.split(","):
+        if not part:
+            raise ValueError(f"cron 字段为空: {field!r}")
+
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"cron 步长必须大于 0: {field!r}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            # "5/10" 表示从 5 开始每 10 个单位
+            end = maximum if step > 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"cron 取值超出范围 {minimum}-{maximum}: {field!r}")
+
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """cron 表达式"""
+
+    def __init__(self, expression: str):
+        """
+        解析 cron 表达式
+
+        Args:
+            expression: 5 段 cron 表达式，如 "*/30 * * * *"
+
+        Raises:
+            ValueError: 表达式格式错误
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 表达式需要 5 个字段: {expression!r}")
+
+        self.expression = expression
+        parsed = []
+        for field, (minimum, maximum), name in zip(fields, FIELD_RANGES, FIELD_NAMES):
+            try:
+                parsed.append(parse_cron_field(field, minimum, maximum))
+            except ValueError as e:
+                raise ValueError(f"cron 表达式的{name}字段无效: {e}")
+
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron 中 0 和 7 都是周日，转换为 Python 的 weekday()（周一为 0）
+        self.weekdays = {(day - 1) % 7 for day in weekdays}
+        self.day_restricted = fields[2] != "*"
+        self.weekday_restricted = fields[4] != "*"
+
+        self._sorted_hours = sorted(self.hours)
+        self._sorted_minutes = sorted(self.minutes)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """日期是否满足日/周字段"""
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        计算严格晚于 moment 的下一次执行时间（精确到分钟）
+
+        Args:
+            moment: 起始时间，可以带时区
+
+        Returns:
+            下一次执行时间，时区与 moment 相同
+
+        Raises:
+            ValueError: 表达式在可预见的时间内不会触发
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        deadline = candidate + timedelta(days=MAX_LOOKAHEAD_DAYS)
+
+        while candidate < deadline:
+            next_day = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = next_day
+                continue
+
+            hour = next((h for h in self._sorted_hours if h >= candidate.hour), None)
+            if hour is None:
+                candidate = next_day
+                continue
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+
+            minute = next(
+                (m for m in self._sorted_minutes if m >= candidate.minute), None
+            )
+            if minute is None:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            return candidate.replace(minute=minute)
+
+        raise ValueError(f"cron 表达式不会触发: {self.expression!r}")
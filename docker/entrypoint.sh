@@ -15,6 +15,11 @@ case "${RUN_MODE:-cron}" in
     echo "🔄 单次执行"
     exec /usr/local/bin/python main.py
     ;;
+"daemon")
+    # 常驻进程内调度，python 作为 PID 1 直接接收 SIGTERM
+    echo "♻️ 常驻模式: ${CRON_SCHEDULE:-*/30 * * * *}"
+    exec /usr/local/bin/python main.py --daemon
+    ;;
 "cron")
     # 生成 crontab
     echo "${CRON_SCHEDULE:-*/30 * * * *} cd /app && /usr/local/bin/python main.py" > /tmp/crontab
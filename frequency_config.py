@@ -0,0 +1,515 @@
+# coding=utf-8
+"""
+频率词配置
+解析 config/frequency_words.txt 并编译词组匹配器，解析结果和匹配器按文件缓存，
+文件修改时间或内容哈希变化时自动重新加载，main.py 与 MCP 服务共用
+
+规则语法（每组之间空行分隔）：
+    普通词      子串匹配，不区分大小写
+    +词         必须词，组内所有必须词都要出现
+    !词         过滤词，命中后标题不匹配任何词组
+    \\-词       组内排除词，只对所在词组生效
+    \\/正则/    正则匹配，不区分大小写
+    \\=词       整词匹配（前后不是英文字母或数字）
+
+新规则统一以反斜杠开头，原有配置中以 - = / 开头的行仍按普通词子串匹配
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_FREQUENCY_FILE = "config/frequency_words.txt"
+
+# 规则前缀：\/正则/、\=整词（拉丁字母）、\-组内排除词
+# 以反斜杠转义，不会与原有配置中以 - = / 开头的普通词冲突
+WORD_RULE_REGEX_PREFIX = "\\/"
+WORD_RULE_WHOLE_PREFIX = "\\="
+WORD_RULE_EXCLUDE_PREFIX = "\\-"
+LATIN_WORD_CHARS = "0-9A-Za-z"
+
+
+def is_regex_word_rule(word: str) -> bool:
+    """是否为正则规则（\\/pattern/）"""
+    return (
+        len(word) > len(WORD_RULE_REGEX_PREFIX) + 1
+        and word.startswith(WORD_RULE_REGEX_PREFIX)
+        and word.endswith("/")
+    )
+
+
+def is_whole_word_rule(word: str) -> bool:
+    """是否为整词规则（\\=word）"""
+    return len(word) > len(WORD_RULE_WHOLE_PREFIX) and word.startswith(
+        WORD_RULE_WHOLE_PREFIX
+    )
+
+
+def compile_word_rule(word: str) -> Optional["re.Pattern"]:
+    """编译正则/整词规则，普通词返回 None（按子串匹配）"""
+    if is_regex_word_rule(word):
+        return re.compile(word[len(WORD_RULE_REGEX_PREFIX) : -1], re.IGNORECASE)
+    if is_whole_word_rule(word):
+        whole_word = re.escape(word[len(WORD_RULE_WHOLE_PREFIX) :])
+        return re.compile(
+            rf"(?<![{LATIN_WORD_CHARS}]){whole_word}(?![{LATIN_WORD_CHARS}])",
+            re.IGNORECASE,
+        )
+    return None
+
+
+def word_rule_display(word: str) -> str:
+    """规则在报告中显示的文本：整词显示词本身，正则显示为 /pattern/"""
+    if is_regex_word_rule(word):
+        return word[len(WORD_RULE_REGEX_PREFIX) - 1 :]
+    if is_whole_word_rule(word):
+        return word[len(WORD_RULE_WHOLE_PREFIX) :]
+    return word
+
+
+def parse_frequency_words(content: str) -> Tuple[List[Dict], List[str]]:
+    """
+    解析频率词配置文本
+
+    Args:
+        content: frequency_words.txt 的内容
+
+    Returns:
+        (词组列表, 过滤词列表)，词组为 {"required", "normal", "excluded", "group_key"}
+    """
+    word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
+
+    processed_groups = []
+    filter_words = []
+
+    for group in word_groups:
+        words = [word.strip() for word in group.split("\n") if word.strip()]
+
+        group_required_words = []
+        group_normal_words = []
+        group_excluded_words = []
+
+        for word in words:
+            if word.startswith("!"):
+                target = filter_words
+                word = word[1:]
+            elif word.startswith("+"):
+                target = group_required_words
+                word = word[1:]
+            elif (
+                word.startswith(WORD_RULE_EXCLUDE_PREFIX)
+                and len(word) > len(WORD_RULE_EXCLUDE_PREFIX)
+            ):
+                target = group_excluded_words
+                word = word[len(WORD_RULE_EXCLUDE_PREFIX) :]
+            else:
+                target = group_normal_words
+
+            try:
+                compile_word_rule(word)
+            except re.error as e:
+                print(f"频率词规则无效，已忽略: {word} ({e})")
+                continue
+            target.append(word)
+
+        if group_required_words or group_normal_words:
+            if group_normal_words:
+                group_key = " ".join(map(word_rule_display, group_normal_words))
+            else:
+                group_key = " ".join(map(word_rule_display, group_required_words))
+
+            processed_groups.append(
+                {
+                    "required": group_required_words,
+                    "normal": group_normal_words,
+                    "excluded": group_excluded_words,
+                    "group_key": group_key,
+                }
+            )
+
+    return processed_groups, filter_words
+
+
+class WordRuleScanner:
+    """
+    词规则扫描器：把所有普通子串规则编译为一个 Aho–Corasick 自动机，
+    正则/整词规则合并为一个预筛选正则，每个标题只扫描一次，返回命中的规则ID
+
+    多个 WordGroupMatcher 可以共用一个扫描器，规则取各配置的并集，
+    多份频率词配置匹配同一标题时只扫描一次
+    """
+
+    def __init__(self):
+        # 规则表（普通词按小写去重，正则/整词按原文去重），空词视为总是命中
+        self.words: List[str] = []
+        self._word_ids: Dict[str, int] = {}
+        self._pattern_rules: List[Tuple[int, "re.Pattern"]] = []
+        self._compiled = False
+
+    def word_id(self, word: str) -> int:
+        """登记规则并返回规则ID，相同规则返回同一个ID"""
+        pattern = compile_word_rule(word)
+        key = word if pattern else word.lower()
+        wid = self._word_ids.get(key)
+        if wid is None:
+            wid = self._word_ids[key] = len(self.words)
+            self.words.append(word)
+            if pattern:
+                self._pattern_rules.append((wid, pattern))
+            self._compiled = False
+        return wid
+
+    def _compile(self) -> None:
+        self._empty_ids = frozenset(
+            wid for key, wid in self._word_ids.items() if key == ""
+        )
+        pattern_ids = {wid for wid, _ in self._pattern_rules}
+        self._build_automaton(
+            [
+                (key, wid)
+                for key, wid in self._word_ids.items()
+                if key and wid not in pattern_ids
+            ]
+        )
+
+        # 正则/整词规则：先用合并后的正则预筛选，命中后再逐条确认
+        self._pattern_prefilter = None
+        if self._pattern_rules:
+            try:
+                self._pattern_prefilter = re.compile(
+                    "|".join(
+                        f"(?:{pattern.pattern})" for _, pattern in self._pattern_rules
+                    ),
+                    re.IGNORECASE,
+                )
+            except re.error:
+                # 含反向引用等无法合并的正则时逐条匹配
+                self._pattern_prefilter = None
+        self._compiled = True
+
+    def _build_automaton(self, patterns: List[Tuple[str, int]]) -> None:
+        """构建 goto/fail/output 表，output 已合并失败链上的输出"""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+
+        for pattern, wid in patterns:
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(wid)
+
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                if fail[next_state] == next_state:
+                    fail[next_state] = 0
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def scan(self, title: str) -> set:
+        """单次扫描标题，返回命中的规则ID集合"""
+        if not self._compiled:
+            self._compile()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matched = set(self._empty_ids)
+
+        state = 0
+        for char in title.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                matched.update(output[state])
+
+        if self._pattern_rules and (
+            self._pattern_prefilter is None or self._pattern_prefilter.search(title)
+        ):
+            for wid, pattern in self._pattern_rules:
+                if pattern.search(title):
+                    matched.add(wid)
+        return matched
+
+
+class WordGroupMatcher:
+    """
+    频率词组匹配器：用 WordRuleScanner 扫描标题得到命中的规则，
+    再按词组顺序用集合运算判断必须词/普通词/组内排除词/过滤词规则
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        scanner: Optional[WordRuleScanner] = None,
+    ):
+        """
+        Args:
+            word_groups: 词组列表
+            filter_words: 过滤词列表
+            scanner: 共用的规则扫描器，未提供时使用独立的扫描器
+        """
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.scanner = scanner if scanner is not None else WordRuleScanner()
+        word_id = self.scanner.word_id
+
+        self._filter_ids = frozenset(word_id(word) for word in filter_words)
+
+        # (词组序号, 必须词ID, 普通词ID, 组内排除词ID)
+        self._groups: List[Tuple[int, frozenset, frozenset, frozenset]] = []
+        word_to_groups: Dict[int, List[int]] = {}
+        self._always_groups: List[int] = []
+        own_ids = set(self._filter_ids)
+        for index, group in enumerate(word_groups):
+            required = frozenset(word_id(word) for word in group["required"])
+            normal = frozenset(word_id(word) for word in group["normal"])
+            excluded = frozenset(word_id(word) for word in group.get("excluded", []))
+            self._groups.append((index, required, normal, excluded))
+            own_ids.update(required, normal, excluded)
+            if not required and not normal:
+                self._always_groups.append(index)
+            for wid in required | normal:
+                word_to_groups.setdefault(wid, []).append(index)
+        self._word_to_groups = word_to_groups
+        # 本配置用到的规则ID，共用扫描器时用于排除其他配置的命中
+        self._own_ids = frozenset(own_ids)
+
+    def select_group(self, matched: set) -> Optional[Dict]:
+        """
+        根据扫描得到的规则ID集合选出第一个匹配的词组
+        命中过滤词或没有词组匹配时返回 None
+        """
+        if matched & self._filter_ids:
+            return None
+
+        candidates = set(self._always_groups)
+        for wid in matched:
+            candidates.update(self._word_to_groups.get(wid, ()))
+
+        for index in sorted(candidates):
+            _, required, normal, excluded = self._groups[index]
+            if required and not required <= matched:
+                continue
+            if normal and not normal & matched:
+                continue
+            if excluded & matched:
+                continue
+            return self.word_groups[index]
+
+        return None
+
+    def match(self, title: str) -> Tuple[set, Optional[Dict]]:
+        """
+        匹配标题，返回 (命中的词集合, 第一个匹配的词组)
+        命中过滤词或没有词组匹配时词组为 None
+        """
+        matched = self.scanner.scan(title)
+        words = self.scanner.words
+        matched_words = {words[wid] for wid in matched & self._own_ids}
+        return matched_words, self.select_group(matched)
+
+    def find_group(self, title: str) -> Optional[Dict]:
+        """返回标题第一个匹配的词组"""
+        return self.select_group(self.scanner.scan(title))
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则，没有配置词组时匹配所有标题"""
+        if not self.word_groups:
+            return True
+        return self.find_group(title) is not None
+
+
+class FrequencyWordsConfig:
+    """一份已解析的频率词配置，匹配器在首次使用时编译"""
+
+    def __init__(
+        self,
+        path: Path,
+        content_hash: str,
+        word_groups: List[Dict],
+        filter_words: List[str],
+    ):
+        self.path = path
+        self.content_hash = content_hash
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.mtime_ns = 0
+        self.size = 0
+        self._matcher: Optional[WordGroupMatcher] = None
+
+    @property
+    def matcher(self) -> WordGroupMatcher:
+        """编译后的词组匹配器"""
+        if self._matcher is None:
+            self._matcher = WordGroupMatcher(self.word_groups, self.filter_words)
+        return self._matcher
+
+
+_configs: Dict[str, FrequencyWordsConfig] = {}
+_config_lock = threading.Lock()
+
+
+def get_frequency_config(frequency_file: Optional[str] = None) -> FrequencyWordsConfig:
+    """
+    获取频率词配置（进程内缓存）
+
+    文件修改时间和大小未变化时直接返回缓存；变化时重新读取并比较内容哈希，
+    内容相同则沿用原配置和已编译的匹配器，否则重新解析
+
+    Args:
+        frequency_file: 频率词文件路径，默认读取环境变量 FREQUENCY_WORDS_PATH，
+            再回退到 config/frequency_words.txt
+
+    Returns:
+        频率词配置
+
+    Raises:
+        FileNotFoundError: 文件不存在
+    """
+    if frequency_file is None:
+        frequency_file = os.environ.get("FREQUENCY_WORDS_PATH", DEFAULT_FREQUENCY_FILE)
+
+    frequency_path = Path(frequency_file)
+    if not frequency_path.exists():
+        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
+
+    stat = frequency_path.stat()
+    cache_key = str(frequency_path.resolve())
+
+    with _config_lock:
+        config = _configs.get(cache_key)
+        if config and config.mtime_ns == stat.st_mtime_ns and config.size == stat.st_size:
+            return config
+
+        with open(frequency_path, "rb") as f:
+            data = f.read()
+        content_hash = hashlib.sha1(data).hexdigest()
+
+        if config is None or config.content_hash != content_hash:
+            word_groups, filter_words = parse_frequency_words(data.decode("utf-8"))
+            config = FrequencyWordsConfig(
+                frequency_path, content_hash, word_groups, filter_words
+            )
+            _configs[cache_key] = config
+
+        config.mtime_ns = stat.st_mtime_ns
+        config.size = stat.st_size
+        return config
+
+
+def load_frequency_words(
+    frequency_file: Optional[str] = None,
+) -> Tuple[List[Dict], List[str]]:
+    """加载频率词配置，返回 (词组列表, 过滤词列表)，文件未变化时返回同一份解析结果"""
+    config = get_frequency_config(frequency_file)
+    return config.word_groups, config.filter_words
+
+
+_word_group_matcher_cache: Optional[Tuple[List[Dict], List[str], WordGroupMatcher]] = None
+
+
+def get_word_group_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> WordGroupMatcher:
+    """获取词组匹配器，同一份词组配置只编译一次"""
+    global _word_group_matcher_cache
+    for config in list(_configs.values()):
+        if config.word_groups is word_groups and config.filter_words is filter_words:
+            return config.matcher
+
+    cached = _word_group_matcher_cache
+    if cached and cached[0] is word_groups and cached[1] is filter_words:
+        return cached[2]
+
+    matcher = WordGroupMatcher(word_groups, filter_words)
+    _word_group_matcher_cache = (word_groups, filter_words, matcher)
+    return matcher
+
+
+class MultiProfileMatcher:
+    """
+    多份频率词配置的批量匹配器（主配置 + 各订阅配置）
+    所有配置的规则合并到一个 WordRuleScanner，每个标题只扫描一次，
+    命中结果再分别交给各配置的词组规则判断；结果按标题缓存，
+    同一次运行中其他配置、实时报告和汇总报告再次匹配同一标题时直接查表
+    """
+
+    def __init__(self, configs: List[Tuple[List[Dict], List[str]]]):
+        """
+        Args:
+            configs: [(词组列表, 过滤词列表)]，顺序即配置序号
+        """
+        self.configs = configs
+        self.scanner = WordRuleScanner()
+        self._matchers = [
+            WordGroupMatcher(word_groups, filter_words, self.scanner)
+            for word_groups, filter_words in configs
+        ]
+        self._results: Dict[str, Tuple[Optional[Dict], ...]] = {}
+        self._views: Dict[int, "ProfileMatcherView"] = {}
+
+    def match_all(self, title: str) -> Tuple[Optional[Dict], ...]:
+        """返回标题在每份配置中第一个匹配的词组"""
+        result = self._results.get(title)
+        if result is None:
+            matched = self.scanner.scan(title)
+            result = tuple(matcher.select_group(matched) for matcher in self._matchers)
+            self._results[title] = result
+        return result
+
+    def view(self, index: int) -> "ProfileMatcherView":
+        """第 index 份配置的匹配器视图（同一序号返回同一个对象）"""
+        view = self._views.get(index)
+        if view is None:
+            view = self._views[index] = ProfileMatcherView(self, index)
+        return view
+
+
+class ProfileMatcherView:
+    """MultiProfileMatcher 中单份配置的视图"""
+
+    def __init__(self, multi_matcher: MultiProfileMatcher, index: int):
+        self._multi_matcher = multi_matcher
+        self._index = index
+
+    def find_group(self, title: str) -> Optional[Dict]:
+        return self._multi_matcher.match_all(title)[self._index]
+
+    def matches(self, title: str) -> bool:
+        """与 matches_word_groups 相同：没有配置词组时匹配所有标题"""
+        if not self._multi_matcher.configs[self._index][0]:
+            return True
+        return self.find_group(title) is not None
+
+
+def matches_word_groups(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> bool:
+    """检查标题是否匹配词组规则"""
+    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+    if not word_groups:
+        return True
+
+    return get_word_group_matcher(word_groups, filter_words).matches(title)
@@ -0,0 +1,288 @@
+# coding=utf-8
+"""
+SQLite 历史数据库
+保存所有抓取快照，平台、标题、快照和（标题, 快照, 排名）观测记录分表存储并建立索引，
+跨月份的趋势、生命周期和搜索查询直接走索引，无需逐日扫描目录
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from title_records import TitleRecord, intern_text
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS platforms (
+    id INTEGER PRIMARY KEY,
+    platform_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    platform_ref INTEGER NOT NULL REFERENCES platforms(id),
+    title TEXT NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT NOT NULL DEFAULT '',
+    UNIQUE (platform_ref, title)
+);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    time_name TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    UNIQUE (date, time_name)
+);
+
+CREATE TABLE IF NOT EXISTS observations (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    title_id INTEGER NOT NULL REFERENCES titles(id),
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, title_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_observations_title ON observations(title_id, snapshot_id);
+"""
+
+
+class HistoryDatabase:
+    """历史数据库（日期格式统一为 YYYY-MM-DD）"""
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        """
+        打开历史数据库
+
+        Args:
+            db_path: 数据库文件路径
+            read_only: 只读模式（MCP 查询使用），文件不存在时抛出 sqlite3.OperationalError
+        """
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        self._lock = threading.Lock()
+
+        if read_only:
+            self.conn = sqlite3.connect(
+                f"file:{self.db_path.as_posix()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    # --- 写入 ---
+
+    def record_snapshot(
+        self,
+        date: str,
+        time_name: str,
+        results: Dict,
+        id_to_name: Dict,
+        crawled_at: Optional[float] = None,
+    ) -> None:
+        """
+        写入一次抓取快照，同一日期和时间名已存在时覆盖
+
+        Args:
+            date: 日期，如 "2025-11-18"
+            time_name: 快照时间名，如 "10时05分"
+            results: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+            crawled_at: 抓取时间戳，默认当前时间
+        """
+        with self._lock, self.conn:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "DELETE FROM snapshots WHERE date = ? AND time_name = ?",
+                (date, time_name),
+            )
+            cursor.execute(
+                "INSERT INTO snapshots (date, time_name, crawled_at) VALUES (?, ?, ?)",
+                (date, time_name, crawled_at or time.time()),
+            )
+            snapshot_id = cursor.lastrowid
+
+            for platform_id, title_data in results.items():
+                cursor.execute(
+                    "INSERT INTO platforms (platform_id, name) VALUES (?, ?) "
+                    "ON CONFLICT(platform_id) DO UPDATE SET name = excluded.name",
+                    (platform_id, id_to_name.get(platform_id) or platform_id),
+                )
+                platform_ref = cursor.execute(
+                    "SELECT id FROM platforms WHERE platform_id = ?", (platform_id,)
+                ).fetchone()[0]
+
+                observations = []
+                for title, info in title_data.items():
+                    ranks = info.get("ranks", [])
+                    cursor.execute(
+                        "INSERT INTO titles (platform_ref, title, url, mobile_url) "
+                        "VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(platform_ref, title) DO UPDATE SET "
+                        "url = CASE WHEN titles.url = '' THEN excluded.url ELSE titles.url END, "
+                        "mobile_url = CASE WHEN titles.mobile_url = '' "
+                        "THEN excluded.mobile_url ELSE titles.mobile_url END",
+                        (
+                            platform_ref,
+                            title,
+                            info.get("url", ""),
+                            info.get("mobileUrl", ""),
+                        ),
+                    )
+                    title_id = cursor.execute(
+                        "SELECT id FROM titles WHERE platform_ref = ? AND title = ?",
+                        (platform_ref, title),
+                    ).fetchone()[0]
+                    observations.append((snapshot_id, title_id, ranks[0] if ranks else 1))
+
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO observations (snapshot_id, title_id, rank) "
+                    "VALUES (?, ?, ?)",
+                    observations,
+                )
+
+    # --- 查询 ---
+
+    def has_date(self, date: str) -> bool:
+        """是否有该日期的快照"""
+        return bool(
+            self._query("SELECT 1 FROM snapshots WHERE date = ? LIMIT 1", (date,))
+        )
+
+    def get_dates(self, start_date: str, end_date: str) -> List[str]:
+        """日期范围内有快照的日期列表"""
+        rows = self._query(
+            "SELECT DISTINCT date FROM snapshots WHERE date BETWEEN ? AND ? ORDER BY date",
+            (start_date, end_date),
+        )
+        return [row[0] for row in rows]
+
+    def get_titles_for_date(
+        self, date: str, platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        读取某天所有快照的合并数据
+
+        Returns:
+            (all_titles, id_to_name, timestamps)，与 ParserService.read_all_titles_for_date 一致
+            - all_titles 的值为 TitleRecord
+            - timestamps 的键沿用 txt 文件名格式 "HH时MM分.txt"
+        """
+        sql = (
+            "SELECT p.platform_id, p.name, t.title, t.url, t.mobile_url, o.rank "
+            "FROM snapshots s "
+            "JOIN observations o ON o.snapshot_id = s.id "
+            "JOIN titles t ON t.id = o.title_id "
+            "JOIN platforms p ON p.id = t.platform_ref "
+            "WHERE s.date = ?"
+        )
+        params: List = [date]
+        if platform_ids:
+            sql += f" AND p.platform_id IN ({','.join('?' * len(platform_ids))})"
+            params.extend(platform_ids)
+        sql += " ORDER BY s.time_name, p.id, o.rank"
+
+        all_titles: Dict = {}
+        id_to_name: Dict = {}
+        for platform_id, name, title, url, mobile_url, rank in self._query(sql, tuple(params)):
+            id_to_name[platform_id] = name
+            platform_titles = all_titles.setdefault(platform_id, {})
+            record = platform_titles.get(title)
+            if record is None:
+                platform_titles[intern_text(title)] = TitleRecord(
+                    [rank], url, mobile_url
+                )
+            else:
+                record.add_ranks([rank], unique=False)
+                record.count += 1
+
+        timestamps = {
+            f"{time_name}.txt": crawled_at
+            for time_name, crawled_at in self._query(
+                "SELECT time_name, crawled_at FROM snapshots WHERE date = ? ORDER BY time_name",
+                (date,),
+            )
+        }
+        return all_titles, id_to_name, timestamps
+
+    def search_titles(
+        self,
+        keyword: str,
+        start_date: str,
+        end_date: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        按关键词搜索日期范围内的标题（不区分大小写的子串匹配）
+
+        Returns:
+            按日期分组的匹配列表，每项包含 date/platform/platform_name/title/ranks/url/mobileUrl
+        """
+        escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        sql = (
+            "SELECT s.date, p.platform_id, p.name, t.id, t.title, t.url, t.mobile_url, o.rank "
+            "FROM titles t "
+            "JOIN platforms p ON p.id = t.platform_ref "
+            "JOIN observations o ON o.title_id = t.id "
+            "JOIN snapshots s ON s.id = o.snapshot_id "
+            "WHERE t.title LIKE ? ESCAPE '\\' AND s.date BETWEEN ? AND ?"
+        )
+        params: List = [f"%{escaped}%", start_date, end_date]
+        if platform_ids:
+            sql += f" AND p.platform_id IN ({','.join('?' * len(platform_ids))})"
+            params.extend(platform_ids)
+        sql += " ORDER BY s.date, s.time_name, p.id, o.rank"
+
+        matches: Dict = {}
+        for date, platform_id, name, title_id, title, url, mobile_url, rank in self._query(
+            sql, tuple(params)
+        ):
+            item = matches.get((date, title_id))
+            if item is None:
+                matches[(date, title_id)] = {
+                    "date": date,
+                    "platform": platform_id,
+                    "platform_name": name,
+                    "title": title,
+                    "ranks": [rank],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+            else:
+                item["ranks"].append(rank)
+        return list(matches.values())
+
+    def get_topic_daily_counts(
+        self, topic: str, start_date: str, end_date: str, sample_size: int = 3
+    ) -> Dict[str, Dict]:
+        """
+        统计话题在日期范围内每天出现的标题数
+
+        Returns:
+            {date: {"count": 当天匹配的标题数, "sample_titles": [...]}}，只包含有快照的日期
+        """
+        daily = {
+            date: {"count": 0, "sample_titles": []}
+            for date in self.get_dates(start_date, end_date)
+        }
+        for match in self.search_titles(topic, start_date, end_date):
+            day = daily[match["date"]]
+            day["count"] += 1
+            if len(day["sample_titles"]) < sample_size:
+                day["sample_titles"].append(match["title"])
+        return daily
@@ -0,0 +1,132 @@
+# coding=utf-8
+"""
+HTTP会话管理
+为爬虫、版本检查、通知推送和MCP临时爬取提供共享的连接池会话，
+同一进程内的请求复用 TCP/TLS 连接
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class HTTPSessionManager:
+    """HTTP会话管理器（连接池 + 按主机连接池大小 + 统一代理与超时）"""
+
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        初始化会话管理器
+
+        Args:
+            proxy_url: 默认代理地址，单次请求可通过 proxy_url 参数覆盖
+            timeout: 默认超时时间（秒），单次请求可通过 timeout 参数覆盖
+            pool_connections: 缓存的主机连接池数量
+            pool_maxsize: 每个主机连接池的最大连接数
+            host_pool_sizes: 按主机单独设置的连接池大小，如 {"newsnow.busiyi.world": 16}
+        """
+        self.proxy_url = proxy_url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        default_adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("http://", default_adapter)
+        self.session.mount("https://", default_adapter)
+
+        # 更长的前缀优先匹配，因此按主机挂载的适配器会覆盖默认适配器
+        for host, size in (host_pool_sizes or {}).items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=int(size))
+            self.session.mount(f"http://{host}", host_adapter)
+            self.session.mount(f"https://{host}", host_adapter)
+
+        if proxy_url:
+            self.session.proxies.update({"http": proxy_url, "https": proxy_url})
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        proxy_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """发送请求，未指定时使用默认代理与超时"""
+        if proxy_url:
+            kwargs["proxies"] = {"http": proxy_url, "https": proxy_url}
+        return self.session.request(
+            method, url, timeout=timeout or self.timeout, **kwargs
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """发送GET请求"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """发送POST请求"""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """关闭会话，释放连接池"""
+        self.session.close()
+
+
+# 全局会话实例
+_global_session = None
+_session_lock = threading.Lock()
+
+
+def configure_http_session(**kwargs) -> HTTPSessionManager:
+    """
+    按配置（重新）创建全局会话
+
+    Args:
+        **kwargs: 传递给 HTTPSessionManager 的参数
+
+    Returns:
+        新的全局会话实例
+    """
+    global _global_session
+    with _session_lock:
+        if _global_session is not None:
+            _global_session.close()
+        _global_session = HTTPSessionManager(**kwargs)
+        return _global_session
+
+
+def get_http_session() -> HTTPSessionManager:
+    """
+    获取全局会话实例，未配置时使用默认参数创建
+
+    Returns:
+        全局会话实例
+    """
+    global _global_session
+    if _global_session is None:
+        with _session_lock:
+            if _global_session is None:
+                _global_session = HTTPSessionManager()
+    return _global_session
+
+
+def close_http_session() -> None:
+    """关闭全局会话"""
+    global _global_session
+    with _session_lock:
+        if _global_session is not None:
+            _global_session.close()
+            _global_session = None
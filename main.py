@@ -1,32 +1,60 @@
 # coding=utf-8
 
+import argparse
+import hashlib
 import json
 import os
 import random
 import re
+import shutil
+import signal
+import threading
 import time
-import webbrowser
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.header import Header
-from email.utils import formataddr, formatdate, make_msgid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Union
 
 import pytz
-import requests
-import yaml
 
-# 导入Markdown和GitHub推送模块
-try:
-    from markdown_generator import generate_markdown_report, save_markdown_report
-    from github_service import GitHubPushService
-    MARKDOWN_AVAILABLE = True
-except ImportError as e:
-    MARKDOWN_AVAILABLE = False
-    print(f"⚠️ Markdown/GitHub功能不可用: {e}")
+from frequency_config import (
+    MultiProfileMatcher,
+    get_word_group_matcher,
+    load_frequency_words,
+    matches_word_groups,
+)
+from cron_scheduler import CronSchedule
+from http_client import close_http_session, configure_http_session, get_http_session
+from notification_outbox import NotificationOutbox, make_target_key
+from rate_limiter import HostRateLimiter, get_rate_limiter
+from news_weight import calculate_news_weights, news_sort_keys
+from snapshot_store import SnapshotStore
+from subscriber_profiles import SubscriberProfile, parse_subscriber_profiles
+from title_records import TitleRecord, intern_text
+from history_db import HistoryDatabase
+
+# 邮件（smtplib/email）、Markdown 报告、GitHub 推送和 YAML 解析等模块只在用到时导入，
+# 只抓取并写文件的运行不会加载它们
+
+
+def load_markdown_generator():
+    """按需导入Markdown报告模块，不可用时返回 None"""
+    try:
+        import markdown_generator
+    except ImportError as e:
+        print(f"⚠️ Markdown功能不可用: {e}")
+        return None
+    return markdown_generator
+
+
+def load_github_service_class():
+    """按需导入GitHub推送服务类，不可用时返回 None"""
+    try:
+        from github_service import GitHubPushService
+    except ImportError as e:
+        print(f"⚠️ GitHub推送功能不可用: {e}")
+        return None
+    return GitHubPushService
 
 
 VERSION = "3.0.5"
@@ -63,6 +91,8 @@ SMTP_CONFIGS = {
 # === 配置管理 ===
 def load_config():
     """加载配置文件"""
+    import yaml
+
     config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
 
     if not Path(config_path).exists():
@@ -79,6 +109,10 @@ def load_config():
     config_html_dir = os.environ.get("OUTPUT_HTML_DIR", "").strip() or output_config.get("html_dir", "")
     config_txt_dir = os.environ.get("OUTPUT_TXT_DIR", "").strip() or output_config.get("txt_dir", "")
     config_push_records_dir = os.environ.get("OUTPUT_PUSH_RECORDS_DIR", "").strip() or output_config.get("push_records_dir", "output/.push_records")
+    config_fetch_state_dir = os.environ.get("OUTPUT_FETCH_STATE_DIR", "").strip() or output_config.get("fetch_state_dir", "output/.fetch_state")
+    config_outbox_db = os.environ.get("OUTPUT_OUTBOX_DB", "").strip() or output_config.get("outbox_db", "output/outbox.db")
+    config_snapshot_format = os.environ.get("OUTPUT_SNAPSHOT_FORMAT", "").strip() or output_config.get("snapshot_format", "txt")
+    config_history_db = os.environ.get("OUTPUT_HISTORY_DB", "").strip() or output_config.get("history_db", "")
 
     # 构建配置
     config = {
@@ -88,10 +122,51 @@ def load_config():
         "OUTPUT_HTML_DIR": config_html_dir,
         "OUTPUT_TXT_DIR": config_txt_dir,
         "OUTPUT_PUSH_RECORDS_DIR": config_push_records_dir,
+        "OUTPUT_FETCH_STATE_DIR": config_fetch_state_dir,
+        "OUTPUT_OUTBOX_DB": config_outbox_db,
+        "SNAPSHOT_FORMAT": config_snapshot_format,
+        "EXPORT_TXT": output_config.get("export_txt", True),
+        "HISTORY_DB_PATH": config_history_db,
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        "CRAWLER_MAX_WORKERS": int(
+            os.environ.get("CRAWLER_MAX_WORKERS", "").strip() or "0"
+        )
+        or config_data["crawler"].get("max_workers", 1),
+        "HOST_RATE_LIMIT": config_data["crawler"].get("host_rate_limit", 5),
+        "HOST_RATE_BURST": config_data["crawler"].get("host_rate_burst", 5),
+        "CONDITIONAL_FETCH": config_data["crawler"].get("conditional_fetch", False),
+        "RETRY": {
+            "MAX_RETRIES": config_data["crawler"].get("retry", {}).get("max_retries", 2),
+            "BASE_DELAY": config_data["crawler"].get("retry", {}).get("base_delay", 2),
+            "MAX_DELAY": config_data["crawler"].get("retry", {}).get("max_delay", 10),
+        },
+        "CIRCUIT_BREAKER": {
+            "ENABLED": config_data["crawler"]
+            .get("circuit_breaker", {})
+            .get("enabled", True),
+            "FAILURE_THRESHOLD": config_data["crawler"]
+            .get("circuit_breaker", {})
+            .get("failure_threshold", 3),
+            "COOLDOWN": config_data["crawler"]
+            .get("circuit_breaker", {})
+            .get("cooldown", 1800),
+        },
+        "DAEMON_SCHEDULE": os.environ.get("CRON_SCHEDULE", "").strip()
+        or config_data.get("daemon", {}).get("schedule", "*/30 * * * *"),
+        "DAEMON_IMMEDIATE_RUN": os.environ.get("IMMEDIATE_RUN", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("IMMEDIATE_RUN", "").strip()
+        else config_data.get("daemon", {}).get("immediate_run", True),
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
+        "HTTP": {
+            "TIMEOUT": config_data.get("http", {}).get("timeout", 10),
+            "POOL_CONNECTIONS": config_data.get("http", {}).get("pool_connections", 10),
+            "POOL_MAXSIZE": config_data.get("http", {}).get("pool_maxsize", 10),
+            "HOST_POOL_SIZES": config_data.get("http", {}).get("host_pool_sizes")
+            or {},
+        },
         "USE_PROXY": config_data["crawler"]["use_proxy"],
         "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
         "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
@@ -107,7 +182,23 @@ def load_config():
             "dingtalk_batch_size", 20000
         ),
         "FEISHU_BATCH_SIZE": config_data["notification"].get("feishu_batch_size", 29000),
-        "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+        "PARALLEL_SEND": config_data["notification"].get("parallel_send", True),
+        "RATE_LIMITS": config_data["notification"].get("rate_limits") or {},
+        "NOTIFICATION_OUTBOX": {
+            "ENABLED": config_data["notification"].get("outbox", {}).get("enabled", True),
+            "MAX_ATTEMPTS": config_data["notification"]
+            .get("outbox", {})
+            .get("max_attempts", 5),
+            "RETRIES_PER_RUN": config_data["notification"]
+            .get("outbox", {})
+            .get("retries_per_run", 3),
+            "BACKOFF_SECONDS": config_data["notification"]
+            .get("outbox", {})
+            .get("backoff_seconds", 2),
+            "EXPIRE_HOURS": config_data["notification"]
+            .get("outbox", {})
+            .get("expire_hours", 12),
+        },
         "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
             "feishu_message_separator"
         ],
@@ -149,6 +240,7 @@ def load_config():
             "HOTNESS_WEIGHT": config_data["weight"]["hotness_weight"],
         },
         "PLATFORMS": config_data["platforms"],
+        "PROFILES": config_data.get("profiles") or [],
     }
 
     # 通知渠道配置（环境变量优先）
@@ -187,6 +279,9 @@ def load_config():
     config["EMAIL_SMTP_PORT"] = os.environ.get(
         "EMAIL_SMTP_PORT", ""
     ).strip() or webhooks.get("email_smtp_port", "")
+    config["EMAIL_SMTP_ENCRYPTION"] = os.environ.get(
+        "EMAIL_SMTP_ENCRYPTION", ""
+    ).strip() or webhooks.get("email_smtp_encryption", "")
 
     # ntfy配置
     config["NTFY_SERVER_URL"] = os.environ.get(
@@ -270,10 +365,46 @@ def load_config():
     return config
 
 
-print("正在加载配置...")
-CONFIG = load_config()
-print(f"TrendRadar v{VERSION} 配置加载完成")
-print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
+class LazyConfig:
+    """
+    延迟加载的全局配置：导入 main 不会读取 config.yaml，
+    第一次访问配置项时才加载，之后按普通字典使用
+    """
+
+    def __init__(self):
+        self._data: Optional[Dict] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    print("正在加载配置...")
+                    data = load_config()
+                    print(f"TrendRadar v{VERSION} 配置加载完成")
+                    print(f"监控平台数量: {len(data['PLATFORMS'])}")
+                    self._data = data
+        return self._data
+
+    @property
+    def loaded(self) -> bool:
+        """配置是否已加载"""
+        return self._data is not None
+
+    def __getitem__(self, key: str):
+        return self._load()[key]
+
+    def __setitem__(self, key: str, value) -> None:
+        self._load()[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def get(self, key: str, default=None):
+        return self._load().get(key, default)
+
+
+CONFIG = LazyConfig()
 
 
 # === 工具函数 ===
@@ -330,18 +461,14 @@ def check_version_update(
 ) -> Tuple[bool, Optional[str]]:
     """检查版本更新"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
-
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/plain, */*",
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
+        response = get_http_session().get(
+            version_url, proxy_url=proxy_url, headers=headers, timeout=10
         )
         response.raise_for_status()
 
@@ -369,8 +496,20 @@ def check_version_update(
         return False, None
 
 
+def get_snapshot_store(date_folder: Optional[str] = None) -> SnapshotStore:
+    """获取指定日期（默认当天）的二进制快照存储"""
+    date_folder = date_folder or format_date_folder()
+    base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
+    return SnapshotStore(str(Path(base_dir) / date_folder / "snapshots"))
+
+
 def is_first_crawl_today() -> bool:
     """检测是否是当天第一次爬取"""
+    if CONFIG.get("SNAPSHOT_FORMAT") == "binary":
+        store = get_snapshot_store()
+        if store.exists():
+            return len(store.list_snapshots()) <= 1
+
     date_folder = format_date_folder()
     base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
     
@@ -405,9 +544,12 @@ def html_escape(text: str) -> str:
 class PushRecordManager:
     """推送记录管理器"""
 
-    def __init__(self):
+    def __init__(self, profile: Optional[str] = None):
         push_records_dir = CONFIG.get("OUTPUT_PUSH_RECORDS_DIR", "output/.push_records")
         self.record_dir = Path(push_records_dir)
+        if profile:
+            # 订阅配置的推送记录单独保存，互不影响“每天只推一次”的判断
+            self.record_dir = self.record_dir / "profiles" / profile
         self.ensure_record_dir()
         self.cleanup_old_records()
 
@@ -505,32 +647,307 @@ class PushRecordManager:
         return result
 
 
+# === 抓取状态管理 ===
+UNCHANGED_RESPONSE = "__UNCHANGED__"
+UNCHANGED_SECTION_HEADER = "==== 以下ID内容未变化 ===="
+
+
+def compute_titles_hash(title_data: Dict) -> str:
+    """计算平台榜单内容（标题、排名、链接）的哈希"""
+    content = json.dumps(title_data, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class FetchStateStore:
+    """平台抓取状态存储（ETag/Last-Modified/内容哈希），跨运行持久化"""
+
+    def __init__(self, state_dir: Optional[str] = None):
+        if state_dir is None:
+            state_dir = CONFIG.get("OUTPUT_FETCH_STATE_DIR", "output/.fetch_state")
+        self.state_file = Path(state_dir) / "fetch_state.json"
+        self._states: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """加载抓取状态，文件损坏时从空状态开始"""
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                self._states = json.load(f)
+        except Exception as e:
+            print(f"读取抓取状态失败，将重新抓取全部平台: {e}")
+            self._states = {}
+
+    def save(self) -> None:
+        """保存抓取状态"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with self._lock:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._states, f, ensure_ascii=False)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            print(f"保存抓取状态失败: {e}")
+
+    def conditional_headers(self, platform_id: str) -> Dict[str, str]:
+        """构建条件请求头，没有缓存榜单时不发送"""
+        state = self._states.get(platform_id)
+        if not state or state.get("titles") is None:
+            return {}
+
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+        return headers
+
+    def is_body_unchanged(self, platform_id: str, body_hash: str) -> bool:
+        """响应体哈希与上次一致（且有缓存榜单）时视为未变化"""
+        state = self._states.get(platform_id)
+        return bool(
+            state
+            and state.get("titles") is not None
+            and state.get("body_hash") == body_hash
+        )
+
+    def record_response(
+        self,
+        platform_id: str,
+        body_hash: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """暂存响应校验信息，榜单解析成功后再一并提交"""
+        with self._lock:
+            self._pending[platform_id] = {
+                "body_hash": body_hash,
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+            }
+
+    def get_titles(self, platform_id: str) -> Optional[Dict]:
+        """获取缓存的榜单数据"""
+        state = self._states.get(platform_id)
+        if not state or state.get("titles") is None:
+            return None
+        return {
+            title: {
+                "ranks": list(info.get("ranks", [])),
+                "url": info.get("url", ""),
+                "mobileUrl": info.get("mobileUrl", ""),
+            }
+            for title, info in state["titles"].items()
+        }
+
+    def is_titles_unchanged(self, platform_id: str, titles_hash: str) -> bool:
+        """解析后的榜单内容与上次一致"""
+        state = self._states.get(platform_id)
+        return bool(state and state.get("titles_hash") == titles_hash)
+
+    def is_written_on(self, platform_id: str, date_folder: str) -> bool:
+        """该平台当天是否已有完整写入的快照"""
+        state = self._states.get(platform_id)
+        return bool(state and state.get("written_date") == date_folder)
+
+    def update(self, platform_id: str, titles: Dict, titles_hash: str) -> None:
+        """提交平台的最新榜单和校验信息"""
+        with self._lock:
+            state = self._states.setdefault(platform_id, {})
+            state.update(self._pending.pop(platform_id, {}))
+            state["titles"] = titles
+            state["titles_hash"] = titles_hash
+
+    def mark_written(self, platform_id: str, date_folder: str) -> None:
+        """记录平台当天已完整写入快照"""
+        with self._lock:
+            self._states.setdefault(platform_id, {})["written_date"] = date_folder
+
+
+# === 平台健康状态 ===
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class PlatformHealthTracker:
+    """平台健康状态跟踪（连续失败计数 + 熔断器），跨运行持久化"""
+
+    def __init__(
+        self,
+        state_dir: Optional[str] = None,
+        failure_threshold: int = 3,
+        cooldown: float = 1800,
+    ):
+        if state_dir is None:
+            state_dir = CONFIG.get("OUTPUT_FETCH_STATE_DIR", "output/.fetch_state")
+        self.state_file = Path(state_dir) / "platform_health.json"
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self._states: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """加载健康状态，文件损坏时从空状态开始"""
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                self._states = json.load(f)
+        except Exception as e:
+            print(f"读取平台健康状态失败，将重置: {e}")
+            self._states = {}
+
+    def save(self) -> None:
+        """保存健康状态"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with self._lock:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._states, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            print(f"保存平台健康状态失败: {e}")
+
+    def _get_state(self, platform_id: str) -> Dict:
+        return self._states.setdefault(
+            platform_id,
+            {
+                "state": CIRCUIT_CLOSED,
+                "consecutive_failures": 0,
+                "total_successes": 0,
+                "total_failures": 0,
+                "opened_at": None,
+                "last_success": None,
+                "last_failure": None,
+                "last_error": "",
+            },
+        )
+
+    def allow_request(self, platform_id: str) -> bool:
+        """熔断打开且未过冷却期时拒绝请求，过了冷却期转为半开状态放行一次探测"""
+        with self._lock:
+            state = self._get_state(platform_id)
+            if state["state"] != CIRCUIT_OPEN:
+                return True
+            if time.time() - (state.get("opened_at") or 0) >= self.cooldown:
+                state["state"] = CIRCUIT_HALF_OPEN
+                return True
+            return False
+
+    def is_half_open(self, platform_id: str) -> bool:
+        """是否处于半开探测状态"""
+        state = self._states.get(platform_id)
+        return bool(state and state.get("state") == CIRCUIT_HALF_OPEN)
+
+    def cooldown_remaining(self, platform_id: str) -> float:
+        """熔断剩余冷却时间（秒）"""
+        state = self._states.get(platform_id)
+        if not state or state.get("state") != CIRCUIT_OPEN:
+            return 0
+        return max(0, self.cooldown - (time.time() - (state.get("opened_at") or 0)))
+
+    def record_success(self, platform_id: str) -> None:
+        """记录成功，关闭熔断器"""
+        with self._lock:
+            state = self._get_state(platform_id)
+            if state["state"] != CIRCUIT_CLOSED:
+                print(f"平台 {platform_id} 已恢复，关闭熔断")
+            state["state"] = CIRCUIT_CLOSED
+            state["consecutive_failures"] = 0
+            state["total_successes"] += 1
+            state["opened_at"] = None
+            state["last_success"] = time.time()
+
+    def record_failure(self, platform_id: str, error: str = "") -> None:
+        """记录失败，连续失败达到阈值或半开探测失败时打开熔断器"""
+        with self._lock:
+            state = self._get_state(platform_id)
+            state["consecutive_failures"] += 1
+            state["total_failures"] += 1
+            state["last_failure"] = time.time()
+            state["last_error"] = error[:200]
+
+            if (
+                state["state"] == CIRCUIT_HALF_OPEN
+                or state["consecutive_failures"] >= self.failure_threshold
+            ):
+                if state["state"] != CIRCUIT_OPEN:
+                    print(
+                        f"平台 {platform_id} 连续失败 {state['consecutive_failures']} 次，"
+                        f"熔断 {self.cooldown:.0f} 秒"
+                    )
+                state["state"] = CIRCUIT_OPEN
+                state["opened_at"] = time.time()
+
+
 # === 数据获取 ===
 class DataFetcher:
     """数据获取器"""
 
-    def __init__(self, proxy_url: Optional[str] = None):
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        max_workers: int = 1,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        fetch_state: Optional[FetchStateStore] = None,
+        health: Optional[PlatformHealthTracker] = None,
+        max_retries: int = 2,
+        retry_base_delay: float = 2,
+        retry_max_delay: float = 10,
+    ):
         self.proxy_url = proxy_url
+        self.max_workers = max(1, int(max_workers or 1))
+        self.rate_limiter = rate_limiter
+        self.fetch_state = fetch_state
+        self.health = health
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.unchanged_ids: List[str] = []
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        """指数退避 + 全抖动，服务端返回 Retry-After 时优先遵循"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.retry_max_delay)
+
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * (2**attempt))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
 
     def fetch_data(
         self,
         id_info: Union[str, Tuple[str, str]],
-        max_retries: int = 2,
-        min_retry_wait: int = 3,
-        max_retry_wait: int = 5,
+        max_retries: Optional[int] = None,
     ) -> Tuple[Optional[str], str, str]:
-        """获取指定ID数据，支持重试"""
+        """获取指定ID数据，支持退避重试与熔断"""
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
             id_value = id_info
             alias = id_value
 
-        url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
+        if max_retries is None:
+            max_retries = self.max_retries
+
+        if self.health:
+            if not self.health.allow_request(id_value):
+                remaining = self.health.cooldown_remaining(id_value)
+                print(f"跳过 {id_value}：熔断中，剩余冷却 {remaining:.0f} 秒")
+                return None, id_value, alias
+            if self.health.is_half_open(id_value):
+                # 半开状态只发一次探测请求，失败立即重新熔断
+                print(f"平台 {id_value} 冷却结束，发送探测请求")
+                max_retries = 0
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -542,12 +959,44 @@ class DataFetcher:
 
         retries = 0
         while retries <= max_retries:
+            response = None
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(url)
+
+                request_headers = headers
+                if self.fetch_state:
+                    request_headers = {
+                        **headers,
+                        **self.fetch_state.conditional_headers(id_value),
+                    }
+
+                response = get_http_session().get(
+                    url, proxy_url=self.proxy_url, headers=request_headers
                 )
+
+                if response.status_code == 304 and self.fetch_state:
+                    print(f"获取 {id_value} 成功（未变化）")
+                    if self.health:
+                        self.health.record_success(id_value)
+                    return UNCHANGED_RESPONSE, id_value, alias
+
                 response.raise_for_status()
 
+                if self.fetch_state:
+                    body_hash = hashlib.sha1(response.content).hexdigest()
+                    if self.fetch_state.is_body_unchanged(id_value, body_hash):
+                        print(f"获取 {id_value} 成功（内容未变化）")
+                        if self.health:
+                            self.health.record_success(id_value)
+                        return UNCHANGED_RESPONSE, id_value, alias
+                    self.fetch_state.record_response(
+                        id_value,
+                        body_hash,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+
                 data_text = response.text
                 data_json = json.loads(data_text)
 
@@ -557,42 +1006,86 @@ class DataFetcher:
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
+                if self.health:
+                    self.health.record_success(id_value)
                 return data_text, id_value, alias
 
             except Exception as e:
                 retries += 1
                 if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = self._retry_delay(retries - 1, response)
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
                     time.sleep(wait_time)
                 else:
                     print(f"请求 {id_value} 失败: {e}")
+                    if self.health:
+                        self.health.record_failure(id_value, str(e))
                     return None, id_value, alias
         return None, id_value, alias
 
+    def _fetch_sequentially(
+        self, ids_list: List[Union[str, Tuple[str, str]]], request_interval: int
+    ) -> List[Tuple[Optional[str], str, str]]:
+        """顺序获取，每次请求之间按间隔休眠"""
+        responses = []
+        for i, id_info in enumerate(ids_list):
+            responses.append(self.fetch_data(id_info))
+
+            if i < len(ids_list) - 1:
+                actual_interval = request_interval + random.randint(-10, 20)
+                actual_interval = max(50, actual_interval)
+                time.sleep(actual_interval / 1000)
+        return responses
+
+    def _fetch_concurrently(
+        self, ids_list: List[Union[str, Tuple[str, str]]], max_workers: int
+    ) -> List[Tuple[Optional[str], str, str]]:
+        """并发获取，由按主机的令牌桶控制请求速率，结果保持输入顺序"""
+        workers = min(max_workers, len(ids_list))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="crawler"
+        ) as executor:
+            return list(executor.map(self.fetch_data, ids_list))
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
-        request_interval: int = CONFIG["REQUEST_INTERVAL"],
+        request_interval: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> Tuple[Dict, Dict, List]:
-        """爬取多个网站数据"""
+        """爬取多个网站数据，max_workers > 1 时启用并发模式"""
+        if request_interval is None:
+            request_interval = CONFIG["REQUEST_INTERVAL"]
+        if max_workers is None:
+            max_workers = self.max_workers
+
+        if max_workers > 1 and len(ids_list) > 1:
+            print(f"并发爬取模式：{min(max_workers, len(ids_list))} 个工作线程")
+            responses = self._fetch_concurrently(ids_list, max_workers)
+        else:
+            responses = self._fetch_sequentially(ids_list, request_interval)
+
         results = {}
         id_to_name = {}
         failed_ids = []
+        unchanged_ids = []
 
-        for i, id_info in enumerate(ids_list):
+        for id_info, (response, id_value, _) in zip(ids_list, responses):
             if isinstance(id_info, tuple):
-                id_value, name = id_info
+                name = id_info[1]
             else:
-                id_value = id_info
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
 
-            if response:
+            if response == UNCHANGED_RESPONSE:
+                cached_titles = self.fetch_state.get_titles(id_value)
+                if cached_titles is not None:
+                    results[id_value] = cached_titles
+                    unchanged_ids.append(id_value)
+                else:
+                    failed_ids.append(id_value)
+            elif response:
                 try:
                     data = json.loads(response)
                     results[id_value] = {}
@@ -609,6 +1102,14 @@ class DataFetcher:
                                 "url": url,
                                 "mobileUrl": mobile_url,
                             }
+
+                    if self.fetch_state:
+                        titles_hash = compute_titles_hash(results[id_value])
+                        if self.fetch_state.is_titles_unchanged(id_value, titles_hash):
+                            unchanged_ids.append(id_value)
+                        self.fetch_state.update(
+                            id_value, results[id_value], titles_hash
+                        )
                 except json.JSONDecodeError:
                     print(f"解析 {id_value} 响应失败")
                     failed_ids.append(id_value)
@@ -618,22 +1119,49 @@ class DataFetcher:
             else:
                 failed_ids.append(id_value)
 
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+        # 只有当天已完整写入过的平台才能在快照中省略（读取时沿用上一次的榜单）
+        if self.fetch_state:
+            date_folder = format_date_folder()
+            unchanged_ids = [
+                id_value
+                for id_value in unchanged_ids
+                if self.fetch_state.is_written_on(id_value, date_folder)
+            ]
+            for id_value in results:
+                if id_value not in unchanged_ids:
+                    self.fetch_state.mark_written(id_value, date_folder)
+            self.fetch_state.save()
+
+        if self.health:
+            self.health.save()
 
-        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        self.unchanged_ids = unchanged_ids
+
+        if unchanged_ids:
+            print(
+                f"成功: {list(results.keys())}, 未变化: {unchanged_ids}, 失败: {failed_ids}"
+            )
+        else:
+            print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
 
 
 # === 数据处理 ===
-def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """保存标题到文件"""
+def save_titles_to_file(
+    results: Dict,
+    id_to_name: Dict,
+    failed_ids: List,
+    unchanged_ids: Optional[List] = None,
+) -> str:
+    """保存标题到文件，内容未变化的平台只记录ID"""
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
+    unchanged_ids = unchanged_ids or []
 
     with open(file_path, "w", encoding="utf-8") as f:
         for id_value, title_data in results.items():
+            if id_value in unchanged_ids:
+                continue
+
             # id | name 或 id
             name = id_to_name.get(id_value)
             if name and name != id_value:
@@ -670,6 +1198,16 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
 
             f.write("\n")
 
+        if unchanged_ids:
+            f.write(f"{UNCHANGED_SECTION_HEADER}\n")
+            for id_value in unchanged_ids:
+                name = id_to_name.get(id_value)
+                if name and name != id_value:
+                    f.write(f"{id_value} | {name}\n")
+                else:
+                    f.write(f"{id_value}\n")
+            f.write("\n")
+
         if failed_ids:
             f.write("==== 以下ID请求失败 ====\n")
             for id_value in failed_ids:
@@ -678,64 +1216,75 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
     return file_path
 
 
-def load_frequency_words(
-    frequency_file: Optional[str] = None,
-) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
-    if frequency_file is None:
-        frequency_file = os.environ.get(
-            "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
-        )
-
-    frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
-        raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
+def save_snapshot(
+    results: Dict,
+    id_to_name: Dict,
+    failed_ids: List,
+    unchanged_ids: Optional[List] = None,
+) -> str:
+    """按配置的存储格式保存本次抓取快照（并写入历史数据库），返回快照时间名"""
+    time_info = format_time_filename()
 
-    with open(frequency_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    if CONFIG.get("SNAPSHOT_FORMAT") == "binary":
+        cleaned_results = {
+            id_value: {clean_title(title): info for title, info in title_data.items()}
+            for id_value, title_data in results.items()
+        }
+        store = get_snapshot_store()
+        store.append(time_info, cleaned_results, id_to_name, failed_ids, unchanged_ids)
+        print(f"快照已保存到: {store.day_dir} ({time_info})")
 
-    word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
+    if CONFIG.get("SNAPSHOT_FORMAT") != "binary" or CONFIG.get("EXPORT_TXT", True):
+        title_file = save_titles_to_file(results, id_to_name, failed_ids, unchanged_ids)
+        print(f"标题已保存到: {title_file}")
 
-    processed_groups = []
-    filter_words = []
+    record_history_snapshot(time_info, results, id_to_name)
+    return time_info
 
-    for group in word_groups:
-        words = [word.strip() for word in group.split("\n") if word.strip()]
-
-        group_required_words = []
-        group_normal_words = []
-        group_filter_words = []
-
-        for word in words:
-            if word.startswith("!"):
-                filter_words.append(word[1:])
-                group_filter_words.append(word[1:])
-            elif word.startswith("+"):
-                group_required_words.append(word[1:])
-            else:
-                group_normal_words.append(word)
 
-        if group_required_words or group_normal_words:
-            if group_normal_words:
-                group_key = " ".join(group_normal_words)
-            else:
-                group_key = " ".join(group_required_words)
+def record_history_snapshot(time_info: str, results: Dict, id_to_name: Dict) -> None:
+    """写入SQLite历史数据库，当天首次写入时先补录当天已有的快照"""
+    db_path = CONFIG.get("HISTORY_DB_PATH")
+    if not db_path:
+        return
 
-            processed_groups.append(
-                {
-                    "required": group_required_words,
-                    "normal": group_normal_words,
-                    "group_key": group_key,
-                }
-            )
+    try:
+        db = HistoryDatabase(db_path)
+    except Exception as e:
+        print(f"打开历史数据库失败: {e}")
+        return
 
-    return processed_groups, filter_words
+    try:
+        date = get_beijing_time().strftime("%Y-%m-%d")
+
+        if not db.has_date(date):
+            last_titles_by_id = {}
+            for snapshot_time, titles_by_id, snapshot_names, unchanged_ids in iter_today_snapshots():
+                last_titles_by_id.update(titles_by_id)
+                for source_id in unchanged_ids:
+                    if source_id in last_titles_by_id:
+                        titles_by_id[source_id] = last_titles_by_id[source_id]
+                if snapshot_time != time_info:
+                    db.record_snapshot(date, snapshot_time, titles_by_id, snapshot_names)
+
+        # 本次结果中未变化的平台已带有缓存榜单，直接完整写入
+        cleaned_results = {
+            id_value: {clean_title(title): info for title, info in title_data.items()}
+            for id_value, title_data in results.items()
+        }
+        db.record_snapshot(date, time_info, cleaned_results, id_to_name)
+        print(f"历史数据库已更新: {db_path}")
+    except Exception as e:
+        print(f"写入历史数据库失败: {e}")
+    finally:
+        db.close()
 
 
-def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
+def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict, List]:
+    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name, unchanged_ids)"""
     titles_by_id = {}
     id_to_name = {}
+    unchanged_ids = []
 
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read()
@@ -745,6 +1294,21 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
             if not section.strip() or "==== 以下ID请求失败 ====" in section:
                 continue
 
+            if UNCHANGED_SECTION_HEADER in section:
+                for line in section.strip().split("\n")[1:]:
+                    header_line = line.strip()
+                    if not header_line:
+                        continue
+                    if " | " in header_line:
+                        source_id, name = header_line.split(" | ", 1)
+                        source_id = source_id.strip()
+                        id_to_name[source_id] = name.strip()
+                    else:
+                        source_id = header_line
+                        id_to_name.setdefault(source_id, source_id)
+                    unchanged_ids.append(source_id)
+                continue
+
             lines = section.strip().split("\n")
             if len(lines) < 2:
                 continue
@@ -799,272 +1363,313 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
                     except Exception as e:
                         print(f"解析标题行出错: {line}, 错误: {e}")
 
-    return titles_by_id, id_to_name
+    return titles_by_id, id_to_name, unchanged_ids
 
 
-def read_all_today_titles(
-    current_platform_ids: Optional[List[str]] = None,
-) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
-    
+def get_today_txt_dir() -> Path:
+    """获取当天txt快照目录"""
     # 如果配置了专门的txt目录，使用它；否则使用默认的日期子目录
     if CONFIG.get("OUTPUT_TXT_DIR"):
-        txt_dir = Path(CONFIG["OUTPUT_TXT_DIR"])
-    else:
-        txt_dir = Path(base_dir) / date_folder / "txt"
+        return Path(CONFIG["OUTPUT_TXT_DIR"])
+    base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
+    return Path(base_dir) / format_date_folder() / "txt"
 
-    if not txt_dir.exists():
-        return {}, {}, {}
 
-    all_results = {}
-    final_id_to_name = {}
-    title_info = {}
+def use_binary_snapshots() -> bool:
+    """当天快照是否从二进制存储读取"""
+    return CONFIG.get("SNAPSHOT_FORMAT") == "binary" and get_snapshot_store().exists()
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
 
-    for file_path in files:
-        time_info = file_path.stem
+def list_today_snapshots() -> List[Tuple[str, str]]:
+    """按时间顺序列出当天快照 (time_info, 签名)，签名在快照被改写时变化"""
+    if use_binary_snapshots():
+        return get_snapshot_store().list_signatures()
 
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
+    txt_dir = get_today_txt_dir()
+    if not txt_dir.exists():
+        return []
 
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
+    snapshots = []
+    for file_path in sorted(f for f in txt_dir.iterdir() if f.suffix == ".txt"):
+        stat = file_path.stat()
+        snapshots.append((file_path.stem, f"{stat.st_size}:{stat.st_mtime_ns}"))
+    return snapshots
 
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
 
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+def iter_today_snapshots(
+    time_infos: Optional[List[str]] = None,
+) -> Iterator[Tuple[str, Dict, Dict, List]]:
+    """
+    按时间顺序读取当天快照，返回 (time_info, titles_by_id, id_to_name, unchanged_ids)
+    存在二进制快照时直接按列读取，否则解析txt文件；time_infos 为空时读取全部
+    """
+    if use_binary_snapshots():
+        for snapshot in get_snapshot_store().iter_snapshots(time_infos):
+            time_info, titles_by_id, id_to_name, unchanged_ids, _ = snapshot
+            yield time_info, titles_by_id, id_to_name, unchanged_ids
+        return
 
-        final_id_to_name.update(file_id_to_name)
+    txt_dir = get_today_txt_dir()
+    if not txt_dir.exists():
+        return
 
-        for source_id, title_data in titles_by_id.items():
-            process_source_data(
-                source_id, title_data, time_info, all_results, title_info
-            )
+    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    for file_path in files:
+        if time_infos is None or file_path.stem in time_infos:
+            yield (file_path.stem, *parse_file_titles(file_path))
 
-    return all_results, final_id_to_name, title_info
 
+# === 当日增量聚合 ===
+class DayAggregate:
+    """
+    当日增量聚合状态：all_results、title_info、各平台最近一次完整榜单
+    all_results 的标题集合即为历史标题集合，用于判断新增标题
+    """
 
-def process_source_data(
-    source_id: str,
-    title_data: Dict,
-    time_info: str,
-    all_results: Dict,
-    title_info: Dict,
-) -> None:
-    """处理来源数据，合并重复标题"""
-    if source_id not in all_results:
-        all_results[source_id] = title_data
-
-        if source_id not in title_info:
-            title_info[source_id] = {}
-
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
-
-            title_info[source_id][title] = {
-                "first_time": time_info,
-                "last_time": time_info,
-                "count": 1,
-                "ranks": ranks,
-                "url": url,
-                "mobileUrl": mobile_url,
-            }
-    else:
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
+    VERSION = 2
 
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-            else:
-                existing_data = all_results[source_id][title]
-                existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
-
-                merged_ranks = existing_ranks.copy()
-                for rank in ranks:
-                    if rank not in merged_ranks:
-                        merged_ranks.append(rank)
-
-                all_results[source_id][title] = {
-                    "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
-                }
+    def __init__(self, state_file: Path):
+        self.state_file = state_file
+        self.reset()
 
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
+    def reset(self) -> None:
+        """清空聚合状态"""
+        self.snapshots: List[List[str]] = []
+        self.all_results: Dict = {}
+        self.id_to_name: Dict = {}
+        self.title_info: Dict = {}
+        self.last_titles: Dict = {}
 
+    def load(self) -> bool:
+        """加载聚合状态，文件不存在、损坏或版本不符时返回 False"""
+        if not self.state_file.exists():
+            return False
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != self.VERSION:
+                return False
+            self.snapshots = state["snapshots"]
+            self.id_to_name = state["id_to_name"]
+            self.last_titles = state["last_titles"]
+            self.all_results = {}
+            self.title_info = {}
+            for source_id, rows in state["records"].items():
+                records = {
+                    intern_text(title): TitleRecord.from_row(row)
+                    for title, row in rows.items()
+                }
+                self.all_results[source_id] = records
+                self.title_info[source_id] = dict(records)
+            return True
+        except Exception as e:
+            print(f"当日聚合状态损坏，将重建: {e}")
+            self.reset()
+            return False
 
-def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
-    """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
-    
-    # 如果配置了专门的txt目录，使用它；否则使用默认的日期子目录
-    if CONFIG.get("OUTPUT_TXT_DIR"):
-        txt_dir = Path(CONFIG["OUTPUT_TXT_DIR"])
-    else:
-        txt_dir = Path(base_dir) / date_folder / "txt"
+    def save(self) -> None:
+        """保存聚合状态"""
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "snapshots": self.snapshots,
+                        "records": {
+                            source_id: {
+                                title: record.to_row()
+                                for title, record in records.items()
+                            }
+                            for source_id, records in self.all_results.items()
+                        },
+                        "id_to_name": self.id_to_name,
+                        "last_titles": self.last_titles,
+                    },
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            print(f"保存当日聚合状态失败: {e}")
 
-    if not txt_dir.exists():
-        return {}
+    def fold(
+        self,
+        time_info: str,
+        signature: str,
+        titles_by_id: Dict,
+        id_to_name: Dict,
+        unchanged_ids: List,
+    ) -> Dict:
+        """合并一个快照，只处理该快照自身的数据，返回其中的新增标题"""
+        for source_id, title_data in titles_by_id.items():
+            self.last_titles[source_id] = dict(title_data)
+        for source_id in unchanged_ids:
+            if source_id in self.last_titles:
+                titles_by_id[source_id] = dict(self.last_titles[source_id])
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if len(files) < 2:
-        return {}
+        new_titles = {}
+        for source_id, title_data in titles_by_id.items():
+            known_titles = self.all_results.get(source_id, {})
+            source_new_titles = {
+                title: data
+                for title, data in title_data.items()
+                if title not in known_titles
+            }
+            if source_new_titles:
+                new_titles[source_id] = source_new_titles
 
-    # 解析最新文件
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
-
-    # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
-
-    # 汇总历史标题（按平台过滤）
-    historical_titles = {}
-    for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
-        for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
-
-    # 找出新增标题
-    new_titles = {}
-    for source_id, latest_source_titles in latest_titles.items():
-        historical_set = historical_titles.get(source_id, set())
-        source_new_titles = {}
+            process_source_data(
+                source_id, title_data, time_info, self.all_results, self.title_info
+            )
 
-        for title, title_data in latest_source_titles.items():
-            if title not in historical_set:
-                source_new_titles[title] = title_data
+        self.id_to_name.update(id_to_name)
+        self.snapshots.append([time_info, signature])
+        return new_titles
 
-        if source_new_titles:
-            new_titles[source_id] = source_new_titles
 
-    return new_titles
+# 进程内保留的当天聚合（已合并到最新快照），常驻模式下后续运行只需合并新快照
+_warm_aggregate: Optional[Tuple[DayAggregate, Dict]] = None
 
 
-# === 统计和分析 ===
-def calculate_news_weight(
-    title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
-) -> float:
-    """计算新闻权重，用于排序"""
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+def load_today_aggregate() -> Tuple[DayAggregate, Dict]:
+    """
+    加载当天聚合结果，返回 (聚合状态, 最新批次新增标题)
+    持久化的状态只包含最新快照之前的快照，每次只增量合并尚未合并的快照，
+    状态缺失、损坏或与快照列表不一致时从头重建；
+    同一进程内再次加载时优先复用内存中的聚合，跨天或快照被重写时回退到磁盘状态
+    """
+    global _warm_aggregate
+    state_file = (
+        Path(CONFIG.get("OUTPUT_BASE_DIR", "output"))
+        / format_date_folder()
+        / "day_aggregate.json"
+    )
 
-    count = title_data.get("count", len(ranks))
-    weight_config = CONFIG["WEIGHT_CONFIG"]
+    snapshots = [list(snapshot) for snapshot in list_today_snapshots()]
+    if not snapshots:
+        return DayAggregate(state_file), {}
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+    base_snapshots = snapshots[:-1]
+    warm = _warm_aggregate
+    if (
+        warm
+        and warm[0].state_file == state_file
+        and warm[0].snapshots == snapshots[: len(warm[0].snapshots)]
+    ):
+        aggregate = warm[0]
+        if len(aggregate.snapshots) == len(snapshots):
+            return warm
+    else:
+        _warm_aggregate = None
+        aggregate = DayAggregate(state_file)
+        if aggregate.load():
+            folded = aggregate.snapshots
+            if folded != base_snapshots[: len(folded)]:
+                print("当日聚合状态与快照不一致，将重建")
+                aggregate.reset()
+
+    signatures = dict(base_snapshots)
+    pending = [time_info for time_info, _ in base_snapshots[len(aggregate.snapshots) :]]
+    if pending:
+        for time_info, titles_by_id, id_to_name, unchanged_ids in iter_today_snapshots(
+            pending
+        ):
+            aggregate.fold(
+                time_info, signatures[time_info], titles_by_id, id_to_name, unchanged_ids
+            )
+        aggregate.save()
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    # 最新快照只在内存中合并，同一分钟内重写最新快照时无需重建
+    latest_time_info, latest_signature = snapshots[-1]
+    new_titles = {}
+    for time_info, titles_by_id, id_to_name, unchanged_ids in iter_today_snapshots(
+        [latest_time_info]
+    ):
+        new_titles = aggregate.fold(
+            time_info, latest_signature, titles_by_id, id_to_name, unchanged_ids
+        )
 
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+    if len(snapshots) < 2:
+        new_titles = {}
 
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    _warm_aggregate = (aggregate, new_titles)
+    return aggregate, new_titles
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
-    )
 
-    return total_weight
+def filter_by_platforms(data: Dict, platform_ids: Optional[List[str]]) -> Dict:
+    """按平台ID过滤以平台为键的字典"""
+    if platform_ids is None:
+        return data
+    return {
+        source_id: value for source_id, value in data.items() if source_id in platform_ids
+    }
 
 
-def matches_word_groups(
-    title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+def load_today_data(
+    current_platform_ids: Optional[List[str]] = None,
+) -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    一次读取当天数据，返回 (all_results, id_to_name, title_info, new_titles)
+    每个快照只读取一次，支持按当前监控平台过滤
+    """
+    aggregate, new_titles = load_today_aggregate()
 
-    title_lower = title.lower()
+    return (
+        filter_by_platforms(aggregate.all_results, current_platform_ids),
+        filter_by_platforms(aggregate.id_to_name, current_platform_ids),
+        filter_by_platforms(aggregate.title_info, current_platform_ids),
+        filter_by_platforms(new_titles, current_platform_ids),
+    )
 
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+def read_all_today_titles(
+    current_platform_ids: Optional[List[str]] = None,
+) -> Tuple[Dict, Dict, Dict]:
+    """读取当天所有快照（增量聚合），支持按当前监控平台过滤"""
+    all_results, id_to_name, title_info, _ = load_today_data(current_platform_ids)
+    return all_results, id_to_name, title_info
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
 
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
+def process_source_data(
+    source_id: str,
+    title_data: Dict,
+    time_info: str,
+    all_results: Dict,
+    title_info: Dict,
+) -> None:
+    """处理来源数据，合并重复标题（all_results 与 title_info 共用同一条 TitleRecord）"""
+    source_results = all_results.setdefault(source_id, {})
+    source_info = title_info.setdefault(source_id, {})
+
+    for title, data in title_data.items():
+        record = source_results.get(title)
+        if record is None:
+            record = TitleRecord.from_data(data, time_info)
+            title = intern_text(title)
+            source_results[title] = record
+            source_info[title] = record
+        else:
+            record.merge(data, time_info)
+
+
+def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
+    """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
+    return load_today_data(current_platform_ids)[3]
 
-        return True
 
-    return False
+# === 统计和分析 ===
+def calculate_news_weight(
+    title_data: Dict, rank_threshold: Optional[int] = None
+) -> float:
+    """计算新闻权重，用于排序（批量计算见 news_weight.calculate_news_weights）"""
+    if rank_threshold is None:
+        rank_threshold = CONFIG["RANK_THRESHOLD"]
+    return calculate_news_weights(
+        [title_data], rank_threshold, CONFIG["WEIGHT_CONFIG"]
+    )[0]
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1123,18 +1728,29 @@ def count_word_frequency(
     filter_words: List[str],
     id_to_name: Dict,
     title_info: Optional[Dict] = None,
-    rank_threshold: int = CONFIG["RANK_THRESHOLD"],
+    rank_threshold: Optional[int] = None,
     new_titles: Optional[Dict] = None,
     mode: str = "daily",
+    matcher=None,
 ) -> Tuple[List[Dict], int]:
-    """统计词频，支持必须词、频率词、过滤词，并标记新增标题"""
+    """
+    统计词频，支持必须词、频率词、过滤词，并标记新增标题
+
+    matcher 为提供 find_group(title) 的匹配器（如 MultiProfileMatcher 的视图），
+    未提供时使用 word_groups/filter_words 编译的匹配器
+    """
+    if rank_threshold is None:
+        rank_threshold = CONFIG["RANK_THRESHOLD"]
 
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
         print("频率词配置为空，将显示所有新闻")
         word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
         filter_words = []  # 清空过滤词，显示所有新闻
+        matcher = None
 
+    if matcher is None:
+        matcher = get_word_group_matcher(word_groups, filter_words)
     is_first_today = is_first_crawl_today()
 
     # 确定处理的数据源和新增标记逻辑
@@ -1216,12 +1832,9 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 使用统一的匹配逻辑：一次扫描同时得到是否匹配和匹配的词组
+            group = matcher.find_group(title)
+            if group is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1234,115 +1847,83 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            group_key = group["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1394,21 +1975,27 @@ def count_word_frequency(
                 f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
             )
 
-    stats = []
+    # 所有词组的匹配新闻一次性批量计算排序键
+    group_titles = {}
     for group_key, data in word_stats.items():
         all_titles = []
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
+        group_titles[group_key] = all_titles
+
+    flat_titles = [item for titles in group_titles.values() for item in titles]
+    sort_keys = news_sort_keys(flat_titles, rank_threshold, CONFIG["WEIGHT_CONFIG"])
+
+    stats = []
+    offset = 0
+    for group_key, data in word_stats.items():
+        all_titles = group_titles[group_key]
+        group_keys = sort_keys[offset : offset + len(all_titles)]
+        offset += len(all_titles)
 
         # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        order = sorted(range(len(all_titles)), key=group_keys.__getitem__)
+        sorted_titles = [all_titles[i] for i in order]
 
         stats.append(
             {
@@ -1428,14 +2015,59 @@ def count_word_frequency(
 
 
 # === 报告生成 ===
+# === 报告中间表示 ===
+# prepare_report_data 的单条目缓存：同一份统计结果生成 HTML 报告和推送各通知渠道时只构建一次，
+# 缓存持有输入对象的引用，按对象身份比较即可
+_report_data_cache: Dict = {"key": None, "inputs": None, "report_data": None}
+
+
 def prepare_report_data(
     stats: List[Dict],
     failed_ids: Optional[List] = None,
     new_titles: Optional[Dict] = None,
     id_to_name: Optional[Dict] = None,
     mode: str = "daily",
+    matcher=None,
+) -> Dict:
+    """
+    准备报告数据（报告中间表示）
+
+    每条标题预先算好清理后的标题和链接，并带有 formatted 缓存，
+    各渲染器和通知渠道通过 get_formatted_title / get_title_fragment 读取格式化结果，
+    同一条标题的同一种格式在一次运行中只格式化一次
+
+    matcher 提供 matches(title)，用于筛选新增新闻（订阅配置使用各自的频率词），
+    未提供时使用主频率词配置
+    """
+    cache_key = (
+        id(stats),
+        id(new_titles),
+        id(id_to_name),
+        tuple(failed_ids or []),
+        mode,
+        id(matcher),
+    )
+    if _report_data_cache["key"] == cache_key:
+        return _report_data_cache["report_data"]
+
+    report_data = _build_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, matcher
+    )
+    _report_data_cache["key"] = cache_key
+    _report_data_cache["inputs"] = (stats, new_titles, id_to_name, matcher)
+    _report_data_cache["report_data"] = report_data
+    return report_data
+
+
+def _build_report_data(
+    stats: List[Dict],
+    failed_ids: Optional[List] = None,
+    new_titles: Optional[Dict] = None,
+    id_to_name: Optional[Dict] = None,
+    mode: str = "daily",
+    matcher=None,
 ) -> Dict:
-    """准备报告数据"""
+    """构建报告数据"""
     processed_new_titles = []
 
     # 在增量模式下隐藏新增新闻区域
@@ -1445,11 +2077,17 @@ def prepare_report_data(
     if not hide_new_section:
         filtered_new_titles = {}
         if new_titles and id_to_name:
-            word_groups, filter_words = load_frequency_words()
+            if matcher is None:
+                word_groups, filter_words = load_frequency_words()
+                title_matches = lambda title: matches_word_groups(
+                    title, word_groups, filter_words
+                )
+            else:
+                title_matches = matcher.matches
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    if title_matches(title):
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -1475,7 +2113,7 @@ def prepare_report_data(
                         "mobile_url": mobile_url,
                         "is_new": True,
                     }
-                    source_titles.append(processed_title)
+                    source_titles.append(_with_title_fragments(processed_title))
 
                 if source_titles:
                     processed_new_titles.append(
@@ -1504,7 +2142,7 @@ def prepare_report_data(
                 "mobile_url": title_data.get("mobileUrl", ""),
                 "is_new": title_data.get("is_new", False),
             }
-            processed_titles.append(processed_title)
+            processed_titles.append(_with_title_fragments(processed_title))
 
         processed_stats.append(
             {
@@ -1525,17 +2163,52 @@ def prepare_report_data(
     }
 
 
+def _with_title_fragments(title_data: Dict) -> Dict:
+    """补充各格式共用的清理后标题和链接，并挂上格式化结果缓存"""
+    title_data["cleaned_title"] = clean_title(title_data["title"])
+    title_data["link_url"] = title_data["mobile_url"] or title_data["url"]
+    title_data["formatted"] = {}
+    return title_data
+
+
+def get_title_fragment(title_data: Dict, key, builder: Callable[[Dict], str]) -> str:
+    """读取标题上缓存的格式化片段，首次请求时调用 builder 生成；没有缓存的标题直接生成"""
+    cache = title_data.get("formatted")
+    if cache is None:
+        return builder(title_data)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = cache[key] = builder(title_data)
+    return fragment
+
+
+def get_formatted_title(
+    platform: str, title_data: Dict, show_source: bool = True, show_new: bool = True
+) -> str:
+    """按平台格式化标题，结果缓存在报告数据中，多个渲染器/通知渠道共用"""
+    return get_title_fragment(
+        title_data,
+        (platform, show_source, show_new),
+        lambda data: format_title_for_platform(platform, data, show_source, show_new),
+    )
+
+
 def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True
+    platform: str, title_data: Dict, show_source: bool = True, show_new: bool = True
 ) -> str:
-    """统一的标题格式化方法"""
+    """统一的标题格式化方法，show_new 为 False 时不显示新增标记"""
     rank_display = format_rank_display(
         title_data["ranks"], title_data["rank_threshold"], platform
     )
 
-    link_url = title_data["mobile_url"] or title_data["url"]
+    link_url = title_data.get("link_url")
+    if link_url is None:
+        link_url = title_data["mobile_url"] or title_data["url"]
 
-    cleaned_title = clean_title(title_data["title"])
+    cleaned_title = title_data.get("cleaned_title")
+    if cleaned_title is None:
+        cleaned_title = clean_title(title_data["title"])
+    is_new = show_new and title_data.get("is_new")
 
     if platform == "feishu":
         if link_url:
@@ -1543,7 +2216,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
@@ -1565,7 +2238,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1587,7 +2260,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1609,7 +2282,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1631,7 +2304,7 @@ def format_title_for_platform(
         else:
             formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        title_prefix = "🆕 " if is_new else ""
 
         if show_source:
             result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
@@ -1652,8 +2325,6 @@ def format_title_for_platform(
             title_data["ranks"], title_data["rank_threshold"], "html"
         )
 
-        link_url = title_data["mobile_url"] or title_data["url"]
-
         escaped_title = html_escape(cleaned_title)
         escaped_source_name = html_escape(title_data["source_name"])
 
@@ -1673,7 +2344,7 @@ def format_title_for_platform(
         if title_data["count"] > 1:
             formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
 
-        if title_data.get("is_new"):
+        if is_new:
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
         return formatted_title
@@ -1682,55 +2353,9 @@ def format_title_for_platform(
         return cleaned_title
 
 
-def generate_html_report(
-    stats: List[Dict],
-    total_titles: int,
-    failed_ids: Optional[List] = None,
-    new_titles: Optional[Dict] = None,
-    id_to_name: Optional[Dict] = None,
-    mode: str = "daily",
-    is_daily_summary: bool = False,
-    update_info: Optional[Dict] = None,
-) -> str:
-    """生成HTML报告"""
-    if is_daily_summary:
-        if mode == "current":
-            filename = "当前榜单汇总.html"
-        elif mode == "incremental":
-            filename = "当日增量.html"
-        else:
-            filename = "当日汇总.html"
-    else:
-        filename = f"{format_time_filename()}.html"
-
-    file_path = get_output_path("html", filename)
-
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
-
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode, update_info
-    )
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-    return file_path
-
-
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-) -> str:
-    """渲染HTML内容"""
-    html = """
+# === HTML报告模板 ===
+# 页头（含样式）到报告类型取值之前的静态部分
+HTML_REPORT_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -2174,320 +2799,83 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
-
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
+# 页脚结束标签和保存图片脚本
+HTML_REPORT_TAIL = """
                 </div>
             </div>
-            
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # 处理主要统计数据
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
-            escaped_word = html_escape(stat["word"])
-
-            html += f"""
-                <div class="word-group">
-                    <div class="word-header">
-                        <div class="word-info">
-                            <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} 条</div>
-                        </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
-
-            # 处理每个词组下的新闻标题，给每条新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
-
-                html += f"""
-                    <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
-
-                html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                            </div>
-                        </div>
-                    </div>"""
-
-            html += """
-                </div>"""
-
-    # 处理新增新闻区域
-    if report_data["new_titles"]:
-        html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                html += f"""
-                        <div class="new-item">
-                            <div class="new-item-number">{idx}</div>
-                            <div class="new-item-rank {rank_class}">{rank_text}</div>
-                            <div class="new-item-content">
-                                <div class="new-item-title">"""
-
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                                </div>
-                            </div>
-                        </div>"""
-
-            html += """
-                    </div>"""
-
-        html += """
-                </div>"""
-
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>"""
-
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
-                    </span>"""
-
-    html += """
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            async function saveAsImage() {
-                const button = event.target;
-                const originalText = button.textContent;
-                
-                try {
-                    button.textContent = '生成中...';
-                    button.disabled = true;
-                    window.scrollTo(0, 0);
-                    
-                    // 等待页面稳定
-                    await new Promise(resolve => setTimeout(resolve, 200));
-                    
-                    // 截图前隐藏按钮
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'hidden';
-                    
-                    // 再次等待确保按钮完全隐藏
-                    await new Promise(resolve => setTimeout(resolve, 100));
-                    
-                    const container = document.querySelector('.container');
-                    
-                    const canvas = await html2canvas(container, {
-                        backgroundColor: '#ffffff',
-                        scale: 1.5,
-                        useCORS: true,
-                        allowTaint: false,
-                        imageTimeout: 10000,
-                        removeContainer: false,
-                        foreignObjectRendering: false,
-                        logging: false,
-                        width: container.offsetWidth,
-                        height: container.offsetHeight,
-                        x: 0,
-                        y: 0,
-                        scrollX: 0,
-                        scrollY: 0,
-                        windowWidth: window.innerWidth,
-                        windowHeight: window.innerHeight
-                    });
-                    
-                    buttons.style.visibility = 'visible';
-                    
-                    const link = document.createElement('a');
-                    const now = new Date();
-                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
-                    
-                    link.download = filename;
-                    link.href = canvas.toDataURL('image/png', 1.0);
-                    
-                    // 触发下载
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                    
-                    button.textContent = '保存成功!';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                    
-                } catch (error) {
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
+        </div>
+        
+        <script>
+            async function saveAsImage() {
+                const button = event.target;
+                const originalText = button.textContent;
+                
+                try {
+                    button.textContent = '生成中...';
+                    button.disabled = true;
+                    window.scrollTo(0, 0);
+                    
+                    // 等待页面稳定
+                    await new Promise(resolve => setTimeout(resolve, 200));
+                    
+                    // 截图前隐藏按钮
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'hidden';
+                    
+                    // 再次等待确保按钮完全隐藏
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                    
+                    const container = document.querySelector('.container');
+                    
+                    const canvas = await html2canvas(container, {
+                        backgroundColor: '#ffffff',
+                        scale: 1.5,
+                        useCORS: true,
+                        allowTaint: false,
+                        imageTimeout: 10000,
+                        removeContainer: false,
+                        foreignObjectRendering: false,
+                        logging: false,
+                        width: container.offsetWidth,
+                        height: container.offsetHeight,
+                        x: 0,
+                        y: 0,
+                        scrollX: 0,
+                        scrollY: 0,
+                        windowWidth: window.innerWidth,
+                        windowHeight: window.innerHeight
+                    });
+                    
+                    buttons.style.visibility = 'visible';
+                    
+                    const link = document.createElement('a');
+                    const now = new Date();
+                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
+                    
+                    link.download = filename;
+                    link.href = canvas.toDataURL('image/png', 1.0);
+                    
+                    // 触发下载
+                    document.body.appendChild(link);
+                    link.click();
+                    document.body.removeChild(link);
+                    
+                    button.textContent = '保存成功!';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                    
+                } catch (error) {
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'visible';
+                    button.textContent = '保存失败';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                }
+            }
             
             async function saveAsMultipleImages() {
                 const button = event.target;
@@ -2728,7 +3116,345 @@ def render_html_content(
     </html>
     """
 
-    return html
+
+def generate_html_report(
+    stats: List[Dict],
+    total_titles: int,
+    failed_ids: Optional[List] = None,
+    new_titles: Optional[Dict] = None,
+    id_to_name: Optional[Dict] = None,
+    mode: str = "daily",
+    is_daily_summary: bool = False,
+    update_info: Optional[Dict] = None,
+    profile: Optional[str] = None,
+    matcher=None,
+) -> str:
+    """生成HTML报告，订阅配置的报告输出到 html/profiles/<名称>/"""
+    if is_daily_summary:
+        if mode == "current":
+            filename = "当前榜单汇总.html"
+        elif mode == "incremental":
+            filename = "当日增量.html"
+        else:
+            filename = "当日汇总.html"
+    else:
+        filename = f"{format_time_filename()}.html"
+
+    file_path = get_output_path("html", filename)
+    if profile:
+        profile_dir = Path(file_path).parent / "profiles" / profile
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        file_path = str(profile_dir / filename)
+
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, matcher
+    )
+
+    # 边渲染边写入临时文件，完成后原子替换，浏览器/静态服务不会读到写了一半的页面
+    tmp_file = Path(file_path).with_suffix(".html.tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.writelines(
+            iter_html_content(
+                report_data, total_titles, is_daily_summary, mode, update_info
+            )
+        )
+    os.replace(tmp_file, file_path)
+
+    if is_daily_summary and not profile:
+        publish_root_index(Path(file_path), Path("index.html"))
+
+    return file_path
+
+
+def publish_root_index(source: Path, root_file_path: Path) -> None:
+    """把汇总报告发布为根目录 index.html：优先硬链接后原子替换，不支持时复制文件"""
+    tmp_file = root_file_path.with_suffix(".html.tmp")
+    try:
+        tmp_file.unlink()
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(source, tmp_file)
+    except OSError:
+        # 跨文件系统或不支持硬链接时退回复制
+        shutil.copyfile(source, tmp_file)
+    os.replace(tmp_file, root_file_path)
+
+
+def format_html_news_item(title_data: Dict) -> str:
+    """HTML报告中词组下单条新闻序号之后的部分（来源、排名、时间、次数和标题链接）"""
+    parts = [
+        f"""
+                        <div class="news-content">
+                            <div class="news-header">
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+    ]
+
+    # 处理排名显示
+    ranks = title_data.get("ranks", [])
+    if ranks:
+        min_rank = min(ranks)
+        max_rank = max(ranks)
+        rank_threshold = title_data.get("rank_threshold", 10)
+
+        # 确定排名等级
+        if min_rank <= 3:
+            rank_class = "top"
+        elif min_rank <= rank_threshold:
+            rank_class = "high"
+        else:
+            rank_class = ""
+
+        if min_rank == max_rank:
+            rank_text = str(min_rank)
+        else:
+            rank_text = f"{min_rank}-{max_rank}"
+
+        parts.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
+
+    # 处理时间显示
+    time_display = title_data.get("time_display", "")
+    if time_display:
+        # 简化时间显示格式，将波浪线替换为~
+        simplified_time = (
+            time_display.replace(" ~ ", "~").replace("[", "").replace("]", "")
+        )
+        parts.append(f'<span class="time-info">{html_escape(simplified_time)}</span>')
+
+    # 处理出现次数
+    count_info = title_data.get("count", 1)
+    if count_info > 1:
+        parts.append(f'<span class="count-info">{count_info}次</span>')
+
+    parts.append(
+        """
+                            </div>
+                            <div class="news-title">"""
+    )
+    parts.append(_format_html_title_link(title_data))
+    parts.append(
+        """
+                            </div>
+                        </div>
+                    </div>"""
+    )
+    return "".join(parts)
+
+
+def format_html_new_item(title_data: Dict) -> str:
+    """HTML报告新增区域中单条新闻序号之后的部分（排名和标题链接）"""
+    ranks = title_data.get("ranks", [])
+
+    # 处理新增新闻的排名显示
+    rank_class = ""
+    if ranks:
+        min_rank = min(ranks)
+        if min_rank <= 3:
+            rank_class = "top"
+        elif min_rank <= title_data.get("rank_threshold", 10):
+            rank_class = "high"
+
+        if len(ranks) == 1:
+            rank_text = str(ranks[0])
+        else:
+            rank_text = f"{min(ranks)}-{max(ranks)}"
+    else:
+        rank_text = "?"
+
+    return (
+        f"""
+                            <div class="new-item-rank {rank_class}">{rank_text}</div>
+                            <div class="new-item-content">
+                                <div class="new-item-title">"""
+        + _format_html_title_link(title_data)
+        + """
+                                </div>
+                            </div>
+                        </div>"""
+    )
+
+
+def _format_html_title_link(title_data: Dict) -> str:
+    """HTML报告中的标题，有链接时渲染为链接"""
+    escaped_title = html_escape(title_data["title"])
+    link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+    if link_url:
+        escaped_url = html_escape(link_url)
+        return f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+    return escaped_title
+
+
+def iter_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """逐段生成HTML内容，静态的页头和脚本部分直接使用模板常量"""
+    yield HTML_REPORT_HEAD
+
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            yield "当前榜单"
+        elif mode == "incremental":
+            yield "增量模式"
+        else:
+            yield "当日汇总"
+    else:
+        yield "实时分析"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">"""
+
+    yield f"{total_titles} 条"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">"""
+
+    yield f"{hot_news_count} 条"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">"""
+
+    now = get_beijing_time()
+    yield now.strftime("%m-%d %H:%M")
+
+    yield """</span>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="content">"""
+
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    # 处理主要统计数据
+    if report_data["stats"]:
+        total_count = len(report_data["stats"])
+
+        for i, stat in enumerate(report_data["stats"], 1):
+            count = stat["count"]
+
+            # 确定热度等级
+            if count >= 10:
+                count_class = "hot"
+            elif count >= 5:
+                count_class = "warm"
+            else:
+                count_class = ""
+
+            escaped_word = html_escape(stat["word"])
+
+            yield f"""
+                <div class="word-group">
+                    <div class="word-header">
+                        <div class="word-info">
+                            <div class="word-name">{escaped_word}</div>
+                            <div class="word-count {count_class}">{count} 条</div>
+                        </div>
+                        <div class="word-index">{i}/{total_count}</div>
+                    </div>"""
+
+            # 处理每个词组下的新闻标题，给每条新闻标上序号
+            for j, title_data in enumerate(stat["titles"], 1):
+                is_new = title_data.get("is_new", False)
+                new_class = "new" if is_new else ""
+
+                yield f"""
+                    <div class="news-item {new_class}">
+                        <div class="news-number">{j}</div>"""
+                yield get_title_fragment(title_data, "html_news", format_html_news_item)
+
+            yield """
+                </div>"""
+
+    # 处理新增新闻区域
+    if report_data["new_titles"]:
+        yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+
+        for source_data in report_data["new_titles"]:
+            escaped_source = html_escape(source_data["source_name"])
+            titles_count = len(source_data["titles"])
+
+            yield f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+
+            # 为新增新闻也添加序号
+            for idx, title_data in enumerate(source_data["titles"], 1):
+                yield f"""
+                        <div class="new-item">
+                            <div class="new-item-number">{idx}</div>"""
+                yield get_title_fragment(title_data, "html_new", format_html_new_item)
+
+            yield """
+                    </div>"""
+
+        yield """
+                </div>"""
+
+    yield """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    由 <span class="project-name">TrendRadar</span> 生成 · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub 开源项目
+                    </a>"""
+
+    if update_info:
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
+                    </span>"""
+
+    yield HTML_REPORT_TAIL
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> str:
+    """渲染完整的HTML内容（需要字符串时使用，写文件请用 iter_html_content）"""
+    return "".join(
+        iter_html_content(
+            report_data, total_titles, is_daily_summary, mode, update_info
+        )
+    )
 
 
 def render_feishu_content(
@@ -2756,7 +3482,7 @@ def render_feishu_content(
             text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
 
         for j, title_data in enumerate(stat["titles"], 1):
-            formatted_title = format_title_for_platform(
+            formatted_title = get_formatted_title(
                 "feishu", title_data, show_source=True
             )
             text_content += f"  {j}. {formatted_title}\n"
@@ -2790,10 +3516,8 @@ def render_feishu_content(
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-                formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                formatted_title = get_formatted_title(
+                    "feishu", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2854,7 +3578,7 @@ def render_dingtalk_content(
                 text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
 
             for j, title_data in enumerate(stat["titles"], 1):
-                formatted_title = format_title_for_platform(
+                formatted_title = get_formatted_title(
                     "dingtalk", title_data, show_source=True
                 )
                 text_content += f"  {j}. {formatted_title}\n"
@@ -2886,10 +3610,8 @@ def render_dingtalk_content(
             text_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-                formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                formatted_title = get_formatted_title(
+                    "dingtalk", title_data, show_source=False, show_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2911,6 +3633,70 @@ def render_dingtalk_content(
     return text_content
 
 
+class MessageBatchBuilder:
+    """
+    按字节上限累积消息批次
+
+    每段内容只编码一次，批次大小按 UTF-8 字节数增量累计，
+    分批耗时与内容总长度成正比，不再随批次增长反复编码整批内容
+    """
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self._header_size = len(base_header.encode("utf-8"))
+        self._footer_size = len(base_footer.encode("utf-8"))
+        self._parts = [base_header]
+        self._size = self._header_size
+        self._has_content = False
+
+    def _fits(self, size: int) -> bool:
+        return self._size + size + self._footer_size < self.max_bytes
+
+    def add(self, text: str, restart_prefix: str = "") -> None:
+        """
+        追加一段不可拆分的内容
+
+        当前批次放不下时结束当前批次，新批次以 基础头部 + restart_prefix + text 开始，
+        restart_prefix 用于在新批次中重复所属的区域标题/词组标题
+        """
+        size = len(text.encode("utf-8"))
+        if self._fits(size):
+            self._parts.append(text)
+            self._size += size
+        else:
+            self._flush()
+            self._parts = [self.base_header, restart_prefix, text]
+            self._size = self._header_size + len(restart_prefix.encode("utf-8")) + size
+        self._has_content = True
+
+    def add_if_fits(self, text: str) -> None:
+        """放得下时才追加（用于分隔符），放不下时直接丢弃"""
+        size = len(text.encode("utf-8"))
+        if self._fits(size):
+            self._parts.append(text)
+            self._size += size
+
+    def append(self, text: str) -> None:
+        """不检查大小直接追加"""
+        self._parts.append(text)
+        self._size += len(text.encode("utf-8"))
+
+    def _flush(self) -> None:
+        if self._has_content:
+            self.batches.append("".join(self._parts) + self.base_footer)
+
+    def finish(self) -> List[str]:
+        """结束最后一个批次并返回全部批次"""
+        self._flush()
+        self._parts = [self.base_header]
+        self._size = self._header_size
+        self._has_content = False
+        return self.batches
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -2929,8 +3715,6 @@ def split_content_into_batches(
         else:
             max_bytes = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
 
-    batches = []
-
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -2986,8 +3770,7 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             stats_header = f"📊 **热点词汇统计**\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
+    batch_builder = MessageBatchBuilder(base_header, base_footer, max_bytes)
 
     if (
         not report_data["stats"]
@@ -3001,27 +3784,14 @@ def split_content_into_batches(
         else:
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [base_header + simple_content + base_footer]
 
     # 处理热点词汇统计
     if report_data["stats"]:
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        batch_builder.add(stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -3084,23 +3854,23 @@ def split_content_into_batches(
             if stat["titles"]:
                 first_title_data = stat["titles"][0]
                 if format_type == "wework":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "wework", first_title_data, show_source=True
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "telegram", first_title_data, show_source=True
                     )
                 elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "ntfy", first_title_data, show_source=True
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "feishu", first_title_data, show_source=True
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "dingtalk", first_title_data, show_source=True
                     )
                 else:
@@ -3112,44 +3882,29 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            batch_builder.add(word_with_first_news, restart_prefix=stats_header)
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
+            for j in range(1, len(stat["titles"])):
                 title_data = stat["titles"][j]
                 if format_type == "wework":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "wework", title_data, show_source=True
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "telegram", title_data, show_source=True
                     )
                 elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "ntfy", title_data, show_source=True
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "feishu", title_data, show_source=True
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
+                    formatted_title = get_formatted_title(
                         "dingtalk", title_data, show_source=True
                     )
                 else:
@@ -3159,18 +3914,7 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                batch_builder.add(news_line, restart_prefix=stats_header + word_header)
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -3186,12 +3930,7 @@ def split_content_into_batches(
                 elif format_type == "dingtalk":
                     separator = f"\n---\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                batch_builder.add_if_fits(separator)
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
@@ -3209,18 +3948,7 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             new_header = f"\n---\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batch_builder.add(new_header)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -3240,89 +3968,60 @@ def split_content_into_batches(
             first_news_line = ""
             if source_data["titles"]:
                 first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
 
                 if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "wework", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "telegram", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "feishu", first_title_data, show_source=False, show_new=False
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "dingtalk", first_title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
+                    formatted_title = f"{first_title_data['title']}"
 
                 first_news_line = f"  1. {formatted_title}\n"
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            batch_builder.add(source_with_first_news, restart_prefix=new_header)
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
+            for j in range(1, len(source_data["titles"])):
                 title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
 
                 if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "wework", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "telegram", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "feishu", title_data, show_source=False, show_new=False
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                    formatted_title = get_formatted_title(
+                        "dingtalk", title_data, show_source=False, show_new=False
                     )
                 else:
-                    formatted_title = f"{title_data_copy['title']}"
+                    formatted_title = f"{title_data['title']}"
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                batch_builder.add(news_line, restart_prefix=new_header + source_header)
 
-            current_batch += "\n"
+            batch_builder.append("\n")
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -3337,18 +4036,7 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batch_builder.add(failed_header)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -3358,24 +4046,60 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batch_builder.add(failed_line, restart_prefix=failed_header)
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+    return batch_builder.finish()
+
+
+def _timed_send(channel: str, sender: Callable[[], bool]) -> Dict:
+    """执行单个渠道的推送并计时，异常视为推送失败"""
+    start = time.perf_counter()
+    try:
+        success = bool(sender())
+    except Exception as e:
+        print(f"{channel}通知推送出错: {e}")
+        success = False
+    return {"success": success, "elapsed": round(time.perf_counter() - start, 3)}
+
+
+def dispatch_notifications(
+    channel_senders: Dict[str, Callable[[], bool]], parallel: bool = True
+) -> Dict[str, Dict]:
+    """
+    推送到多个渠道
+
+    Args:
+        channel_senders: {渠道: 无参推送函数}，函数返回是否推送成功
+        parallel: 是否并发推送，各渠道在独立线程中执行，总耗时约等于最慢的渠道
+
+    Returns:
+        {渠道: {"success": 是否成功, "elapsed": 耗时秒数}}，顺序与 channel_senders 一致
+    """
+    if not channel_senders:
+        return {}
+
+    start = time.perf_counter()
+    if parallel and len(channel_senders) > 1:
+        with ThreadPoolExecutor(
+            max_workers=len(channel_senders), thread_name_prefix="notify"
+        ) as executor:
+            futures = {
+                channel: executor.submit(_timed_send, channel, sender)
+                for channel, sender in channel_senders.items()
+            }
+            results = {channel: future.result() for channel, future in futures.items()}
+    else:
+        results = {
+            channel: _timed_send(channel, sender) for channel, sender in channel_senders.items()
+        }
 
-    return batches
+    timing_text = "，".join(
+        f"{channel} {'成功' if result['success'] else '失败'} {result['elapsed']:.2f}s"
+        for channel, result in results.items()
+    )
+    print(f"通知推送完成（总耗时 {time.perf_counter() - start:.2f}s）：{timing_text}")
+    return results
 
 
 def send_to_notifications(
@@ -3388,12 +4112,27 @@ def send_to_notifications(
     proxy_url: Optional[str] = None,
     mode: str = "daily",
     html_file_path: Optional[str] = None,
-) -> Dict[str, bool]:
-    """发送数据到多个通知平台"""
+    channels: Optional[Dict] = None,
+    profile: Optional[str] = None,
+    matcher=None,
+) -> Dict[str, Dict]:
+    """
+    发送数据到多个通知平台，多个渠道并发推送
+
+    Args:
+        channels: 通知渠道配置（键与 CONFIG 相同），默认使用全局配置
+        profile: 订阅配置名称，用于区分推送记录
+        matcher: 筛选新增新闻的匹配器，默认使用主频率词配置
+
+    Returns:
+        {渠道: {"success": 是否成功, "elapsed": 耗时秒数}}
+    """
     results = {}
+    if channels is None:
+        channels = CONFIG
 
     if CONFIG["PUSH_WINDOW"]["ENABLED"]:
-        push_manager = PushRecordManager()
+        push_manager = PushRecordManager(profile)
         time_range_start = CONFIG["PUSH_WINDOW"]["TIME_RANGE"]["START"]
         time_range_end = CONFIG["PUSH_WINDOW"]["TIME_RANGE"]["END"]
 
@@ -3411,45 +4150,51 @@ def send_to_notifications(
             else:
                 print(f"推送窗口控制：今天首次推送")
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
-
-    feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
-    dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
-    wework_url = CONFIG["WEWORK_WEBHOOK_URL"]
-    telegram_token = CONFIG["TELEGRAM_BOT_TOKEN"]
-    telegram_chat_id = CONFIG["TELEGRAM_CHAT_ID"]
-    email_from = CONFIG["EMAIL_FROM"]
-    email_password = CONFIG["EMAIL_PASSWORD"]
-    email_to = CONFIG["EMAIL_TO"]
-    email_smtp_server = CONFIG.get("EMAIL_SMTP_SERVER", "")
-    email_smtp_port = CONFIG.get("EMAIL_SMTP_PORT", "")
-    ntfy_server_url = CONFIG["NTFY_SERVER_URL"]
-    ntfy_topic = CONFIG["NTFY_TOPIC"]
-    ntfy_token = CONFIG.get("NTFY_TOKEN", "")
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, matcher
+    )
+
+    feishu_url = channels["FEISHU_WEBHOOK_URL"]
+    dingtalk_url = channels["DINGTALK_WEBHOOK_URL"]
+    wework_url = channels["WEWORK_WEBHOOK_URL"]
+    telegram_token = channels["TELEGRAM_BOT_TOKEN"]
+    telegram_chat_id = channels["TELEGRAM_CHAT_ID"]
+    email_from = channels["EMAIL_FROM"]
+    email_password = channels["EMAIL_PASSWORD"]
+    email_to = channels["EMAIL_TO"]
+    email_smtp_server = channels.get("EMAIL_SMTP_SERVER", "")
+    email_smtp_port = channels.get("EMAIL_SMTP_PORT", "")
+    email_smtp_encryption = channels.get("EMAIL_SMTP_ENCRYPTION", "")
+    ntfy_server_url = channels["NTFY_SERVER_URL"]
+    ntfy_topic = channels["NTFY_TOPIC"]
+    ntfy_token = channels.get("NTFY_TOKEN", "")
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 收集已配置的渠道，每个渠道内部仍按顺序分批发送并遵守各自的发送间隔
+    channel_senders = {}
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
+        channel_senders["feishu"] = lambda: send_to_feishu(
             feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
+        channel_senders["dingtalk"] = lambda: send_to_dingtalk(
             dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
+        channel_senders["wework"] = lambda: send_to_wework(
             wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
         )
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
+        channel_senders["telegram"] = lambda: send_to_telegram(
             telegram_token,
             telegram_chat_id,
             report_data,
@@ -3461,7 +4206,7 @@ def send_to_notifications(
 
     # 发送到 ntfy
     if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
+        channel_senders["ntfy"] = lambda: send_to_ntfy(
             ntfy_server_url,
             ntfy_topic,
             ntfy_token,
@@ -3474,7 +4219,7 @@ def send_to_notifications(
 
     # 发送邮件
     if email_from and email_password and email_to:
-        results["email"] = send_to_email(
+        channel_senders["email"] = lambda: send_to_email(
             email_from,
             email_password,
             email_to,
@@ -3482,8 +4227,11 @@ def send_to_notifications(
             html_file_path,
             email_smtp_server,
             email_smtp_port,
+            email_smtp_encryption,
         )
 
+    results = dispatch_notifications(channel_senders, CONFIG.get("PARALLEL_SEND", True))
+
     if not results:
         print("未配置任何通知渠道，跳过通知发送")
 
@@ -3491,14 +4239,170 @@ def send_to_notifications(
     if (
         CONFIG["PUSH_WINDOW"]["ENABLED"]
         and CONFIG["PUSH_WINDOW"]["ONCE_PER_DAY"]
-        and any(results.values())
+        and any(result["success"] for result in results.values())
     ):
-        push_manager = PushRecordManager()
+        push_manager = PushRecordManager(profile)
         push_manager.record_push(report_type)
 
     return results
 
 
+# === 通知发件箱 ===
+_notification_outbox: Optional[NotificationOutbox] = None
+_notification_outbox_lock = threading.Lock()
+
+
+def get_notification_outbox() -> Optional[NotificationOutbox]:
+    """按配置打开通知发件箱，未启用时返回 None，同一进程内各渠道线程共用一个实例"""
+    global _notification_outbox
+
+    outbox_config = CONFIG.get("NOTIFICATION_OUTBOX", {})
+    if not outbox_config.get("ENABLED", False):
+        return None
+
+    with _notification_outbox_lock:
+        if _notification_outbox is None:
+            db_path = CONFIG.get("OUTPUT_OUTBOX_DB", "output/outbox.db")
+            try:
+                _notification_outbox = NotificationOutbox(
+                    db_path,
+                    max_attempts=outbox_config["MAX_ATTEMPTS"],
+                    retries_per_run=outbox_config["RETRIES_PER_RUN"],
+                    backoff_seconds=outbox_config["BACKOFF_SECONDS"],
+                    expire_hours=outbox_config["EXPIRE_HOURS"],
+                )
+            except Exception as e:
+                print(f"通知发件箱打开失败，本次直接推送: {e}")
+                return None
+        return _notification_outbox
+
+
+def check_errcode_response(response) -> Optional[str]:
+    """钉钉/企业微信响应检查：errcode 为 0 表示成功，否则返回错误信息"""
+    result = response.json()
+    if result.get("errcode") == 0:
+        return None
+    return str(result.get("errmsg"))
+
+
+def _post_notification_batch(
+    url: str,
+    request: Dict,
+    proxy_url: Optional[str],
+    secret_headers: Optional[Dict],
+    check_response: Callable,
+    secret_fields: Optional[Dict] = None,
+) -> Optional[str]:
+    """推送单个批次，成功返回 None，失败返回错误信息"""
+    if "json" in request:
+        headers = {"Content-Type": "application/json"}
+    else:
+        headers = {}
+    headers.update(request.get("headers", {}))
+    if secret_headers:
+        headers.update(secret_headers)
+
+    payload = request.get("json")
+    if payload is not None and secret_fields:
+        payload = {**payload, **secret_fields}
+
+    response = get_http_session().post(
+        url,
+        headers=headers,
+        json=payload,
+        data=request["data"].encode("utf-8") if "data" in request else None,
+        proxy_url=proxy_url,
+        timeout=30,
+    )
+    if response.status_code != 200:
+        return f"状态码：{response.status_code}"
+    return check_response(response)
+
+
+def deliver_notification_batches(
+    channel: str,
+    label: str,
+    url: str,
+    requests_list: List[Dict],
+    report_type: str,
+    check_response: Callable,
+    proxy_url: Optional[str] = None,
+    secret_headers: Optional[Dict] = None,
+    secret_fields: Optional[Dict] = None,
+) -> bool:
+    """
+    按顺序推送一个渠道的全部批次
+
+    启用发件箱时批次先持久化，失败的批次按退避重试，仍失败则保留到下次运行，
+    从失败的批次继续推送；未启用时逐批推送，遇到失败即停止。
+    每次请求前从推送目标的令牌桶获取令牌，按平台频率限制发送，日志中输出每批的排队和发送耗时
+
+    Args:
+        channel: 渠道标识
+        label: 日志中的渠道名称
+        url: 推送地址（不会写入发件箱）
+        requests_list: 请求内容列表，{"json": 请求体} 或 {"headers": 请求头, "data": 文本}
+        report_type: 报告类型
+        check_response: 检查 200 响应的函数，成功返回 None，失败返回错误信息
+        proxy_url: 代理地址
+        secret_headers: 不写入发件箱的请求头（如认证令牌）
+        secret_fields: 发送时才合并到 JSON 请求体、不写入发件箱的字段（如 Telegram chat_id）
+
+    Returns:
+        是否全部推送成功
+    """
+
+    def send(request: Dict) -> Optional[str]:
+        return _post_notification_batch(
+            url, request, proxy_url, secret_headers, check_response, secret_fields
+        )
+
+    target = f"{channel}|{url}"
+    if secret_fields:
+        # 同一机器人推送到不同会话时区分推送目标，摘要中不保存原值
+        target += "|" + json.dumps(secret_fields, sort_keys=True)
+    target_key = make_target_key(target)
+    rate_limiter = get_rate_limiter(
+        channel, target_key, CONFIG["RATE_LIMITS"].get(channel)
+    )
+
+    outbox = get_notification_outbox()
+    if outbox is None:
+        total = len(requests_list)
+        for i, request in enumerate(requests_list, 1):
+            queued = rate_limiter.acquire()
+            start = time.monotonic()
+            try:
+                error = send(request)
+            except Exception as e:
+                error = str(e)
+            latency = time.monotonic() - start
+            if error is not None:
+                print(f"{label}第 {i}/{total} 批次发送失败 [{report_type}]，{error}")
+                return False
+            print(
+                f"{label}第 {i}/{total} 批次发送成功 [{report_type}]"
+                f"（排队 {queued:.2f}s，发送 {latency:.2f}s）"
+            )
+        print(f"{label}所有 {total} 批次发送完成 [{report_type}]")
+        return True
+
+    outbox.enqueue(channel, target_key, report_type, requests_list)
+    sent, remaining = outbox.deliver(
+        channel, target_key, send, rate_limiter, label=label
+    )
+    if remaining:
+        print(
+            f"{label}还有 {remaining} 个批次未推送成功，已保存在通知发件箱中，下次运行时继续推送 [{report_type}]"
+        )
+        return False
+    if sent:
+        print(f"{label}所有 {sent} 批次发送完成 [{report_type}]")
+    else:
+        print(f"{label}的批次均已推送过，跳过 [{report_type}]")
+    return True
+
+
 def send_to_feishu(
     webhook_url: str,
     report_data: Dict,
@@ -3508,11 +4412,6 @@ def send_to_feishu(
     mode: str = "daily",
 ) -> bool:
     """发送到飞书（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用飞书专用的批次大小
     batches = split_content_into_batches(
         report_data,
@@ -3524,13 +4423,13 @@ def send_to_feishu(
 
     print(f"飞书消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送飞书第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+    now = get_beijing_time()
 
+    requests_list = []
+    for i, batch_content in enumerate(batches, 1):
         # 添加批次标识
         if len(batches) > 1:
             batch_header = f"**[第 {i}/{len(batches)} 批次]**\n\n"
@@ -3543,11 +4442,6 @@ def send_to_feishu(
                 # 如果没有统计标题，直接在开头添加
                 batch_content = batch_header + batch_content
 
-        total_titles = sum(
-            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-        )
-        now = get_beijing_time()
-
         payload = {
             "msg_type": "text",
             "content": {
@@ -3557,36 +4451,24 @@ def send_to_feishu(
                 "text": batch_content,
             },
         }
+        requests_list.append({"json": payload})
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                # 检查飞书的响应状态
-                if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    print(f"飞书第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
-                    print(
-                        f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
-                    )
-                    return False
-            else:
-                print(
-                    f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"飞书第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+    def check_response(response) -> Optional[str]:
+        result = response.json()
+        # 检查飞书的响应状态
+        if result.get("StatusCode") == 0 or result.get("code") == 0:
+            return None
+        return result.get("msg") or result.get("StatusMessage", "未知错误")
 
-    print(f"飞书所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return deliver_notification_batches(
+        "feishu",
+        "飞书",
+        webhook_url,
+        requests_list,
+        report_type,
+        check_response,
+        proxy_url,
+    )
 
 
 def send_to_dingtalk(
@@ -3598,11 +4480,6 @@ def send_to_dingtalk(
     mode: str = "daily",
 ) -> bool:
     """发送到钉钉（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用钉钉专用的批次大小
     batches = split_content_into_batches(
         report_data,
@@ -3614,13 +4491,8 @@ def send_to_dingtalk(
 
     print(f"钉钉消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    requests_list = []
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送钉钉第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
-
         # 添加批次标识
         if len(batches) > 1:
             batch_header = f"**[第 {i}/{len(batches)} 批次]**\n\n"
@@ -3640,34 +4512,17 @@ def send_to_dingtalk(
                 "text": batch_content,
             },
         }
+        requests_list.append({"json": payload})
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"钉钉第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"钉钉第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"钉钉所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return deliver_notification_batches(
+        "dingtalk",
+        "钉钉",
+        webhook_url,
+        requests_list,
+        report_type,
+        check_errcode_response,
+        proxy_url,
+    )
 
 
 def send_to_wework(
@@ -3679,57 +4534,30 @@ def send_to_wework(
     mode: str = "daily",
 ) -> bool:
     """发送到企业微信（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
     batches = split_content_into_batches(report_data, "wework", update_info, mode=mode)
 
     print(f"企业微信消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    requests_list = []
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
-
         # 添加批次标识
         if len(batches) > 1:
             batch_header = f"**[第 {i}/{len(batches)} 批次]**\n\n"
             batch_content = batch_header + batch_content
 
         payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
-
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"企业微信第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"企业微信第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
-
-    print(f"企业微信所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+        requests_list.append({"json": payload})
+
+    return deliver_notification_batches(
+        "wework",
+        "企业微信",
+        webhook_url,
+        requests_list,
+        report_type,
+        check_errcode_response,
+        proxy_url,
+    )
 
 
 def send_to_telegram(
@@ -3742,13 +4570,8 @@ def send_to_telegram(
     mode: str = "daily",
 ) -> bool:
     """发送到Telegram（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
     batches = split_content_into_batches(
         report_data, "telegram", update_info, mode=mode
@@ -3756,52 +4579,184 @@ def send_to_telegram(
 
     print(f"Telegram消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
+    requests_list = []
     for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
-
         # 添加批次标识
         if len(batches) > 1:
             batch_header = f"<b>[第 {i}/{len(batches)} 批次]</b>\n\n"
             batch_content = batch_header + batch_content
 
+        # chat_id 在发送时合并到请求体，不写入通知发件箱
         payload = {
-            "chat_id": chat_id,
             "text": batch_content,
             "parse_mode": "HTML",
             "disable_web_page_preview": True,
         }
+        requests_list.append({"json": payload})
+
+    def check_response(response) -> Optional[str]:
+        result = response.json()
+        if result.get("ok"):
+            return None
+        return str(result.get("description"))
+
+    return deliver_notification_batches(
+        "telegram",
+        "Telegram",
+        url,
+        requests_list,
+        report_type,
+        check_response,
+        proxy_url,
+        secret_fields={"chat_id": chat_id},
+    )
+
+
+# === 邮件 ===
+# SMTP 连接按 (服务器, 端口, 加密方式, 账号) 复用，同一次运行和常驻模式的多次运行之间共用，
+# 发送前用 NOOP 检查连接是否仍然可用
+_smtp_connections: Dict[Tuple, object] = {}
+_smtp_lock = threading.Lock()
+
+# HTML 报告编码后的 MIME 部分：{文件路径: ((mtime_ns, size), MIMEText)}
+_email_html_parts: Dict[str, Tuple] = {}
+EMAIL_HTML_PART_CACHE_SIZE = 8
+
+
+def resolve_smtp_settings(
+    from_email: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+    encryption: Optional[str] = None,
+) -> Tuple[str, int, str]:
+    """
+    确定 SMTP 服务器、端口和加密方式
+
+    Returns:
+        (服务器, 端口, 加密方式)，加密方式为 SSL / TLS / NONE
+    """
+    domain = from_email.split("@")[-1].lower()
+
+    if custom_smtp_server and custom_smtp_port:
+        # 使用自定义 SMTP 配置
+        smtp_server = custom_smtp_server
+        smtp_port = int(custom_smtp_port)
+        # 根据端口判断加密方式：465=SSL，587 和其他端口优先尝试 TLS（更安全，更广泛支持）
+        smtp_encryption = "SSL" if smtp_port == 465 else "TLS"
+    elif domain in SMTP_CONFIGS:
+        # 使用预设配置
+        config = SMTP_CONFIGS[domain]
+        smtp_server = config["server"]
+        smtp_port = config["port"]
+        smtp_encryption = config["encryption"]
+    else:
+        print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
+        smtp_server = f"smtp.{domain}"
+        smtp_port = 587
+        smtp_encryption = "TLS"
+
+    if encryption:
+        smtp_encryption = encryption.upper()
+    return smtp_server, smtp_port, smtp_encryption
+
 
+def _open_smtp_connection(
+    smtp_server: str, smtp_port: int, encryption: str, username: str, password: str
+):
+    """建立 SMTP 连接并登录"""
+    import smtplib
+
+    if encryption == "SSL":
+        server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
+    else:
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
+    server.set_debuglevel(0)  # 设为1可以查看详细调试信息
+    server.ehlo()
+    if encryption == "TLS":
+        server.starttls()
+        server.ehlo()
+
+    # 未加密的本地/内网服务器可能不要求认证
+    if encryption != "NONE" or server.has_extn("auth"):
+        server.login(username, password)
+    return server
+
+
+def _get_smtp_connection(key: Tuple, password: str, reuse: bool = True):
+    """获取可用的 SMTP 连接（调用方需持有 _smtp_lock）"""
+    server = _smtp_connections.get(key) if reuse else None
+    if server is not None:
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    print(f"Telegram第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"Telegram第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+            if server.noop()[0] == 250:
+                return server
+        except Exception:
+            pass
+        _close_smtp_connection(key)
 
-    print(f"Telegram所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    smtp_server, smtp_port, encryption, username = key
+    server = _open_smtp_connection(
+        smtp_server, smtp_port, encryption, username, password
+    )
+    _smtp_connections[key] = server
+    return server
+
+
+def _close_smtp_connection(key: Tuple) -> None:
+    server = _smtp_connections.pop(key, None)
+    if server is None:
+        return
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def close_smtp_connections() -> None:
+    """关闭所有复用中的 SMTP 连接"""
+    with _smtp_lock:
+        for key in list(_smtp_connections):
+            _close_smtp_connection(key)
+
+
+def build_email_html_part(html_content: str):
+    """
+    构建 HTML 邮件正文部分
+
+    报告以 ASCII 标记为主，quoted-printable 通常比 base64 更小；
+    两种编码都生成一次，保留较小的一种
+    """
+    from email.charset import QP, Charset
+    from email.mime.text import MIMEText
+
+    base64_part = MIMEText(html_content, "html", "utf-8")
+    qp_charset = Charset("utf-8")
+    qp_charset.body_encoding = QP
+    qp_part = MIMEText(html_content, "html", qp_charset)
+
+    if len(qp_part.get_payload()) < len(base64_part.get_payload()):
+        return qp_part
+    return base64_part
+
+
+def get_email_html_part(html_file_path: str):
+    """读取 HTML 报告并缓存编码后的 MIME 部分，文件未变化时直接复用"""
+    stat = os.stat(html_file_path)
+    identity = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _email_html_parts.get(html_file_path)
+    if cached and cached[0] == identity:
+        return cached[1]
+
+    with open(html_file_path, "r", encoding="utf-8") as f:
+        html_part = build_email_html_part(f.read())
+
+    if len(_email_html_parts) >= EMAIL_HTML_PART_CACHE_SIZE:
+        _email_html_parts.pop(next(iter(_email_html_parts)))
+    _email_html_parts[html_file_path] = (identity, html_part)
+    return html_part
 
 
 def send_to_email(
@@ -3812,42 +4767,26 @@ def send_to_email(
     html_file_path: str,
     custom_smtp_server: Optional[str] = None,
     custom_smtp_port: Optional[int] = None,
+    smtp_encryption: Optional[str] = None,
 ) -> bool:
-    """发送邮件通知"""
+    """发送邮件通知（复用 SMTP 连接和已编码的 HTML 正文）"""
+    import smtplib
+    from email.header import Header
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    from email.utils import formataddr, formatdate, make_msgid
+
+    smtp_server, smtp_port, encryption = resolve_smtp_settings(
+        from_email, custom_smtp_server, custom_smtp_port, smtp_encryption
+    )
+
     try:
         if not html_file_path or not Path(html_file_path).exists():
             print(f"错误：HTML文件不存在或未提供: {html_file_path}")
             return False
 
         print(f"使用HTML文件: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        domain = from_email.split("@")[-1].lower()
-
-        if custom_smtp_server and custom_smtp_port:
-            # 使用自定义 SMTP 配置
-            smtp_server = custom_smtp_server
-            smtp_port = int(custom_smtp_port)
-            # 根据端口判断加密方式：465=SSL, 587=TLS
-            if smtp_port == 465:
-                use_tls = False  # SSL 模式（SMTP_SSL）
-            elif smtp_port == 587:
-                use_tls = True   # TLS 模式（STARTTLS）
-            else:
-                # 其他端口优先尝试 TLS（更安全，更广泛支持）
-                use_tls = True
-        elif domain in SMTP_CONFIGS:
-            # 使用预设配置
-            config = SMTP_CONFIGS[domain]
-            smtp_server = config["server"]
-            smtp_port = config["port"]
-            use_tls = config["encryption"] == "TLS"
-        else:
-            print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
-            smtp_server = f"smtp.{domain}"
-            smtp_port = 587
-            use_tls = True
+        html_part = get_email_html_part(html_file_path)
 
         msg = MIMEMultipart("alternative")
 
@@ -3883,41 +4822,30 @@ TrendRadar 热点分析报告
         """
         text_part = MIMEText(text_content, "plain", "utf-8")
         msg.attach(text_part)
-
-        html_part = MIMEText(html_content, "html", "utf-8")
         msg.attach(html_part)
 
         print(f"正在发送邮件到 {to_email}...")
-        print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
+        print(f"SMTP 服务器: {smtp_server}:{smtp_port} ({encryption})")
         print(f"发件人: {from_email}")
 
-        try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # 登录
-            server.login(from_email, password)
-
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
-
-            print(f"邮件发送成功 [{report_type}] -> {to_email}")
-            return True
+        key = (smtp_server, smtp_port, encryption, from_email)
+        with _smtp_lock:
+            try:
+                server = _get_smtp_connection(key, password)
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # 复用的连接可能在 NOOP 检查之后被服务器关闭，重新连接再发送一次
+                _close_smtp_connection(key)
+                try:
+                    server = _get_smtp_connection(key, password, reuse=False)
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    _close_smtp_connection(key)
+                    print(f"邮件发送失败：服务器意外断开连接，请检查网络或稍后重试")
+                    return False
 
-        except smtplib.SMTPServerDisconnected:
-            print(f"邮件发送失败：服务器意外断开连接，请检查网络或稍后重试")
-            return False
+        print(f"邮件发送成功 [{report_type}] -> {to_email}")
+        return True
 
     except smtplib.SMTPAuthenticationError as e:
         print(f"邮件发送失败：认证错误，请检查邮箱和密码/授权码")
@@ -3973,19 +4901,12 @@ def send_to_ntfy(
         "Tags": "news",
     }
 
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    
     # 构建完整URL，确保格式正确
     base_url = server_url.rstrip("/")
     if not base_url.startswith(("http://", "https://")):
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用ntfy专用的4KB限制
     batches = split_content_into_batches(
         report_data, "ntfy", update_info, max_bytes=3800, mode=mode
@@ -3996,22 +4917,14 @@ def send_to_ntfy(
 
     # 反转批次顺序，使得在ntfy客户端显示时顺序正确
     # ntfy显示最新消息在上面，所以我们从最后一批开始推送
-    reversed_batches = list(reversed(batches))
-    
     print(f"ntfy将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
-    # 逐批发送（反向顺序）
-    success_count = 0
-    for idx, batch_content in enumerate(reversed_batches, 1):
-        # 计算正确的批次编号（用户视角的编号）
-        actual_batch_num = total_batches - idx + 1
-        
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送ntfy第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
-        )
+    requests_list = []
+    for actual_batch_num in range(total_batches, 0, -1):
+        batch_content = batches[actual_batch_num - 1]
 
         # 检查消息大小，确保不超过4KB
+        batch_size = len(batch_content.encode("utf-8"))
         if batch_size > 4096:
             print(f"警告：ntfy第 {actual_batch_num} 批次消息过大（{batch_size} 字节），可能被拒绝")
 
@@ -4024,74 +4937,21 @@ def send_to_ntfy(
                 f"{report_type_en} ({actual_batch_num}/{total_batches})"
             )
 
-        try:
-            response = requests.post(
-                url,
-                headers=current_headers,
-                data=batch_content.encode("utf-8"),
-                proxies=proxies,
-                timeout=30,
-            )
+        requests_list.append({"headers": current_headers, "data": batch_content})
 
-            if response.status_code == 200:
-                print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
-                success_count += 1
-                if idx < total_batches:
-                    # 公共服务器建议 2-3 秒，自托管可以更短
-                    interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
-            elif response.status_code == 429:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
-                )
-                time.sleep(10)  # 等待10秒后重试
-                # 重试一次
-                retry_response = requests.post(
-                    url,
-                    headers=current_headers,
-                    data=batch_content.encode("utf-8"),
-                    proxies=proxies,
-                    timeout=30,
-                )
-                if retry_response.status_code == 200:
-                    print(f"ntfy第 {actual_batch_num}/{total_batches} 批次重试成功 [{report_type}]")
-                    success_count += 1
-                else:
-                    print(
-                        f"ntfy第 {actual_batch_num}/{total_batches} 批次重试失败，状态码：{retry_response.status_code}"
-                    )
-            elif response.status_code == 413:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{batch_size} 字节"
-                )
-            else:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                try:
-                    print(f"错误详情：{response.text}")
-                except:
-                    pass
-
-        except requests.exceptions.ConnectTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
-        except requests.exceptions.ReadTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
-        except requests.exceptions.ConnectionError as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
-        except Exception as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
+    # 令牌不写入发件箱，推送时再加到请求头
+    secret_headers = {"Authorization": f"Bearer {token}"} if token else None
 
-    # 判断整体发送是否成功
-    if success_count == total_batches:
-        print(f"ntfy所有 {total_batches} 批次发送完成 [{report_type}]")
-        return True
-    elif success_count > 0:
-        print(f"ntfy部分发送成功：{success_count}/{total_batches} 批次 [{report_type}]")
-        return True  # 部分成功也视为成功
-    else:
-        print(f"ntfy发送完全失败 [{report_type}]")
-        return False
+    return deliver_notification_batches(
+        "ntfy",
+        "ntfy",
+        url,
+        requests_list,
+        report_type,
+        lambda response: None,
+        proxy_url,
+        secret_headers,
+    )
 
 
 # === 主分析器 ===
@@ -4135,26 +4995,64 @@ class NewsAnalyzer:
         self.rank_threshold = CONFIG["RANK_THRESHOLD"]
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
+        # 常驻模式下每次定时运行都会生成报告，不自动打开浏览器
+        self._daemon_mode = False
         self.update_info = None
         self.proxy_url = None
+        # 本次运行的当天数据 (all_results, id_to_name, title_info, new_titles)，保存快照后加载一次
+        self._today_data: Optional[Tuple[Dict, Dict, Dict, Dict]] = None
+        # 保存本次快照前检测到的最新批次新增标题，实时报告和Markdown报告按此标记新增
+        self._latest_new_titles: Dict = {}
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        configure_http_session(
+            proxy_url=self.proxy_url,
+            timeout=CONFIG["HTTP"]["TIMEOUT"],
+            pool_connections=CONFIG["HTTP"]["POOL_CONNECTIONS"],
+            pool_maxsize=CONFIG["HTTP"]["POOL_MAXSIZE"],
+            host_pool_sizes=CONFIG["HTTP"]["HOST_POOL_SIZES"],
+        )
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            max_workers=CONFIG["CRAWLER_MAX_WORKERS"],
+            rate_limiter=HostRateLimiter(
+                CONFIG["HOST_RATE_LIMIT"], CONFIG["HOST_RATE_BURST"]
+            ),
+            fetch_state=FetchStateStore() if CONFIG["CONDITIONAL_FETCH"] else None,
+            health=PlatformHealthTracker(
+                failure_threshold=CONFIG["CIRCUIT_BREAKER"]["FAILURE_THRESHOLD"],
+                cooldown=CONFIG["CIRCUIT_BREAKER"]["COOLDOWN"],
+            )
+            if CONFIG["CIRCUIT_BREAKER"]["ENABLED"]
+            else None,
+            max_retries=CONFIG["RETRY"]["MAX_RETRIES"],
+            retry_base_delay=CONFIG["RETRY"]["BASE_DELAY"],
+            retry_max_delay=CONFIG["RETRY"]["MAX_DELAY"],
+        )
 
         # 初始化GitHub推送服务
         self.github_service = None
         self.latest_markdown_file = None
         
-        # 检查GitHub配置是否存在
+        # 检查GitHub配置是否存在，未启用时不导入推送模块
         github_config = CONFIG.get("GITHUB", {})
-        if MARKDOWN_AVAILABLE and github_config.get("enabled", False):
-            try:
-                self.github_service = GitHubPushService(github_config)
-                print("✅ GitHub推送服务已初始化")
-            except Exception as e:
-                print(f"⚠️ GitHub推送服务初始化失败: {e}")
+        if github_config.get("enabled", False):
+            github_service_class = load_github_service_class()
+            if github_service_class:
+                try:
+                    self.github_service = github_service_class(github_config)
+                    print("✅ GitHub推送服务已初始化")
+                except Exception as e:
+                    print(f"⚠️ GitHub推送服务初始化失败: {e}")
 
-        if self.is_github_actions:
-            self._check_version_update()
+        # 版本检查在 run() 中后台进行，生成报告前再等待结果
+        self._version_check_thread: Optional[threading.Thread] = None
+
+        # 订阅配置：共用本次爬取和当天数据，按各自的频率词和通知渠道生成报告并推送
+        self.profiles: List[SubscriberProfile] = parse_subscriber_profiles(
+            CONFIG["PROFILES"], CONFIG
+        )
+        # 主配置和各订阅配置的批量匹配器，每次运行重建
+        self._profile_matcher: Optional[MultiProfileMatcher] = None
 
     def _detect_docker_environment(self) -> bool:
         """检测是否运行在 Docker 容器中"""
@@ -4171,7 +5069,11 @@ class NewsAnalyzer:
 
     def _should_open_browser(self) -> bool:
         """判断是否应该打开浏览器"""
-        return not self.is_github_actions and not self.is_docker_container
+        return (
+            not self.is_github_actions
+            and not self.is_docker_container
+            and not self._daemon_mode
+        )
 
     def _setup_proxy(self) -> None:
         """设置代理配置"""
@@ -4183,6 +5085,21 @@ class NewsAnalyzer:
         else:
             print("GitHub Actions环境，不使用代理")
 
+    def _start_version_check(self) -> None:
+        """在后台线程中检查版本更新（仅 GitHub Actions 环境），不阻塞抓取"""
+        if not self.is_github_actions or self._version_check_thread:
+            return
+        self._version_check_thread = threading.Thread(
+            target=self._check_version_update, name="version-check", daemon=True
+        )
+        self._version_check_thread.start()
+
+    def _get_update_info(self) -> Optional[Dict]:
+        """等待后台版本检查完成并返回更新信息"""
+        if self._version_check_thread:
+            self._version_check_thread.join()
+        return self.update_info
+
     def _check_version_update(self) -> None:
         """检查版本更新"""
         try:
@@ -4205,23 +5122,48 @@ class NewsAnalyzer:
         """获取当前模式的策略配置"""
         return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
 
-    def _has_notification_configured(self) -> bool:
-        """检查是否配置了任何通知渠道"""
+    def _has_notification_configured(self, channels: Optional[Dict] = None) -> bool:
+        """检查是否配置了任何通知渠道，默认检查全局配置"""
+        if channels is None:
+            channels = CONFIG
         return any(
             [
-                CONFIG["FEISHU_WEBHOOK_URL"],
-                CONFIG["DINGTALK_WEBHOOK_URL"],
-                CONFIG["WEWORK_WEBHOOK_URL"],
-                (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]),
+                channels["FEISHU_WEBHOOK_URL"],
+                channels["DINGTALK_WEBHOOK_URL"],
+                channels["WEWORK_WEBHOOK_URL"],
+                (channels["TELEGRAM_BOT_TOKEN"] and channels["TELEGRAM_CHAT_ID"]),
                 (
-                    CONFIG["EMAIL_FROM"]
-                    and CONFIG["EMAIL_PASSWORD"]
-                    and CONFIG["EMAIL_TO"]
+                    channels["EMAIL_FROM"]
+                    and channels["EMAIL_PASSWORD"]
+                    and channels["EMAIL_TO"]
                 ),
-                (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"]),
+                (channels["NTFY_SERVER_URL"] and channels["NTFY_TOPIC"]),
             ]
         )
 
+    def _load_frequency_words(
+        self, profile: Optional[SubscriberProfile] = None
+    ) -> Tuple[List[Dict], List[str]]:
+        """加载主配置或订阅配置的频率词"""
+        if profile is None:
+            return load_frequency_words()
+        return profile.load_frequency_words()
+
+    def _get_matcher(self, profile: Optional[SubscriberProfile] = None):
+        """
+        获取主配置或订阅配置的匹配器
+
+        所有配置共用一个批量匹配器：每个标题只在第一次出现时对全部配置匹配一次，
+        新增订阅配置不会重复遍历标题
+        """
+        if self._profile_matcher is None:
+            self._profile_matcher = MultiProfileMatcher(
+                [load_frequency_words()]
+                + [item.load_frequency_words() for item in self.profiles]
+            )
+        index = 0 if profile is None else self.profiles.index(profile) + 1
+        return self._profile_matcher.view(index)
+
     def _has_valid_content(
         self, stats: List[Dict], new_titles: Optional[Dict] = None
     ) -> bool:
@@ -4238,7 +5180,7 @@ class NewsAnalyzer:
             return has_matched_news or has_new_news
 
     def _load_analysis_data(
-        self,
+        self, profile: Optional[SubscriberProfile] = None
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
         """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
         try:
@@ -4249,9 +5191,9 @@ class NewsAnalyzer:
 
             print(f"当前监控平台: {current_platform_ids}")
 
-            all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
-            )
+            if self._today_data is None:
+                self._today_data = load_today_data(current_platform_ids)
+            all_results, id_to_name, title_info, new_titles = self._today_data
 
             if not all_results:
                 print("没有找到当天的数据")
@@ -4260,8 +5202,7 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
-            word_groups, filter_words = load_frequency_words()
+            word_groups, filter_words = self._load_frequency_words(profile)
 
             return (
                 all_results,
@@ -4279,20 +5220,10 @@ class NewsAnalyzer:
         """从当前抓取结果构建标题信息"""
         title_info = {}
         for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
+            title_info[source_id] = {
+                title: TitleRecord.from_data(title_data, time_info)
+                for title, title_data in titles_data.items()
+            }
         return title_info
 
     def _run_analysis_pipeline(
@@ -4306,8 +5237,10 @@ class NewsAnalyzer:
         id_to_name: Dict,
         failed_ids: Optional[List] = None,
         is_daily_summary: bool = False,
+        profile: Optional[SubscriberProfile] = None,
     ) -> Tuple[List[Dict], str]:
         """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        matcher = self._get_matcher(profile)
 
         # 统计计算
         stats, total_titles = count_word_frequency(
@@ -4319,6 +5252,7 @@ class NewsAnalyzer:
             self.rank_threshold,
             new_titles,
             mode=mode,
+            matcher=matcher,
         )
 
         # HTML生成
@@ -4330,7 +5264,9 @@ class NewsAnalyzer:
             id_to_name=id_to_name,
             mode=mode,
             is_daily_summary=is_daily_summary,
-            update_info=self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
+            update_info=self._get_update_info() if CONFIG["SHOW_VERSION_UPDATE"] else None,
+            profile=profile.name if profile else None,
+            matcher=matcher,
         )
 
         return stats, html_file
@@ -4344,9 +5280,11 @@ class NewsAnalyzer:
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         html_file_path: Optional[str] = None,
+        profile: Optional[SubscriberProfile] = None,
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
-        has_notification = self._has_notification_configured()
+        channels = profile.channels if profile else CONFIG
+        has_notification = self._has_notification_configured(channels)
 
         if (
             CONFIG["ENABLE_NOTIFICATION"]
@@ -4359,10 +5297,13 @@ class NewsAnalyzer:
                 report_type,
                 new_titles,
                 id_to_name,
-                self.update_info,
+                self._get_update_info(),
                 self.proxy_url,
                 mode=mode,
                 html_file_path=html_file_path,
+                channels=channels,
+                profile=profile.name if profile else None,
+                matcher=self._get_matcher(profile),
             )
             return True
         elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
@@ -4386,7 +5327,9 @@ class NewsAnalyzer:
 
         return False
 
-    def _generate_summary_report(self, mode_strategy: Dict) -> Optional[str]:
+    def _generate_summary_report(
+        self, mode_strategy: Dict, profile: Optional[SubscriberProfile] = None
+    ) -> Optional[str]:
         """生成汇总报告（带通知）"""
         summary_type = (
             "当前榜单汇总" if mode_strategy["summary_mode"] == "current" else "当日汇总"
@@ -4394,7 +5337,7 @@ class NewsAnalyzer:
         print(f"生成{summary_type}报告...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        analysis_data = self._load_analysis_data(profile)
         if not analysis_data:
             return None
 
@@ -4412,6 +5355,7 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            profile=profile,
         )
 
         print(f"{summary_type}报告已生成: {html_file}")
@@ -4425,17 +5369,20 @@ class NewsAnalyzer:
             new_titles=new_titles,
             id_to_name=id_to_name,
             html_file_path=html_file,
+            profile=profile,
         )
 
         return html_file
 
-    def _generate_summary_html(self, mode: str = "daily") -> Optional[str]:
+    def _generate_summary_html(
+        self, mode: str = "daily", profile: Optional[SubscriberProfile] = None
+    ) -> Optional[str]:
         """生成汇总HTML"""
         summary_type = "当前榜单汇总" if mode == "current" else "当日汇总"
         print(f"生成{summary_type}HTML...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        analysis_data = self._load_analysis_data(profile)
         if not analysis_data:
             return None
 
@@ -4453,6 +5400,7 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            profile=profile,
         )
 
         print(f"{summary_type}HTML已生成: {html_file}")
@@ -4478,6 +5426,8 @@ class NewsAnalyzer:
         mode_strategy = self._get_mode_strategy()
         print(f"报告模式: {self.report_mode}")
         print(f"运行模式: {mode_strategy['description']}")
+        if self.profiles:
+            print(f"订阅配置: {', '.join(profile.name for profile in self.profiles)}")
 
     def _crawl_data(self) -> Tuple[Dict, Dict, List]:
         """执行数据爬取"""
@@ -4491,33 +5441,40 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        if self.data_fetcher.max_workers > 1:
+            print(
+                f"开始并发爬取数据，最大并发 {self.data_fetcher.max_workers}，"
+                f"单主机限速 {CONFIG['HOST_RATE_LIMIT']} 次/秒"
+            )
+        else:
+            print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
             ids, self.request_interval
         )
 
-        title_file = save_titles_to_file(results, id_to_name, failed_ids)
-        print(f"标题已保存到: {title_file}")
+        save_snapshot(results, id_to_name, failed_ids, self.data_fetcher.unchanged_ids)
 
         return results, id_to_name, failed_ids
 
-    def _execute_mode_strategy(
-        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
-    ) -> Optional[str]:
-        """执行模式特定逻辑"""
-        # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+    def _run_realtime_report(
+        self,
+        mode_strategy: Dict,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        current_title_info: Optional[Dict],
+        profile: Optional[SubscriberProfile] = None,
+    ) -> Tuple[List[Dict], str]:
+        """生成本次爬取的报告，需要时发送实时通知"""
+        new_titles = self._latest_new_titles
+        word_groups, filter_words = self._load_frequency_words(profile)
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
             # 加载完整的历史数据（已按当前平台过滤）
-            analysis_data = self._load_analysis_data()
+            analysis_data = self._load_analysis_data(profile)
             if analysis_data:
                 (
                     all_results,
@@ -4541,6 +5498,7 @@ class NewsAnalyzer:
                     filter_words,
                     historical_id_to_name,
                     failed_ids=failed_ids,
+                    profile=profile,
                 )
 
                 combined_id_to_name = {**historical_id_to_name, **id_to_name}
@@ -4548,7 +5506,6 @@ class NewsAnalyzer:
                 print(f"HTML报告已生成: {html_file}")
 
                 # 发送实时通知（使用完整历史数据的统计结果）
-                summary_html = None
                 if mode_strategy["should_send_realtime"]:
                     self._send_notification_if_needed(
                         stats,
@@ -4558,26 +5515,26 @@ class NewsAnalyzer:
                         new_titles=historical_new_titles,
                         id_to_name=combined_id_to_name,
                         html_file_path=html_file,
+                        profile=profile,
                     )
             else:
                 print("❌ 严重错误：无法读取刚保存的数据文件")
                 raise RuntimeError("数据一致性检查失败：保存后立即读取失败")
         else:
-            title_info = self._prepare_current_title_info(results, time_info)
             stats, html_file = self._run_analysis_pipeline(
                 results,
                 self.report_mode,
-                title_info,
+                current_title_info,
                 new_titles,
                 word_groups,
                 filter_words,
                 id_to_name,
                 failed_ids=failed_ids,
+                profile=profile,
             )
             print(f"HTML报告已生成: {html_file}")
 
             # 发送实时通知（如果需要）
-            summary_html = None
             if mode_strategy["should_send_realtime"]:
                 self._send_notification_if_needed(
                     stats,
@@ -4587,30 +5544,95 @@ class NewsAnalyzer:
                     new_titles=new_titles,
                     id_to_name=id_to_name,
                     html_file_path=html_file,
+                    profile=profile,
                 )
 
-        # 生成汇总报告（如果需要）
-        summary_html = None
-        if mode_strategy["should_generate_summary"]:
-            if mode_strategy["should_send_realtime"]:
-                # 如果已经发送了实时通知，汇总只生成HTML不发送通知
-                summary_html = self._generate_summary_html(
-                    mode_strategy["summary_mode"]
+        return stats, html_file
+
+    def _run_summary(
+        self, mode_strategy: Dict, profile: Optional[SubscriberProfile] = None
+    ) -> Optional[str]:
+        """生成汇总报告（如果需要）"""
+        if not mode_strategy["should_generate_summary"]:
+            return None
+        if mode_strategy["should_send_realtime"]:
+            # 如果已经发送了实时通知，汇总只生成HTML不发送通知
+            return self._generate_summary_html(mode_strategy["summary_mode"], profile)
+        # daily模式：直接生成汇总报告并发送通知
+        return self._generate_summary_report(mode_strategy, profile)
+
+    def _run_profiles(
+        self,
+        mode_strategy: Dict,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        current_title_info: Optional[Dict],
+    ) -> None:
+        """按各订阅配置生成报告并推送，共用本次爬取结果和当天数据"""
+        for profile in self.profiles:
+            print(f"\n订阅配置 [{profile.name}]（频率词: {profile.frequency_file}）")
+            try:
+                self._run_realtime_report(
+                    mode_strategy,
+                    results,
+                    id_to_name,
+                    failed_ids,
+                    current_title_info,
+                    profile,
                 )
-            else:
-                # daily模式：直接生成汇总报告并发送通知
-                summary_html = self._generate_summary_report(mode_strategy)
+                self._run_summary(mode_strategy, profile)
+            except Exception as e:
+                # 单个订阅配置出错不影响其他订阅配置
+                print(f"订阅配置 [{profile.name}] 处理失败: {e}")
+
+    def _execute_mode_strategy(
+        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+    ) -> Optional[str]:
+        """执行模式特定逻辑"""
+        # 获取当前监控平台ID列表
+        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+
+        # 新增标题在保存本次快照前检测；当天聚合增量合并，保存后再加载只需合并本次快照
+        self._latest_new_titles = new_titles = detect_latest_new_titles(
+            current_platform_ids
+        )
+        time_info = save_snapshot(
+            results, id_to_name, failed_ids, self.data_fetcher.unchanged_ids
+        )
+        # 所有模式共用同一次加载的当天数据（当前模式、汇总报告、订阅配置均复用）
+        self._today_data = load_today_data(current_platform_ids)
+        current_title_info = (
+            None
+            if self.report_mode == "current"
+            else self._prepare_current_title_info(results, time_info)
+        )
+
+        stats, html_file = self._run_realtime_report(
+            mode_strategy, results, id_to_name, failed_ids, current_title_info
+        )
+        summary_html = self._run_summary(mode_strategy)
+
+        if self.profiles:
+            self._run_profiles(
+                mode_strategy, results, id_to_name, failed_ids, current_title_info
+            )
 
         # 生成Markdown报告
-        if MARKDOWN_AVAILABLE:
-            self._generate_markdown_report(stats, failed_ids, new_titles, id_to_name)
-        
+        markdown_generator = load_markdown_generator()
+        if markdown_generator:
+            self._generate_markdown_report(
+                markdown_generator, stats, failed_ids, new_titles, id_to_name
+            )
+
         # 推送到GitHub（如果启用）
-        if self.github_service and MARKDOWN_AVAILABLE:
+        if self.github_service and markdown_generator:
             self._push_to_github_only()
 
         # 打开浏览器（仅在非容器环境）
         if self._should_open_browser() and html_file:
+            import webbrowser
+
             if summary_html:
                 summary_url = "file://" + str(Path(summary_html).resolve())
                 print(f"正在打开汇总报告: {summary_url}")
@@ -4629,6 +5651,7 @@ class NewsAnalyzer:
 
     def _generate_markdown_report(
         self,
+        markdown_generator,
         stats: List[Dict],
         failed_ids: Optional[List] = None,
         new_titles: Optional[Dict] = None,
@@ -4643,9 +5666,14 @@ class NewsAnalyzer:
             base_dir = CONFIG.get("OUTPUT_BASE_DIR", "output")
             date_folder = format_date_folder()
             output_dir = f"{base_dir}/{date_folder}"
+
+            # 两份Markdown报告共用同一份报告数据中的格式化结果
+            report_data = prepare_report_data(
+                stats, failed_ids, new_titles, id_to_name, self.report_mode
+            )
             
             # 1. 生成当前时间点的Markdown报告
-            current_markdown_content = generate_markdown_report(
+            current_markdown_content = markdown_generator.generate_markdown_report(
                 stats=stats,
                 total_titles=sum(stat["count"] for stat in stats),
                 report_mode=self.report_mode,
@@ -4653,10 +5681,11 @@ class NewsAnalyzer:
                 new_titles=new_titles,
                 id_to_name=id_to_name,
                 is_daily_summary=False,  # 当前时间点报告
+                report_data=report_data,
             )
             
             # 保存当前时间点的Markdown文件（文件名带时间戳）
-            current_markdown_file = save_markdown_report(
+            current_markdown_file = markdown_generator.save_markdown_report(
                 current_markdown_content,
                 output_dir=output_dir,
                 filename=None,  # 自动生成带时间戳的文件名
@@ -4665,7 +5694,7 @@ class NewsAnalyzer:
             print(f"✅ 当前时间点Markdown已生成: {current_markdown_file}")
             
             # 2. 生成每日汇总Markdown报告
-            summary_markdown_content = generate_markdown_report(
+            summary_markdown_content = markdown_generator.generate_markdown_report(
                 stats=stats,
                 total_titles=sum(stat["count"] for stat in stats),
                 report_mode=self.report_mode,
@@ -4673,10 +5702,11 @@ class NewsAnalyzer:
                 new_titles=new_titles,
                 id_to_name=id_to_name,
                 is_daily_summary=True,  # 每日汇总报告
+                report_data=report_data,
             )
             
             # 保存每日汇总Markdown文件（固定文件名，每次覆盖）
-            summary_markdown_file = save_markdown_report(
+            summary_markdown_file = markdown_generator.save_markdown_report(
                 summary_markdown_content,
                 output_dir=output_dir,
                 filename="README.md",  # 每日汇总文件
@@ -4739,6 +5769,11 @@ class NewsAnalyzer:
         """执行分析流程"""
         try:
             self._initialize_and_check_config()
+            self._today_data = None
+            self._latest_new_titles = {}
+            self._profile_matcher = None
+            self._version_check_thread = None
+            self._start_version_check()
 
             mode_strategy = self._get_mode_strategy()
 
@@ -4750,11 +5785,85 @@ class NewsAnalyzer:
             print(f"分析流程执行出错: {e}")
             raise
 
+    def run_daemon(
+        self, schedule: Optional[str] = None, immediate_run: Optional[bool] = None
+    ) -> None:
+        """
+        常驻运行：按 cron 表达式在进程内定时执行 run()
+        当天聚合、频率词匹配器、HTTP 连接池和抓取状态在两次运行之间保留在内存中，
+        收到 SIGTERM/SIGINT 后等待当前任务完成再退出
+        """
+        cron = CronSchedule(schedule or CONFIG["DAEMON_SCHEDULE"])
+        if immediate_run is None:
+            immediate_run = CONFIG["DAEMON_IMMEDIATE_RUN"]
+        self._daemon_mode = True
+
+        stop_event = threading.Event()
+
+        def handle_stop(signum, frame):
+            print(f"收到退出信号 ({signal.Signals(signum).name})，当前任务完成后退出")
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, handle_stop)
+        signal.signal(signal.SIGINT, handle_stop)
+
+        print(f"常驻模式启动，执行计划: {cron.expression}")
+        if immediate_run:
+            self._run_scheduled()
+
+        while not stop_event.is_set():
+            next_run = cron.next_after(get_beijing_time())
+            print(f"下次执行时间: {next_run.strftime('%Y-%m-%d %H:%M')}")
+            delay = (next_run - get_beijing_time()).total_seconds()
+            if stop_event.wait(max(delay, 0)):
+                break
+            self._run_scheduled()
+
+        close_http_session()
+        close_smtp_connections()
+        print("常驻模式已退出")
+
+    def _run_scheduled(self) -> None:
+        """执行一次定时任务，异常只记录不退出"""
+        start_time = time.time()
+        try:
+            self.run()
+            print(f"本次任务完成，耗时 {time.time() - start_time:.1f} 秒")
+        except Exception as e:
+            print(f"本次任务执行失败（{time.time() - start_time:.1f} 秒）: {e}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="TrendRadar 热点新闻聚合")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="常驻运行，按 cron 表达式在进程内定时执行",
+    )
+    parser.add_argument(
+        "--schedule",
+        help="常驻模式的 cron 表达式，默认读取 CRON_SCHEDULE 环境变量或 daemon.schedule 配置",
+    )
+    parser.add_argument(
+        "--no-immediate-run",
+        action="store_true",
+        help="常驻模式启动时不立即执行一次",
+    )
+    return parser.parse_args(argv)
+
 
 def main():
+    args = parse_args()
     try:
         analyzer = NewsAnalyzer()
-        analyzer.run()
+        if args.daemon:
+            analyzer.run_daemon(
+                args.schedule, False if args.no_immediate_run else None
+            )
+        else:
+            analyzer.run()
+            close_smtp_connections()
     except FileNotFoundError as e:
         print(f"❌ 配置文件错误: {e}")
         print("\n请确保以下文件存在:")
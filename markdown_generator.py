@@ -30,6 +30,64 @@ def format_rank_display(ranks: List[int], rank_threshold: int) -> str:
             return f"[{min_rank}-{max_rank}]"
 
 
+def format_news_line(title_data: Dict) -> str:
+    """格式化热点词汇下的单条新闻（序号之后的部分）"""
+    is_new = title_data.get("is_new", False)
+    new_badge = "🆕 " if is_new else ""
+    
+    source_name = title_data["source_name"]
+    title = title_data["title"]
+    
+    # 排名信息
+    ranks = title_data.get("ranks", [])
+    rank_threshold = title_data.get("rank_threshold", 10)
+    rank_display = format_rank_display(ranks, rank_threshold)
+    
+    # 时间信息
+    time_display = title_data.get("time_display", "")
+    
+    # 出现次数
+    count_info = title_data.get("count", 1)
+    count_text = f"({count_info}次)" if count_info > 1 else ""
+    
+    # 链接（与新增热点区域一致，优先使用PC端链接）
+    url = (
+        title_data.get("url")
+        or title_data.get("mobile_url")
+        or title_data.get("mobileUrl", "")
+    )
+    
+    # 构建新闻条目
+    line = f"{new_badge}**[{source_name}]** "
+    
+    if url:
+        line += f"[{title}]({url})"
+    else:
+        line += title
+    
+    if rank_display:
+        line += f" {rank_display}"
+    
+    if time_display:
+        line += f" `{time_display}`"
+    
+    if count_text:
+        line += f" {count_text}"
+    
+    return line
+
+
+def _get_news_line(title_data: Dict) -> str:
+    """读取报告数据中缓存的 Markdown 新闻条目，没有缓存时直接格式化"""
+    cache = title_data.get("formatted")
+    if cache is None:
+        return format_news_line(title_data)
+    line = cache.get("markdown")
+    if line is None:
+        line = cache["markdown"] = format_news_line(title_data)
+    return line
+
+
 def generate_markdown_report(
     stats: List[Dict],
     total_titles: int,
@@ -38,6 +96,7 @@ def generate_markdown_report(
     new_titles: Optional[Dict] = None,
     id_to_name: Optional[Dict] = None,
     is_daily_summary: bool = False,
+    report_data: Optional[Dict] = None,
 ) -> str:
     """
     生成Markdown格式的新闻报告
@@ -50,11 +109,16 @@ def generate_markdown_report(
         new_titles: 新增新闻数据
         id_to_name: 平台ID到名称的映射
         is_daily_summary: 是否为每日汇总报告
+        report_data: main.prepare_report_data 生成的报告数据（可选），
+            提供时复用其中已格式化的新闻条目
         
     Returns:
         Markdown格式的报告内容
     """
     now = datetime.now()
+    processed_stats = (
+        {stat["word"]: stat for stat in report_data["stats"]} if report_data else {}
+    )
     
     # 构建Markdown文档
     markdown_lines = []
@@ -115,47 +179,12 @@ def generate_markdown_report(
             markdown_lines.append(f"**匹配新闻：** {count} 条")
             markdown_lines.append("")
             
-            # 新闻列表
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_badge = "🆕 " if is_new else ""
-                
-                source_name = title_data["source_name"]
-                title = title_data["title"]
-                
-                # 排名信息
-                ranks = title_data.get("ranks", [])
-                rank_threshold = title_data.get("rank_threshold", 10)
-                rank_display = format_rank_display(ranks, rank_threshold)
-                
-                # 时间信息
-                time_display = title_data.get("time_display", "")
-                
-                # 出现次数
-                count_info = title_data.get("count", 1)
-                count_text = f"({count_info}次)" if count_info > 1 else ""
-                
-                # 链接
-                url = title_data.get("mobile_url") or title_data.get("url", "")
-                
-                # 构建新闻条目
-                line = f"{j}. {new_badge}**[{source_name}]** "
-                
-                if url:
-                    line += f"[{title}]({url})"
-                else:
-                    line += title
-                
-                if rank_display:
-                    line += f" {rank_display}"
-                
-                if time_display:
-                    line += f" `{time_display}`"
-                
-                if count_text:
-                    line += f" {count_text}"
-                
-                markdown_lines.append(line)
+            # 新闻列表（有报告数据时使用其中的标题，格式化结果缓存在标题上，两份报告共用）
+            titles = stat["titles"]
+            if word in processed_stats:
+                titles = processed_stats[word]["titles"]
+            for j, title_data in enumerate(titles, 1):
+                markdown_lines.append(f"{j}. {_get_news_line(title_data)}")
             
             markdown_lines.append("")
     
@@ -514,7 +514,7 @@ async def get_system_status() -> str:
     """
     获取系统运行状态和健康检查信息
 
-    返回系统版本、数据统计、缓存状态等信息
+    返回系统版本、数据统计、缓存状态、各平台健康状态（熔断器）等信息
 
     Returns:
         JSON格式的系统状态信息
@@ -1,56 +1,218 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现有界的 LRU + TTL 缓存机制，提升数据访问性能。
+
+- 每个条目在写入时记录自己的存活时间
+- 条目数和估算内存占用超过上限时，先清理过期条目，再按最近最少使用淘汰
+- 统计命中、未命中、淘汰和过期次数，长时间运行的 HTTP MCP 服务内存不会无限增长
 """
 
+import sys
 import time
-from typing import Any, Optional
+from array import array
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
 from threading import Lock
 
 
+# 默认上限：条目数和估算内存占用
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 写入时未指定存活时间的默认值（秒）
+DEFAULT_TTL = 900
+
+_MISSING = object()
+
+_slot_names_cache: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """类及其父类声明的 __slots__ 属性名"""
+    names = _slot_names_cache.get(cls)
+    if names is None:
+        collected = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            collected.extend(
+                name for name in slots if name not in ("__dict__", "__weakref__")
+            )
+        names = _slot_names_cache[cls] = tuple(collected)
+    return names
+
+
+def estimate_size(value: Any) -> int:
+    """
+    估算对象占用的内存字节数（递归统计容器及其元素，共享对象只计一次）
+
+    除内置容器外，还会进入 __slots__ 对象（如 TitleRecord）的各个属性和实例的 __dict__；
+    array 的 sys.getsizeof 已包含已分配的元素缓冲区
+
+    Args:
+        value: 缓存值
+
+    Returns:
+        估算的字节数
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, array, type, ModuleType)):
+            continue
+        else:
+            for name in _slot_names(type(obj)):
+                attr = getattr(obj, name, _MISSING)
+                if attr is not _MISSING:
+                    stack.append(attr)
+            instance_dict = getattr(obj, "__dict__", None)
+            if isinstance(instance_dict, dict):
+                stack.append(instance_dict)
+
+    return total
+
+
+class _CacheEntry:
+    """缓存条目"""
+
+    __slots__ = ("value", "created_at", "ttl", "size")
+
+    def __init__(self, value: Any, ttl: float, size: int):
+        self.value = value
+        self.created_at = time.time()
+        self.ttl = ttl
+        self.size = size
+
+    def is_expired(self, now: float, ttl: Optional[float] = None) -> bool:
+        """是否过期，ttl 为读取方要求的最长存活时间，与写入时的存活时间取较小值"""
+        limit = self.ttl if ttl is None else min(self.ttl, ttl)
+        return now - self.created_at >= limit
+
+
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: float = DEFAULT_TTL,
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最多缓存的条目数
+            max_bytes: 估算内存占用上限（字节）
+            default_ttl: 写入时未指定存活时间的默认值（秒）
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.default_ttl = default_ttl
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+
+    def _remove(self, key: str) -> _CacheEntry:
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+        return entry
+
+    def _remove_expired(self, now: float, ttl: Optional[float] = None) -> int:
+        expired_keys = [
+            key for key, entry in self._cache.items() if entry.is_expired(now, ttl)
+        ]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def _is_over_limit(self) -> bool:
+        return (
+            len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes
+        )
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 最长存活时间（秒），与写入时的存活时间取较小值；不传时按写入时的存活时间
 
         Returns:
             缓存的值，如果不存在或已过期则返回None
         """
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
-
-    def set(self, key: str, value: Any) -> None:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.is_expired(time.time(), ttl):
+                # 已过期，删除缓存
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），默认使用 default_ttl
         """
+        size = estimate_size(value)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+
+            # 单个值超过内存上限时不缓存，避免清空其他所有条目
+            if size > self.max_bytes:
+                self._rejected += 1
+                return
+
+            self._cache[key] = _CacheEntry(
+                value, self.default_ttl if ttl is None else ttl, size
+            )
+            self._total_bytes += size
+
+            if self._is_over_limit():
+                # 先清理过期条目，仍超限时淘汰最近最少使用的条目
+                self._remove_expired(time.time())
+                while self._is_over_limit():
+                    self._remove(next(iter(self._cache)))
+                    self._evictions += 1
 
     def delete(self, key: str) -> bool:
         """
@@ -64,8 +226,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -73,30 +234,20 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[float] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 最长存活时间（秒），与写入时的存活时间取较小值；不传时按写入时的存活时间
 
         Returns:
             清理的条目数量
         """
         with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
-
-            return len(expired_keys)
+            return self._remove_expired(time.time(), ttl)
 
     def get_stats(self) -> dict:
         """
@@ -106,16 +257,22 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            now = time.time()
+            created = [entry.created_at for entry in self._cache.values()]
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected": self._rejected,
+                "oldest_entry_age": now - min(created) if created else 0,
+                "newest_entry_age": now - max(created) if created else 0,
             }
 
 
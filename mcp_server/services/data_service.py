@@ -4,6 +4,7 @@
 提供统一的数据查询接口,封装数据访问逻辑。
 """
 
+import json
 import re
 from collections import Counter
 from datetime import datetime, timedelta
@@ -49,7 +50,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -97,7 +98,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)  # 15分钟缓存
 
         return result
 
@@ -134,7 +135,7 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -177,7 +178,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -214,9 +215,27 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
+        # 历史数据库覆盖的日期一次性按索引查询，其余日期逐日读取快照文件
+        db_dates = set()
+        db = self.parser.history_db
+        if db:
+            start_str = start_date.strftime("%Y-%m-%d")
+            end_str = end_date.strftime("%Y-%m-%d")
+            db_dates = set(db.get_dates(start_str, end_str))
+            for item in db.search_titles(keyword, start_str, end_str, platforms):
+                ranks = item["ranks"]
+                item["count"] = len(ranks)
+                item["avg_rank"] = round(sum(ranks) / len(ranks), 2) if ranks else 0
+                results.append(item)
+                platform_distribution[item["platform"]] += 1
+
         # 遍历日期范围
         current_date = start_date
         while current_date <= end_date:
+            if current_date.strftime("%Y-%m-%d") in db_dates:
+                current_date += timedelta(days=1)
+                continue
+
             try:
                 all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
                     date=current_date,
@@ -253,6 +272,8 @@ class DataService:
             # 下一天
             current_date += timedelta(days=1)
 
+        results.sort(key=lambda item: item["date"])
+
         if not results:
             raise DataNotFoundError(
                 f"未找到包含关键词 '{keyword}' 的新闻",
@@ -282,6 +303,61 @@ class DataService:
             }
         }
 
+    def get_topic_daily_counts(
+        self,
+        topic: str,
+        start_date: datetime,
+        end_date: datetime,
+        sample_size: int = 3
+    ) -> Dict[str, Dict]:
+        """
+        统计话题在日期范围内每天出现的标题数
+
+        历史数据库覆盖的日期通过索引查询，其余日期逐日读取快照文件
+
+        Args:
+            topic: 话题关键词
+            start_date: 开始日期
+            end_date: 结束日期
+            sample_size: 每天保留的样本标题数
+
+        Returns:
+            {"YYYY-MM-DD": {"count": 匹配标题数, "sample_titles": [...]}}，没有数据的日期不包含在内
+        """
+        daily = {}
+        db = self.parser.history_db
+        if db:
+            daily = db.get_topic_daily_counts(
+                topic,
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%d"),
+                sample_size
+            )
+
+        current_date = start_date
+        while current_date <= end_date:
+            date_str = current_date.strftime("%Y-%m-%d")
+            if date_str not in daily:
+                try:
+                    all_titles, _, _ = self.parser.read_all_titles_for_date(date=current_date)
+
+                    matched_titles = []
+                    for _, titles in all_titles.items():
+                        for title in titles.keys():
+                            if topic.lower() in title.lower():
+                                matched_titles.append(title)
+
+                    daily[date_str] = {
+                        "count": len(matched_titles),
+                        "sample_titles": matched_titles[:sample_size]
+                    }
+                except DataNotFoundError:
+                    pass
+
+            current_date += timedelta(days=1)
+
+        return daily
+
     def get_trending_topics(
         self,
         top_n: int = 10,
@@ -305,7 +381,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"trending_topics:{top_n}:{mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -318,8 +394,18 @@ class DataService:
                 suggestion="请确保爬虫已经运行并生成了数据"
             )
 
-        # 加载关键词配置
-        word_groups = self.parser.parse_frequency_words()
+        # 加载关键词配置（与 main.py 共用缓存的配置和匹配器）
+        frequency_config = self.parser.get_frequency_config()
+        if frequency_config is None:
+            word_groups, matcher = [], None
+        else:
+            word_groups, matcher = frequency_config.word_groups, frequency_config.matcher
+        keywords = {
+            word
+            for group in word_groups
+            for word in group["required"] + group["normal"]
+            if word
+        }
 
         # 根据mode选择要处理的标题数据
         titles_to_process = {}
@@ -358,17 +444,17 @@ class DataService:
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
-                # 对每个关键词组进行匹配
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
+                if matcher is None:
+                    continue
 
-                    for word in all_words:
-                        if word and word in title:
-                            word_frequency[word] += 1
+                # 一次扫描得到标题命中的所有关键词
+                matched_words, _ = matcher.match(title)
+                for word in matched_words & keywords:
+                    word_frequency[word] += 1
 
-                            if word not in keyword_to_news:
-                                keyword_to_news[word] = []
-                            keyword_to_news[word].append(title)
+                    if word not in keyword_to_news:
+                        keyword_to_news[word] = []
+                    keyword_to_news[word].append(title)
 
         # 获取TOP N关键词
         top_keywords = word_frequency.most_common(top_n)
@@ -396,7 +482,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)  # 30分钟缓存
 
         return result
 
@@ -423,7 +509,7 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
@@ -491,7 +577,7 @@ class DataService:
             result = {}
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=3600)  # 1小时缓存
 
         return result
 
@@ -593,6 +679,12 @@ class DataService:
             except:
                 pass
 
+        platforms = self.get_platform_health()
+        open_circuits = [
+            platform_id for platform_id, info in platforms.items()
+            if info["state"] == "open"
+        ]
+
         return {
             "system": {
                 "version": version,
@@ -604,5 +696,46 @@ class DataService:
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
             },
             "cache": self.cache.get_stats(),
-            "health": "healthy"
+            "platforms": platforms,
+            "health": "degraded" if open_circuits else "healthy"
+        }
+
+    def get_platform_health(self) -> Dict:
+        """
+        读取爬虫记录的平台健康状态（熔断器）
+
+        Returns:
+            {platform_id: {state, consecutive_failures, ...}}，无记录时返回空字典
+        """
+        health_file = (
+            self.parser.project_root
+            / self.parser.fetch_state_dir
+            / "platform_health.json"
+        )
+        if not health_file.exists():
+            return {}
+
+        try:
+            with open(health_file, "r", encoding="utf-8") as f:
+                states = json.load(f)
+        except Exception:
+            return {}
+
+        def format_time(timestamp):
+            if not timestamp:
+                return None
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+        return {
+            platform_id: {
+                "state": state.get("state", "closed"),
+                "consecutive_failures": state.get("consecutive_failures", 0),
+                "total_successes": state.get("total_successes", 0),
+                "total_failures": state.get("total_failures", 0),
+                "opened_at": format_time(state.get("opened_at")),
+                "last_success": format_time(state.get("last_success")),
+                "last_failure": format_time(state.get("last_failure")),
+                "last_error": state.get("last_error", ""),
+            }
+            for platform_id, state in states.items()
         }
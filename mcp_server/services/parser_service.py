@@ -1,7 +1,7 @@
 """
 文件解析服务
 
-提供txt格式新闻数据和YAML配置文件的解析功能。
+提供txt格式/二进制快照新闻数据和YAML配置文件的解析功能。
 """
 
 import re
@@ -15,6 +15,28 @@ import yaml
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
+try:
+    from snapshot_store import SnapshotStore
+except ImportError:
+    SnapshotStore = None
+
+try:
+    from history_db import HistoryDatabase
+except ImportError:
+    HistoryDatabase = None
+
+try:
+    from title_records import TitleRecord, intern_text
+except ImportError:
+    TitleRecord = None
+    intern_text = None
+
+try:
+    from frequency_config import FrequencyWordsConfig, get_frequency_config
+except ImportError:
+    FrequencyWordsConfig = None
+    get_frequency_config = None
+
 
 class ParserService:
     """文件解析服务类"""
@@ -38,6 +60,8 @@ class ParserService:
         
         # 加载输出目录配置
         self._load_output_config()
+
+        self._history_db = None
     
     def _load_output_config(self):
         """从配置文件加载输出目录配置"""
@@ -49,13 +73,41 @@ class ParserService:
                     output_config = config_data.get("output", {})
                     self.base_dir = output_config.get("base_dir", "output")
                     self.txt_dir_override = output_config.get("txt_dir", "")
+                    self.fetch_state_dir = output_config.get(
+                        "fetch_state_dir", "output/.fetch_state"
+                    )
+                    self.snapshot_format = output_config.get("snapshot_format", "txt")
+                    self.history_db_path = output_config.get("history_db", "")
             else:
                 self.base_dir = "output"
                 self.txt_dir_override = ""
+                self.fetch_state_dir = "output/.fetch_state"
+                self.snapshot_format = "txt"
+                self.history_db_path = ""
         except Exception as e:
             print(f"加载输出目录配置失败: {e}，使用默认值")
             self.base_dir = "output"
             self.txt_dir_override = ""
+            self.fetch_state_dir = "output/.fetch_state"
+            self.snapshot_format = "txt"
+            self.history_db_path = ""
+
+    @property
+    def history_db(self):
+        """
+        SQLite 历史数据库（只读）
+
+        Returns:
+            HistoryDatabase 实例，未配置或数据库文件不存在时返回 None
+        """
+        if self._history_db is None and self.history_db_path and HistoryDatabase:
+            db_file = self.project_root / self.history_db_path
+            if db_file.exists():
+                try:
+                    self._history_db = HistoryDatabase(str(db_file), read_only=True)
+                except Exception as e:
+                    print(f"Warning: 打开历史数据库失败: {e}")
+        return self._history_db
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -74,7 +126,7 @@ class ParserService:
         title = title.strip()
         return title
 
-    def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict]:
+    def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict, List]:
         """
         解析单个txt文件的标题数据
 
@@ -82,9 +134,10 @@ class ParserService:
             file_path: txt文件路径
 
         Returns:
-            (titles_by_id, id_to_name) 元组
+            (titles_by_id, id_to_name, unchanged_ids) 元组
             - titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
             - id_to_name: {platform_id: platform_name}
+            - unchanged_ids: 内容与上一次抓取相同、只记录了ID的平台列表
 
         Raises:
             FileParseError: 文件解析错误
@@ -94,6 +147,7 @@ class ParserService:
 
         titles_by_id = {}
         id_to_name = {}
+        unchanged_ids = []
 
         try:
             with open(file_path, "r", encoding="utf-8") as f:
@@ -104,6 +158,22 @@ class ParserService:
                     if not section.strip() or "==== 以下ID请求失败 ====" in section:
                         continue
 
+                    # 内容未变化的平台只有 id | name 行
+                    if "==== 以下ID内容未变化 ====" in section:
+                        for header_line in section.strip().split("\n")[1:]:
+                            header_line = header_line.strip()
+                            if not header_line:
+                                continue
+                            if " | " in header_line:
+                                source_id, name = header_line.split(" | ", 1)
+                                source_id = source_id.strip()
+                                id_to_name[source_id] = name.strip()
+                            else:
+                                source_id = header_line
+                                id_to_name.setdefault(source_id, source_id)
+                            unchanged_ids.append(source_id)
+                        continue
+
                     lines = section.strip().split("\n")
                     if len(lines) < 2:
                         continue
@@ -163,7 +233,7 @@ class ParserService:
         except Exception as e:
             raise FileParseError(str(file_path), str(e))
 
-        return titles_by_id, id_to_name
+        return titles_by_id, id_to_name, unchanged_ids
 
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
@@ -193,7 +263,7 @@ class ParserService:
 
         Returns:
             (all_titles, id_to_name, all_timestamps) 元组
-            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, ...}}}
+            - all_titles: {platform_id: {title: TitleRecord}}，记录支持 ranks/url/mobileUrl 等字典键访问
             - id_to_name: {platform_id: platform_name}
             - all_timestamps: {filename: timestamp}
 
@@ -211,13 +281,121 @@ class ParserService:
         is_today = (date is None) or (date.date() == datetime.now().date())
         ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
 
-        cached = self.cache.get(cache_key, ttl=ttl)
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
-        # 缓存未命中，读取文件
+        # 缓存未命中，优先查询历史数据库
         date_folder = self.get_date_folder_name(date)
-        
+
+        db = self.history_db
+        db_date = (date or datetime.now()).strftime("%Y-%m-%d")
+        if db and db.has_date(db_date):
+            result = db.get_titles_for_date(db_date, platform_ids)
+            if not result[0]:
+                raise DataNotFoundError(
+                    f"{date_folder} 没有有效的数据",
+                    suggestion="请检查数据文件格式或重新运行爬虫"
+                )
+            self.cache.set(cache_key, result, ttl=ttl)
+            return result
+
+        # 数据库中没有该日期，读取快照文件
+
+        all_titles = {}
+        id_to_name = {}
+        all_timestamps = {}
+        # 各平台最近一次完整记录的榜单，用于还原"内容未变化"的平台
+        last_titles_by_id = {}
+
+        for snapshot_name, timestamp, titles_by_id, file_id_to_name, unchanged_ids in self._iter_snapshots_for_date(date_folder):
+            for platform_id, titles in titles_by_id.items():
+                last_titles_by_id[platform_id] = {
+                    title: {**info, "ranks": list(info["ranks"])}
+                    for title, info in titles.items()
+                }
+            for platform_id in unchanged_ids:
+                if platform_id in last_titles_by_id:
+                    titles_by_id[platform_id] = {
+                        title: {**info, "ranks": list(info["ranks"])}
+                        for title, info in last_titles_by_id[platform_id].items()
+                    }
+
+            # 更新id_to_name
+            id_to_name.update(file_id_to_name)
+
+            # 合并标题数据
+            for platform_id, titles in titles_by_id.items():
+                # 如果指定了平台过滤
+                if platform_ids and platform_id not in platform_ids:
+                    continue
+
+                if platform_id not in all_titles:
+                    all_titles[platform_id] = {}
+
+                platform_titles = all_titles[platform_id]
+                for title, info in titles.items():
+                    record = platform_titles.get(title)
+                    if TitleRecord is None:
+                        if record is None:
+                            platform_titles[title] = {**info, "ranks": list(info["ranks"])}
+                        else:
+                            record["ranks"].extend(info["ranks"])
+                    elif record is None:
+                        platform_titles[intern_text(title)] = TitleRecord(
+                            info["ranks"], info.get("url", ""), info.get("mobileUrl", "")
+                        )
+                    else:
+                        # 合并排名
+                        record.add_ranks(info["ranks"], unique=False)
+                        record.count += 1
+
+            # 记录快照时间戳
+            all_timestamps[snapshot_name] = timestamp
+
+        if not all_titles:
+            raise DataNotFoundError(
+                f"{date_folder} 没有有效的数据",
+                suggestion="请检查数据文件格式或重新运行爬虫"
+            )
+
+        # 缓存结果
+        result = (all_titles, id_to_name, all_timestamps)
+        self.cache.set(cache_key, result, ttl=ttl)
+
+        return result
+
+    def _iter_snapshots_for_date(self, date_folder: str):
+        """
+        按时间顺序读取指定日期的所有快照
+
+        配置为二进制存储且存在快照时直接按列读取，否则逐个解析txt文件
+
+        Args:
+            date_folder: 日期文件夹名称
+
+        Yields:
+            (snapshot_name, timestamp, titles_by_id, id_to_name, unchanged_ids)
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        if self.snapshot_format == "binary" and SnapshotStore is not None:
+            store = SnapshotStore(
+                str(self.project_root / self.base_dir / date_folder / "snapshots")
+            )
+            if store.exists():
+                for time_name, titles_by_id, id_to_name, unchanged_ids, _ in store.iter_snapshots():
+                    try:
+                        timestamp = datetime.strptime(
+                            f"{date_folder}{time_name}", "%Y年%m月%d日%H时%M分"
+                        ).timestamp()
+                    except ValueError:
+                        timestamp = 0
+                    # 与txt文件名保持一致，便于按文件名统计时间分布
+                    yield f"{time_name}.txt", timestamp, titles_by_id, id_to_name, unchanged_ids
+                return
+
         # 使用配置的目录
         if self.txt_dir_override:
             txt_dir = self.project_root / self.txt_dir_override
@@ -230,10 +408,6 @@ class ParserService:
                 suggestion="请先运行爬虫或检查日期是否正确"
             )
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
         # 读取所有txt文件
         txt_files = sorted(txt_dir.glob("*.txt"))
 
@@ -245,46 +419,12 @@ class ParserService:
 
         for txt_file in txt_files:
             try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
-
-                # 更新id_to_name
-                id_to_name.update(file_id_to_name)
-
-                # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
-
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
-
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
-
-                # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
-
+                titles_by_id, id_to_name, unchanged_ids = self.parse_txt_file(txt_file)
             except Exception as e:
                 # 忽略单个文件的解析错误，继续处理其他文件
                 print(f"Warning: 解析文件 {txt_file} 失败: {e}")
                 continue
-
-        if not all_titles:
-            raise DataNotFoundError(
-                f"{date_folder} 没有有效的数据",
-                suggestion="请检查数据文件格式或重新运行爬虫"
-            )
-
-        # 缓存结果
-        result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
-
-        return result
+            yield txt_file.name, txt_file.stat().st_mtime, titles_by_id, id_to_name, unchanged_ids
 
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
@@ -314,15 +454,15 @@ class ParserService:
         except Exception as e:
             raise FileParseError(str(config_path), str(e))
 
-    def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
+    def get_frequency_config(self, words_file: str = None) -> Optional["FrequencyWordsConfig"]:
         """
-        解析关键词配置文件
+        获取与 main.py 共用的频率词配置（进程内缓存，文件变化时自动重新加载）
 
         Args:
             words_file: 关键词文件路径，默认为 config/frequency_words.txt
 
         Returns:
-            词组列表
+            频率词配置，文件不存在时返回 None
 
         Raises:
             FileParseError: 文件解析错误
@@ -333,50 +473,42 @@ class ParserService:
             words_file = Path(words_file)
 
         if not words_file.exists():
-            return []
+            return None
 
-        word_groups = []
+        if get_frequency_config is None:
+            raise FileParseError(str(words_file), "无法导入 frequency_config 模块")
 
         try:
-            with open(words_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # 使用 | 分隔符
-                    parts = [p.strip() for p in line.split("|")]
-                    if not parts:
-                        continue
-
-                    group = {
-                        "required": [],
-                        "normal": [],
-                        "filter_words": []
-                    }
+            return get_frequency_config(str(words_file))
+        except Exception as e:
+            raise FileParseError(str(words_file), str(e))
 
-                    for part in parts:
-                        if not part:
-                            continue
+    def parse_frequency_words(self, words_file: str = None) -> List[Dict]:
+        """
+        解析关键词配置文件
 
-                        words = [w.strip() for w in part.split(",")]
-                        for word in words:
-                            if not word:
-                                continue
-                            if word.endswith("+"):
-                                # 必须词
-                                group["required"].append(word[:-1])
-                            elif word.endswith("!"):
-                                # 过滤词
-                                group["filter_words"].append(word[:-1])
-                            else:
-                                # 普通词
-                                group["normal"].append(word)
+        Args:
+            words_file: 关键词文件路径，默认为 config/frequency_words.txt
 
-                    if group["required"] or group["normal"]:
-                        word_groups.append(group)
+        Returns:
+            词组列表，每个词组包含 required/normal/excluded/group_key，
+            以及全局生效的 filter_words
 
-        except Exception as e:
-            raise FileParseError(str(words_file), str(e))
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        config = self.get_frequency_config(words_file)
+        if config is None:
+            return []
 
-        return word_groups
+        # 返回副本，避免调用方修改共享的缓存配置
+        return [
+            {
+                "required": list(group["required"]),
+                "normal": list(group["normal"]),
+                "excluded": list(group.get("excluded", [])),
+                "group_key": group["group_key"],
+                "filter_words": list(config.filter_words),
+            }
+            for group in config.word_groups
+        ]
@@ -10,6 +10,11 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 
+try:
+    from news_weight import calculate_news_weights
+except ImportError:
+    calculate_news_weights = None
+
 from ..services.data_service import DataService
 from ..utils.validators import (
     validate_platforms,
@@ -25,7 +30,7 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
     计算新闻权重（用于排序）
 
-    基于 main.py 的权重算法实现，综合考虑：
+    与 main.py 共用 news_weight 模块的权重算法（单独安装 MCP 服务时使用下方的等价实现），综合考虑：
     - 排名权重 (60%)：新闻在榜单中的排名
     - 频次权重 (30%)：新闻出现的次数
     - 热度权重 (10%)：高排名出现的比例
@@ -37,6 +42,9 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     Returns:
         权重分数（0-100之间的浮点数）
     """
+    if calculate_news_weights is not None:
+        return calculate_news_weights([news_data], rank_threshold)[0]
+
     ranks = news_data.get("ranks", [])
     if not ranks:
         return 0.0
@@ -49,29 +57,37 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     HOTNESS_WEIGHT = 0.1
 
     # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
-
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    rank_weight = sum(11 - min(rank, 10) for rank in ranks) / len(ranks)
 
     # 2. 频次权重：min(出现次数, 10) × 10
     frequency_weight = min(count, 10) * 10
 
     # 3. 热度加成：高排名次数 / 总出现次数 × 100
     high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    hotness_weight = high_rank_count / len(ranks) * 100
 
     # 综合权重
-    total_weight = (
+    return (
         rank_weight * RANK_WEIGHT
         + frequency_weight * FREQUENCY_WEIGHT
         + hotness_weight * HOTNESS_WEIGHT
     )
 
-    return total_weight
+
+def sort_news_by_weight(news_list: List[Dict], rank_threshold: int = 5) -> None:
+    """
+    按权重从高到低原地排序，所有新闻的权重一次批量计算
+
+    Args:
+        news_list: 新闻数据字典列表，包含 ranks 和 count 字段
+        rank_threshold: 高排名阈值，默认5
+    """
+    if calculate_news_weights is not None:
+        weights = calculate_news_weights(news_list, rank_threshold)
+    else:
+        weights = [calculate_news_weight(news, rank_threshold) for news in news_list]
+    order = sorted(range(len(news_list)), key=weights.__getitem__, reverse=True)
+    news_list[:] = [news_list[i] for i in order]
 
 
 class AnalyticsTools:
@@ -306,38 +322,22 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 收集趋势数据（每天只保留前3个样本）
+            daily_counts = self.data_service.get_topic_daily_counts(
+                topic, start_date, end_date, sample_size=3
+            )
+
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                day = daily_counts.get(date_str, {"count": 0, "sample_titles": []})
+                trend_data.append({
+                    "date": date_str,
+                    "count": day["count"],
+                    "sample_titles": day["sample_titles"]
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -755,10 +755,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -1116,10 +1113,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -1508,31 +1502,18 @@ class AnalyticsTools:
                 start_date = end_date - timedelta(days=6)
 
             # 收集话题历史数据
+            daily_counts = self.data_service.get_topic_daily_counts(
+                topic, start_date, end_date
+            )
+
             lifecycle_data = []
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({
+                    "date": date_str,
+                    "count": daily_counts.get(date_str, {}).get("count", 0)
+                })
 
                 current_date += timedelta(days=1)
 
@@ -187,8 +187,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -45,15 +45,18 @@ class SystemManagementTools:
                     self.base_dir = output_config.get("base_dir", "output")
                     self.txt_dir_override = output_config.get("txt_dir", "")
                     self.html_dir_override = output_config.get("html_dir", "")
+                    self.snapshot_format = output_config.get("snapshot_format", "txt")
             else:
                 self.base_dir = "output"
                 self.txt_dir_override = ""
                 self.html_dir_override = ""
+                self.snapshot_format = "txt"
         except Exception as e:
             print(f"加载输出目录配置失败: {e}，使用默认值")
             self.base_dir = "output"
             self.txt_dir_override = ""
             self.html_dir_override = ""
+            self.snapshot_format = "txt"
 
     def get_system_status(self) -> Dict:
         """
@@ -115,11 +118,17 @@ class SystemManagementTools:
             import json
             import time
             import random
-            import requests
             from datetime import datetime
             import pytz
             import yaml
 
+            # 使用项目共享的连接池会话，多次触发爬取之间复用连接
+            try:
+                from http_client import get_http_session
+                http = get_http_session()
+            except ImportError:
+                import requests as http
+
             # 参数验证
             platforms = validate_platforms(platforms)
 
@@ -199,7 +208,7 @@ class SystemManagementTools:
 
                 while retries <= max_retries and not success:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = http.get(url, headers=headers, timeout=10)
                         response.raise_for_status()
 
                         data_text = response.text
@@ -365,6 +374,20 @@ class SystemManagementTools:
                             for id_value in failed_ids:
                                 f.write(f"{id_value}\n")
 
+                    # 二进制快照存储（与 main.py 的 snapshot_format 配置一致）
+                    snapshot_dir = None
+                    if self.snapshot_format == "binary":
+                        from snapshot_store import SnapshotStore
+
+                        snapshot_dir = self.project_root / self.base_dir / date_folder / "snapshots"
+                        cleaned_results = {
+                            id_value: {clean_title(title): info for title, info in title_data.items()}
+                            for id_value, title_data in results.items()
+                        }
+                        SnapshotStore(str(snapshot_dir)).append(
+                            time_filename, cleaned_results, id_to_name, failed_ids
+                        )
+
                     # 保存 html 文件（简化版）
                     html_content = self._generate_simple_html(results, id_to_name, failed_ids, now)
                     with open(html_file_path, "w", encoding="utf-8") as f:
@@ -378,6 +401,9 @@ class SystemManagementTools:
                         "txt": str(txt_file_path),
                         "html": str(html_file_path)
                     }
+                    if snapshot_dir:
+                        print(f"  快照: {snapshot_dir}")
+                        result["saved_files"]["snapshot"] = str(snapshot_dir)
                     result["note"] = "数据已持久化到 output 文件夹"
 
                 except Exception as e:
@@ -0,0 +1,179 @@
+# coding=utf-8
+"""
+新闻权重批量计算
+把所有待排序新闻的排名展平成一维数组，一次性计算排名/频次/热度三项权重并生成排序键，
+安装了 NumPy 时向量化计算，否则使用纯 Python 实现，两者结果完全一致
+
+权重公式：
+    排名权重 = Σ(11 - min(rank, 10)) / 出现次数
+    频次权重 = min(count, 10) × 10
+    热度加成 = 排名 <= rank_threshold 的次数 / 出现次数 × 100
+    总权重   = 排名权重 × RANK_WEIGHT + 频次权重 × FREQUENCY_WEIGHT + 热度加成 × HOTNESS_WEIGHT
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# 与 config.yaml 中 weight 节的默认值一致
+DEFAULT_WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+# 少量数据时 NumPy 的数组创建开销大于收益
+NUMPY_MIN_RANKS = 256
+
+
+def score_news_batch(
+    ranks: Sequence[int],
+    lengths: Sequence[int],
+    counts: Sequence[int],
+    rank_threshold: int,
+    weight_config: Optional[Dict] = None,
+) -> List[float]:
+    """
+    批量计算新闻权重
+
+    Args:
+        ranks: 所有新闻的排名依次拼接成的一维序列
+        lengths: 每条新闻的排名个数，sum(lengths) == len(ranks)
+        counts: 每条新闻的出现次数
+        rank_threshold: 高排名阈值
+        weight_config: 权重配置，键为 RANK_WEIGHT/FREQUENCY_WEIGHT/HOTNESS_WEIGHT
+
+    Returns:
+        每条新闻的权重，没有排名的新闻权重为 0
+    """
+    weight_config = weight_config or DEFAULT_WEIGHT_CONFIG
+    rank_factor = weight_config["RANK_WEIGHT"]
+    frequency_factor = weight_config["FREQUENCY_WEIGHT"]
+    hotness_factor = weight_config["HOTNESS_WEIGHT"]
+
+    if np is not None and len(ranks) >= NUMPY_MIN_RANKS:
+        return _score_news_numpy(
+            ranks,
+            lengths,
+            counts,
+            rank_threshold,
+            rank_factor,
+            frequency_factor,
+            hotness_factor,
+        )
+
+    weights = []
+    position = 0
+    for length, count in zip(lengths, counts):
+        if not length:
+            weights.append(0.0)
+            continue
+
+        rank_sum = 0
+        high_rank_count = 0
+        for rank in ranks[position : position + length]:
+            rank_sum += 11 - min(rank, 10)
+            if rank <= rank_threshold:
+                high_rank_count += 1
+        position += length
+
+        weights.append(
+            rank_sum / length * rank_factor
+            + min(count, 10) * 10 * frequency_factor
+            + high_rank_count / length * 100 * hotness_factor
+        )
+    return weights
+
+
+def _score_news_numpy(
+    ranks: Sequence[int],
+    lengths: Sequence[int],
+    counts: Sequence[int],
+    rank_threshold: int,
+    rank_factor: float,
+    frequency_factor: float,
+    hotness_factor: float,
+) -> List[float]:
+    """NumPy 向量化实现，整数部分按分段求和，浮点运算顺序与纯 Python 实现相同"""
+    rank_array = np.asarray(ranks, dtype=np.int64)
+    length_array = np.asarray(lengths, dtype=np.int64)
+    count_array = np.asarray(counts, dtype=np.int64)
+
+    segment_ids = np.repeat(np.arange(len(length_array)), length_array)
+    rank_sums = np.bincount(
+        segment_ids,
+        weights=11 - np.minimum(rank_array, 10),
+        minlength=len(length_array),
+    )
+    high_rank_counts = np.bincount(
+        segment_ids,
+        weights=rank_array <= rank_threshold,
+        minlength=len(length_array),
+    )
+
+    safe_lengths = np.maximum(length_array, 1)
+    weights = (
+        rank_sums / safe_lengths * rank_factor
+        + np.minimum(count_array, 10) * 10 * frequency_factor
+        + high_rank_counts / safe_lengths * 100 * hotness_factor
+    )
+    weights[length_array == 0] = 0.0
+    return weights.tolist()
+
+
+def calculate_news_weights(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    weight_config: Optional[Dict] = None,
+) -> List[float]:
+    """
+    计算一组新闻的权重
+
+    Args:
+        items: 新闻字典列表，包含 ranks 和可选的 count（默认为排名个数）
+        rank_threshold: 高排名阈值
+        weight_config: 权重配置
+
+    Returns:
+        与 items 一一对应的权重列表
+    """
+    ranks: List[int] = []
+    lengths: List[int] = []
+    counts: List[int] = []
+    for item in items:
+        item_ranks = item.get("ranks") or []
+        ranks.extend(item_ranks)
+        lengths.append(len(item_ranks))
+        counts.append(item.get("count", len(item_ranks)))
+    return score_news_batch(ranks, lengths, counts, rank_threshold, weight_config)
+
+
+def news_sort_keys(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    weight_config: Optional[Dict] = None,
+) -> List[Tuple[float, int, int]]:
+    """
+    生成报告排序键：(-权重, 最高排名, -出现次数)，升序排序即为权重从高到低
+
+    Args:
+        items: 新闻字典列表
+        rank_threshold: 高排名阈值
+        weight_config: 权重配置
+
+    Returns:
+        与 items 一一对应的排序键列表
+    """
+    weights = calculate_news_weights(items, rank_threshold, weight_config)
+    return [
+        (
+            -weight,
+            min(item["ranks"]) if item.get("ranks") else 999,
+            -item.get("count", 0),
+        )
+        for weight, item in zip(weights, items)
+    ]
@@ -0,0 +1,268 @@
+# coding=utf-8
+"""
+通知发件箱
+把每个渠道待推送的消息批次先写入 SQLite，推送成功后再标记完成：
+    - 每个批次带幂等键（渠道 + 推送目标 + 报告类型 + 批次序号 + 内容摘要），重复入队不会产生重复推送
+    - 推送失败的批次按指数退避重试，仍失败时保留在发件箱中，
+      下次运行先从失败的批次继续推送，已成功的批次不会重发
+    - 同一渠道的批次严格按入队顺序推送，前一批未成功时不会跳过它推送后面的批次
+
+发件箱不保存 webhook 地址、令牌和 Telegram chat_id 等推送目标信息，只保存推送目标的摘要，
+推送时使用当前配置中的地址；数据库默认位于 output/outbox.db，不随 docs/ 提交回仓库
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    channel TEXT NOT NULL,
+    target_key TEXT NOT NULL,
+    report_type TEXT NOT NULL,
+    batch_index INTEGER NOT NULL,
+    batch_total INTEGER NOT NULL,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    sent_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_outbox_pending ON outbox(channel, target_key, status, id);
+"""
+
+STATUS_PENDING = "pending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+STATUS_EXPIRED = "expired"
+
+
+def make_target_key(target: str) -> str:
+    """推送目标（webhook 地址等）的摘要，避免把密钥写入发件箱"""
+    return hashlib.sha1(target.encode("utf-8")).hexdigest()[:16]
+
+
+class NotificationOutbox:
+    """SQLite 通知发件箱（多个渠道线程共用一个实例）"""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_attempts: int = 5,
+        retries_per_run: int = 3,
+        backoff_seconds: float = 2.0,
+        max_backoff_seconds: float = 60.0,
+        expire_hours: float = 12,
+        retention_days: int = 7,
+    ):
+        """
+        打开发件箱
+
+        Args:
+            db_path: 数据库文件路径
+            max_attempts: 单个批次累计最多尝试次数，超过后标记为失败不再推送
+            retries_per_run: 单次运行中同一批次最多尝试次数，用完后留到下次运行
+            backoff_seconds: 首次重试前的等待秒数，之后每次翻倍
+            max_backoff_seconds: 重试等待的上限
+            expire_hours: 批次入队超过该时长仍未推送成功则过期，避免推送陈旧内容
+            retention_days: 已完成/失败/过期批次的保留天数
+        """
+        self.db_path = Path(db_path)
+        self.max_attempts = max(1, int(max_attempts))
+        self.retries_per_run = max(1, int(retries_per_run))
+        self.backoff_seconds = float(backoff_seconds)
+        self.max_backoff_seconds = float(max_backoff_seconds)
+        self.expire_seconds = float(expire_hours) * 3600
+        self.retention_seconds = float(retention_days) * 86400
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # 不使用 WAL：数据库保持单文件，便于 Docker 挂载目录中备份和迁移
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._cleanup()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    def _cleanup(self) -> None:
+        """过期长时间未推送的批次，删除超过保留期的已结束批次"""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE outbox SET status = ? WHERE status = ? AND created_at < ?",
+                (STATUS_EXPIRED, STATUS_PENDING, now - self.expire_seconds),
+            )
+            self.conn.execute(
+                "DELETE FROM outbox WHERE status != ? AND created_at < ?",
+                (STATUS_PENDING, now - self.retention_seconds),
+            )
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_seconds * (2 ** max(attempts - 1, 0)), self.max_backoff_seconds)
+
+    # --- 入队 ---
+
+    def enqueue(
+        self, channel: str, target_key: str, report_type: str, requests: List[Dict]
+    ) -> int:
+        """
+        批次入队，已存在相同幂等键的批次会被忽略
+
+        Args:
+            channel: 渠道标识，如 feishu
+            target_key: make_target_key 生成的推送目标摘要
+            report_type: 报告类型
+            requests: 按推送顺序排列的请求内容（可 JSON 序列化）
+
+        Returns:
+            新入队的批次数
+        """
+        now = time.time()
+        total = len(requests)
+        rows = []
+        for index, request in enumerate(requests, 1):
+            body = json.dumps(request, ensure_ascii=False, sort_keys=True)
+            digest = hashlib.sha1(
+                f"{channel}|{target_key}|{report_type}|{index}/{total}|{body}".encode(
+                    "utf-8"
+                )
+            ).hexdigest()
+            rows.append(
+                (digest, channel, target_key, report_type, index, total, body, now)
+            )
+
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO outbox (
+                    idempotency_key, channel, target_key, report_type,
+                    batch_index, batch_total, request, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            return self.conn.total_changes - before
+
+    # --- 推送 ---
+
+    def pending(self, channel: str, target_key: str) -> List[Tuple]:
+        """待推送批次 [(id, report_type, batch_index, batch_total, request, attempts)]，按入队顺序"""
+        with self._lock:
+            rows = self.conn.execute(
+                """
+                SELECT id, report_type, batch_index, batch_total, request, attempts
+                FROM outbox
+                WHERE channel = ? AND target_key = ? AND status = ?
+                ORDER BY id
+                """,
+                (channel, target_key, STATUS_PENDING),
+            ).fetchall()
+        return [row[:4] + (json.loads(row[4]), row[5]) for row in rows]
+
+    def mark_sent(self, row_id: int) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE outbox SET status = ?, sent_at = ?, last_error = '' WHERE id = ?",
+                (STATUS_SENT, time.time(), row_id),
+            )
+
+    def mark_failed_attempt(self, row_id: int, attempts: int, error: str) -> bool:
+        """
+        记录一次失败
+
+        Returns:
+            是否还可以继续重试（未达到累计最大尝试次数）
+        """
+        can_retry = attempts < self.max_attempts
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                UPDATE outbox
+                SET attempts = ?, last_error = ?, status = ?
+                WHERE id = ?
+                """,
+                (
+                    attempts,
+                    error[:500],
+                    STATUS_PENDING if can_retry else STATUS_FAILED,
+                    row_id,
+                ),
+            )
+        return can_retry
+
+    def deliver(
+        self,
+        channel: str,
+        target_key: str,
+        send: Callable[[Dict], Optional[str]],
+        rate_limiter=None,
+        log: Callable[[str], None] = print,
+        label: str = "",
+    ) -> Tuple[int, int]:
+        """
+        按顺序推送该渠道/目标的全部待推送批次
+
+        Args:
+            channel: 渠道标识
+            target_key: 推送目标摘要
+            send: 推送单个批次，成功返回 None，失败返回错误信息
+            rate_limiter: 推送目标的令牌桶（需提供 acquire() -> 排队秒数），每次请求前获取令牌
+            log: 日志输出函数
+            label: 日志中的渠道名称
+
+        Returns:
+            (成功推送的批次数, 仍待推送或失败的批次数)
+        """
+        pending = self.pending(channel, target_key)
+        sent = 0
+        for position, (row_id, report_type, index, total, request, attempts) in enumerate(
+            pending
+        ):
+            error = None
+            for retry in range(self.retries_per_run):
+                attempts += 1
+                queued = rate_limiter.acquire() if rate_limiter else 0.0
+                start = time.monotonic()
+                try:
+                    error = send(request)
+                except Exception as e:
+                    error = str(e)
+                latency = time.monotonic() - start
+
+                if error is None:
+                    self.mark_sent(row_id)
+                    log(
+                        f"{label}第 {index}/{total} 批次发送成功 [{report_type}]"
+                        f"（排队 {queued:.2f}s，发送 {latency:.2f}s）"
+                    )
+                    break
+
+                log(
+                    f"{label}第 {index}/{total} 批次发送失败 [{report_type}]，"
+                    f"第 {attempts} 次尝试：{error}"
+                )
+                if not self.mark_failed_attempt(row_id, attempts, error):
+                    log(f"{label}第 {index}/{total} 批次已达到最大尝试次数，放弃推送")
+                    break
+                if retry < self.retries_per_run - 1:
+                    time.sleep(self._backoff(retry + 1))
+
+            if error is not None:
+                # 保持批次顺序：当前批次未成功时不推送后面的批次，下次运行从这里继续
+                return sent, len(pending) - position
+
+            sent += 1
+
+        return sent, 0
@@ -0,0 +1,136 @@
+# coding=utf-8
+"""
+令牌桶限速
+爬虫按上游主机限速、推送按 webhook / 机器人限速共用同一个令牌桶实现
+
+推送按各平台文档中的频率限制，取代固定的批次间隔：
+    - 飞书自定义机器人：100 次/分钟，5 次/秒
+    - 钉钉自定义机器人：20 条/分钟
+    - 企业微信群机器人：20 条/分钟
+    - Telegram：同一群组约 20 条/分钟
+    - ntfy.sh：按访客限流，突发后每 5 秒补充一次
+
+推送令牌桶容量为 burst，补充速率为 (per_minute - burst) / 60，
+保证任意 60 秒窗口内的请求数不超过 per_minute
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# 渠道 -> {"per_minute": 每分钟上限, "burst": 突发容量}
+DEFAULT_RATE_LIMITS = {
+    "feishu": {"per_minute": 100, "burst": 5},
+    "dingtalk": {"per_minute": 20, "burst": 3},
+    "wework": {"per_minute": 20, "burst": 3},
+    "telegram": {"per_minute": 20, "burst": 3},
+    "ntfy": {"per_minute": 20, "burst": 5},
+}
+
+
+class TokenBucket:
+    """线程安全的令牌桶"""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 突发容量（空闲后可连续获取的令牌数）
+        """
+        self.capacity = max(1, int(capacity))
+        self.refill_rate = max(float(rate), 0.001)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, per_minute: float, burst: int = 1) -> "TokenBucket":
+        """
+        按分钟窗口创建令牌桶
+
+        Args:
+            per_minute: 任意 60 秒内允许的最大请求数
+            burst: 突发容量
+        """
+        capacity = max(1, int(burst))
+        per_minute = max(float(per_minute), capacity + 1)
+        return cls((per_minute - capacity) / 60, capacity)
+
+    def _reserve(self) -> float:
+        """预留一个令牌，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.refill_rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+    def acquire(self) -> float:
+        """
+        获取一个令牌，令牌不足时阻塞等待
+
+        Returns:
+            排队等待的秒数
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """按上游主机划分令牌桶的限速器"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: 每个主机每秒允许的请求数
+            capacity: 每个主机的突发容量
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """为目标 URL 所在主机获取一个令牌，返回排队等待的秒数"""
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+        return bucket.acquire()
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    channel: str, target_key: str, limits: Optional[Dict] = None
+) -> TokenBucket:
+    """
+    获取推送目标的令牌桶，同一进程内同一目标共用（并发渠道、多次运行之间都生效）
+
+    Args:
+        channel: 渠道标识，用于选择默认限速
+        target_key: 推送目标摘要，区分同一渠道的不同 webhook
+        limits: 覆盖默认限速的配置 {"per_minute": ..., "burst": ...}
+    """
+    config = dict(DEFAULT_RATE_LIMITS.get(channel, {"per_minute": 20, "burst": 1}))
+    config.update(limits or {})
+    key = f"{channel}|{target_key}|{config['per_minute']}|{config['burst']}"
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket.per_minute(
+                config["per_minute"], config["burst"]
+            )
+        return bucket
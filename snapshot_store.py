@@ -0,0 +1,375 @@
+# coding=utf-8
+"""
+二进制快照存储
+按天保存每次抓取的榜单快照，标题、平台ID、链接等字符串统一驻留到字符串表，
+榜单按列（平台、标题ID、排名、链接ID）追加写入，读取时无需文本解析
+
+目录结构（<日期目录>/snapshots/）：
+    strings.bin  追加写入的字符串表，"\\0" 分隔，0 号字符串固定为空串
+    blocks.bin   追加写入的快照数据块
+    index.bin    定长索引记录：时间名 / 数据块偏移 / 长度
+    .lock        写入锁，爬虫和 MCP trigger_crawl 同时追加同一天的快照时互斥
+"""
+
+import struct
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 没有 fcntl，不加锁
+    fcntl = None
+
+
+STRINGS_FILE = "strings.bin"
+BLOCKS_FILE = "blocks.bin"
+INDEX_FILE = "index.bin"
+LOCK_FILE = ".lock"
+
+# 时间名(utf-8, 32字节) + 数据块偏移 + 数据块长度 + 写入时字符串表大小
+INDEX_RECORD = struct.Struct("<32sQII")
+BLOCK_HEADER = struct.Struct("<4sII")
+BLOCK_MAGIC = b"TRS1"
+
+# 平台状态
+PLATFORM_FULL = 0
+PLATFORM_UNCHANGED = 1
+PLATFORM_FAILED = 2
+
+
+class SnapshotStore:
+    """单日快照存储"""
+
+    def __init__(self, day_dir: str):
+        """
+        初始化快照存储
+
+        Args:
+            day_dir: 快照目录，通常为 <base_dir>/<日期>/snapshots
+        """
+        self.day_dir = Path(day_dir)
+        self._strings: Optional[List[str]] = None
+        self._string_ids: Optional[Dict[str, int]] = None
+        self._strings_size = 0
+
+    # --- 字符串表 ---
+
+    def _load_strings(self) -> List[str]:
+        """加载字符串表（按文件大小增量刷新）"""
+        strings_path = self.day_dir / STRINGS_FILE
+        size = strings_path.stat().st_size if strings_path.exists() else 0
+
+        if self._strings is None or size < self._strings_size:
+            self._strings = [""]
+            self._string_ids = None
+            self._strings_size = 0
+
+        if size > self._strings_size:
+            with open(strings_path, "rb") as f:
+                f.seek(self._strings_size)
+                data = f.read(size - self._strings_size)
+            # 只接受完整写入的记录（以 "\0" 结尾）
+            end = data.rfind(b"\0") + 1
+            if end:
+                new_strings = data[: end - 1].decode("utf-8").split("\0")
+                if self._string_ids is not None:
+                    base = len(self._strings)
+                    for offset, value in enumerate(new_strings):
+                        self._string_ids.setdefault(value, base + offset)
+                self._strings.extend(new_strings)
+                self._strings_size += end
+
+        return self._strings
+
+    def _intern_all(self, values: List[str]) -> List[int]:
+        """驻留字符串，新字符串追加写入字符串表，返回ID列表"""
+        strings = self._load_strings()
+        if self._string_ids is None:
+            self._string_ids = {}
+            for string_id, value in enumerate(strings):
+                self._string_ids.setdefault(value, string_id)
+
+        string_ids = self._string_ids
+        new_strings = []
+        result = []
+        for value in values:
+            value = value.replace("\0", "")
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = len(strings)
+                strings.append(value)
+                string_ids[value] = string_id
+                new_strings.append(value)
+            result.append(string_id)
+
+        if new_strings:
+            data = ("\0".join(new_strings) + "\0").encode("utf-8")
+            with open(self.day_dir / STRINGS_FILE, "ab") as f:
+                f.write(data)
+            self._strings_size += len(data)
+
+        return result
+
+    # --- 索引 ---
+
+    def _read_index(self) -> List[Tuple[str, int, int, int]]:
+        """读取索引，忽略未写完整的尾部记录"""
+        index_path = self.day_dir / INDEX_FILE
+        if not index_path.exists():
+            return []
+
+        with open(index_path, "rb") as f:
+            data = f.read()
+
+        entries = []
+        usable = len(data) - len(data) % INDEX_RECORD.size
+        for name, offset, length, string_count in INDEX_RECORD.iter_unpack(
+            data[:usable]
+        ):
+            entries.append(
+                (name.rstrip(b"\0").decode("utf-8"), offset, length, string_count)
+            )
+        return entries
+
+    def exists(self) -> bool:
+        """是否已有快照"""
+        index_path = self.day_dir / INDEX_FILE
+        return index_path.exists() and index_path.stat().st_size >= INDEX_RECORD.size
+
+    def list_snapshots(self) -> List[str]:
+        """按写入顺序返回快照时间名"""
+        return [entry[0] for entry in self._read_index()]
+
+    def list_signatures(self) -> List[Tuple[str, str]]:
+        """按写入顺序返回 (时间名, 签名)，签名为数据块的偏移和长度，快照被覆盖时随之变化"""
+        return [
+            (name, f"{offset}:{length}") for name, offset, length, _ in self._read_index()
+        ]
+
+    # --- 写入 ---
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """持有当天快照目录的排他写锁（跨进程）"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.day_dir / LOCK_FILE, "a+b") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def append(
+        self,
+        time_name: str,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: Optional[List] = None,
+        unchanged_ids: Optional[List] = None,
+    ) -> None:
+        """
+        追加一次快照，时间名与最后一次快照相同时覆盖最后一次
+
+        Args:
+            time_name: 快照时间名，如 "10时05分"
+            results: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+            failed_ids: 请求失败的平台
+            unchanged_ids: 内容未变化、只记录ID的平台
+        """
+        self.day_dir.mkdir(parents=True, exist_ok=True)
+        failed_ids = failed_ids or []
+        unchanged_ids = unchanged_ids or []
+
+        platform_ids = []
+        statuses = array("B")
+        title_counts = array("I")
+        strings = []
+        ranks = array("H")
+
+        for platform_id, title_data in results.items():
+            platform_ids.append(platform_id)
+            if platform_id in unchanged_ids:
+                statuses.append(PLATFORM_UNCHANGED)
+                title_counts.append(0)
+                continue
+
+            statuses.append(PLATFORM_FULL)
+            rows = []
+            for title, info in title_data.items():
+                title_ranks = info.get("ranks", []) if isinstance(info, dict) else info
+                rank = title_ranks[0] if title_ranks else 1
+                rows.append(
+                    (
+                        min(max(int(rank), 0), 0xFFFF),
+                        title,
+                        info.get("url", "") if isinstance(info, dict) else "",
+                        info.get("mobileUrl", "") if isinstance(info, dict) else "",
+                    )
+                )
+            rows.sort(key=lambda row: row[0])
+            title_counts.append(len(rows))
+            for rank, title, url, mobile_url in rows:
+                ranks.append(rank)
+                strings.extend((title, url, mobile_url))
+
+        for platform_id in failed_ids:
+            if platform_id not in results:
+                platform_ids.append(platform_id)
+                statuses.append(PLATFORM_FAILED)
+                title_counts.append(0)
+
+        platform_names = [
+            id_to_name.get(platform_id) or platform_id for platform_id in platform_ids
+        ]
+        # 字符串表、数据块和索引在同一把锁内写入，避免并发追加交错分配字符串ID
+        with self._locked():
+            ids = self._intern_all(platform_ids + platform_names + strings)
+            platform_count = len(platform_ids)
+            platform_columns = array("I", ids[: platform_count * 2])
+            string_columns = array("I", ids[platform_count * 2 :])
+
+            payload = b"".join(
+                (
+                    BLOCK_HEADER.pack(BLOCK_MAGIC, platform_count, len(ranks)),
+                    platform_columns.tobytes(),
+                    statuses.tobytes(),
+                    title_counts.tobytes(),
+                    ranks.tobytes(),
+                    # 标题/URL/MOBILE 三列交错存储，读取时按步长切片
+                    string_columns.tobytes(),
+                )
+            )
+
+            entries = self._read_index()
+            blocks_path = self.day_dir / BLOCKS_FILE
+            index_path = self.day_dir / INDEX_FILE
+
+            if entries and entries[-1][0] == time_name:
+                # 同一分钟内重复写入：截断最后一个数据块和索引记录
+                offset = entries[-1][1]
+                entries = entries[:-1]
+                with open(blocks_path, "r+b") as f:
+                    f.truncate(offset)
+                with open(index_path, "r+b") as f:
+                    f.truncate(len(entries) * INDEX_RECORD.size)
+            else:
+                offset = blocks_path.stat().st_size if blocks_path.exists() else 0
+
+            with open(blocks_path, "ab") as f:
+                f.write(payload)
+
+            with open(index_path, "ab") as f:
+                f.write(
+                    INDEX_RECORD.pack(
+                        time_name.encode("utf-8")[:32],
+                        offset,
+                        len(payload),
+                        len(self._strings),
+                    )
+                )
+
+    # --- 读取 ---
+
+    def _decode_block(
+        self, data: bytes, strings: List[str]
+    ) -> Tuple[Dict, Dict, List, List]:
+        """解码数据块，返回 (titles_by_id, id_to_name, unchanged_ids, failed_ids)"""
+        magic, platform_count, title_count = BLOCK_HEADER.unpack_from(data)
+        if magic != BLOCK_MAGIC:
+            raise ValueError("快照数据块损坏")
+
+        position = BLOCK_HEADER.size
+
+        def read_column(typecode: str, count: int) -> array:
+            nonlocal position
+            column = array(typecode)
+            size = column.itemsize * count
+            column.frombytes(data[position : position + size])
+            position += size
+            return column
+
+        platform_columns = read_column("I", platform_count * 2)
+        statuses = read_column("B", platform_count)
+        title_counts = read_column("I", platform_count)
+        ranks = read_column("H", title_count)
+        string_columns = read_column("I", title_count * 3)
+
+        titles = [strings[i] for i in string_columns[0::3]]
+        urls = [strings[i] for i in string_columns[1::3]]
+        mobile_urls = [strings[i] for i in string_columns[2::3]]
+
+        titles_by_id = {}
+        id_to_name = {}
+        unchanged_ids = []
+        failed_ids = []
+
+        row = 0
+        for index in range(platform_count):
+            platform_id = strings[platform_columns[index]]
+            id_to_name[platform_id] = strings[platform_columns[platform_count + index]]
+            status = statuses[index]
+
+            if status == PLATFORM_UNCHANGED:
+                unchanged_ids.append(platform_id)
+                continue
+            if status == PLATFORM_FAILED:
+                failed_ids.append(platform_id)
+                continue
+
+            end = row + title_counts[index]
+            titles_by_id[platform_id] = {
+                titles[i]: {
+                    "ranks": [ranks[i]],
+                    "url": urls[i],
+                    "mobileUrl": mobile_urls[i],
+                }
+                for i in range(row, end)
+            }
+            row = end
+
+        return titles_by_id, id_to_name, unchanged_ids, failed_ids
+
+    def iter_snapshots(
+        self, time_names: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, Dict, Dict, List, List]]:
+        """
+        按写入顺序读取快照
+
+        Args:
+            time_names: 只读取指定时间名的快照，None 表示全部
+
+        Yields:
+            (time_name, titles_by_id, id_to_name, unchanged_ids, failed_ids)
+        """
+        entries = self._read_index()
+        if time_names is not None:
+            wanted = set(time_names)
+            entries = [entry for entry in entries if entry[0] in wanted]
+        if not entries:
+            return
+
+        strings = self._load_strings()
+        with open(self.day_dir / BLOCKS_FILE, "rb") as f:
+            for time_name, offset, length, string_count in entries:
+                if string_count > len(strings):
+                    raise ValueError(f"快照 {time_name} 的字符串表不完整")
+                f.seek(offset)
+                data = f.read(length)
+                yield (time_name, *self._decode_block(data, strings))
+
+    def read_snapshot(self, time_name: str) -> Tuple[Dict, Dict, List, List]:
+        """
+        读取单个快照
+
+        Returns:
+            (titles_by_id, id_to_name, unchanged_ids, failed_ids)
+        """
+        for _, *snapshot in self.iter_snapshots([time_name]):
+            return tuple(snapshot)
+        raise KeyError(time_name)
@@ -0,0 +1,131 @@
+# coding=utf-8
+"""
+订阅配置（多租户推送）
+一次爬取、一份当天数据，按多个订阅配置分别匹配、生成报告并推送：
+    - 每个订阅配置有自己的频率词文件和通知渠道
+    - 爬取、快照保存和当天数据加载只执行一次，新增一个订阅配置只增加匹配和渲染的开销
+    - 报告输出到 html/profiles/<名称>/，推送记录保存在 push_records_dir/profiles/<名称>/
+
+配置示例（config.yaml）：
+    profiles:
+      - name: "tech"
+        frequency_file: "config/profiles/tech.txt"
+        webhooks:
+          feishu_url: "${TECH_FEISHU_WEBHOOK_URL}"
+          email_to: "tech@example.com"
+
+渠道值写成 ${变量名} 时从环境变量读取，避免把 webhook 地址提交到仓库；
+邮件只需填写 email_to，发件账号和 SMTP 设置沿用全局配置
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from frequency_config import get_frequency_config
+
+
+# webhooks 配置项 -> 通知渠道配置键（与 CONFIG 中的键一致）
+PROFILE_CHANNEL_KEYS = {
+    "feishu_url": "FEISHU_WEBHOOK_URL",
+    "dingtalk_url": "DINGTALK_WEBHOOK_URL",
+    "wework_url": "WEWORK_WEBHOOK_URL",
+    "telegram_bot_token": "TELEGRAM_BOT_TOKEN",
+    "telegram_chat_id": "TELEGRAM_CHAT_ID",
+    "email_from": "EMAIL_FROM",
+    "email_password": "EMAIL_PASSWORD",
+    "email_to": "EMAIL_TO",
+    "email_smtp_server": "EMAIL_SMTP_SERVER",
+    "email_smtp_port": "EMAIL_SMTP_PORT",
+    "email_smtp_encryption": "EMAIL_SMTP_ENCRYPTION",
+    "ntfy_server_url": "NTFY_SERVER_URL",
+    "ntfy_topic": "NTFY_TOPIC",
+    "ntfy_token": "NTFY_TOKEN",
+}
+
+# 未在订阅配置中填写时沿用全局配置的项（发件账号、服务器地址等，不含推送目标）
+INHERITED_CHANNEL_KEYS = (
+    "EMAIL_FROM",
+    "EMAIL_PASSWORD",
+    "EMAIL_SMTP_SERVER",
+    "EMAIL_SMTP_PORT",
+    "EMAIL_SMTP_ENCRYPTION",
+    "NTFY_SERVER_URL",
+)
+
+PROFILE_NAME_PATTERN = re.compile(r"^[0-9A-Za-z_-]+$")
+ENV_REFERENCE_PATTERN = re.compile(r"^\$\{(\w+)\}$")
+
+
+def resolve_channel_value(value) -> str:
+    """渠道配置值，${变量名} 从环境变量读取"""
+    value = str(value or "").strip()
+    match = ENV_REFERENCE_PATTERN.match(value)
+    if match:
+        return os.environ.get(match.group(1), "").strip()
+    return value
+
+
+class SubscriberProfile:
+    """一个订阅配置：频率词文件 + 通知渠道"""
+
+    def __init__(self, name: str, frequency_file: str, channels: Dict[str, str]):
+        self.name = name
+        self.frequency_file = frequency_file
+        self.channels = channels
+
+    def load_frequency_words(self) -> Tuple[List[Dict], List[str]]:
+        """加载频率词配置，文件未变化时返回同一份解析结果"""
+        config = get_frequency_config(self.frequency_file)
+        return config.word_groups, config.filter_words
+
+    def __repr__(self) -> str:
+        return f"SubscriberProfile({self.name!r}, {self.frequency_file!r})"
+
+
+def parse_subscriber_profiles(
+    profiles_config: Optional[List[Dict]], base_channels: Dict
+) -> List[SubscriberProfile]:
+    """
+    解析订阅配置列表
+
+    Args:
+        profiles_config: config.yaml 中的 profiles 列表
+        base_channels: 全局通知渠道配置（CONFIG），提供可沿用的发件账号等设置
+
+    Returns:
+        订阅配置列表，配置有误的项会被跳过
+    """
+    profiles = []
+    names = set()
+
+    for index, item in enumerate(profiles_config or [], 1):
+        if not isinstance(item, dict) or item.get("enabled", True) is False:
+            continue
+
+        name = str(item.get("name", "")).strip()
+        if not PROFILE_NAME_PATTERN.match(name):
+            print(f"订阅配置 #{index} 名称无效（只能包含字母、数字、下划线和短横线），已忽略")
+            continue
+        if name in names:
+            print(f"订阅配置 {name} 重复，已忽略")
+            continue
+
+        frequency_file = str(item.get("frequency_file", "")).strip()
+        if not frequency_file or not os.path.exists(frequency_file):
+            print(f"订阅配置 {name} 的频率词文件不存在: {frequency_file}，已忽略")
+            continue
+
+        webhooks = item.get("webhooks") or {}
+        channels = {
+            key: resolve_channel_value(webhooks.get(option))
+            for option, key in PROFILE_CHANNEL_KEYS.items()
+        }
+        for key in INHERITED_CHANNEL_KEYS:
+            if not channels[key]:
+                channels[key] = base_channels.get(key, "")
+
+        names.add(name)
+        profiles.append(SubscriberProfile(name, frequency_file, channels))
+
+    return profiles
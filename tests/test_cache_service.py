@@ -0,0 +1,86 @@
+# coding=utf-8
+"""
+MCP 缓存内存估算测试：estimate_size 与 tracemalloc 实测值相差不超过一个小倍数
+"""
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.services.cache_service import CacheService, estimate_size  # noqa: E402
+from title_records import TitleRecord  # noqa: E402
+
+
+def build_all_titles(platforms: int = 10, titles: int = 300) -> dict:
+    """{platform_id: {title: TitleRecord}}，与 ParserService.read_all_titles_for_date 的缓存值结构一致"""
+    return {
+        f"platform-{p}": {
+            f"平台{p}第{i}条新闻标题：人工智能与新能源汽车行业动态": TitleRecord(
+                ranks=range(i % 30 + 1, i % 30 + 1 + i % 12),
+                url=f"https://example.com/{p}/news/{i}",
+                mobile_url=f"https://m.example.com/{p}/news/{i}",
+                first_time=f"{8 + i % 12:02d}时{i % 60:02d}分",
+                last_time=f"{9 + i % 12:02d}时{i % 60:02d}分",
+                count=i % 12,
+            )
+            for i in range(titles)
+        }
+        for p in range(platforms)
+    }
+
+
+def measure(factory):
+    """
+    返回 (对象, tracemalloc 实测的保留字节数)
+
+    先构造一次并丢弃，让 sys.intern 的全局字符串表提前扩容，扩容不计入缓存值本身
+    """
+    factory()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = factory()
+        gc.collect()
+        measured = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return value, measured
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        build_all_titles,
+        lambda: [{"title": f"新闻{i}", "ranks": list(range(i % 20))} for i in range(5000)],
+    ],
+    ids=["title_records", "plain_dicts"],
+)
+def test_estimate_close_to_measured(factory):
+    value, measured = measure(factory)
+    estimate = estimate_size(value)
+    assert measured / 1.5 <= estimate <= measured * 1.5
+
+
+def test_estimate_walks_slots_and_arrays():
+    record = TitleRecord(ranks=range(1000), url="https://example.com/only-here")
+    assert estimate_size(record) > sys.getsizeof(record) + 2 * 1000
+
+
+def test_byte_limit_counts_title_records():
+    all_titles = build_all_titles(platforms=2, titles=200)
+    size = estimate_size(all_titles)
+    cache = CacheService(max_entries=100, max_bytes=int(size * 1.5))
+
+    cache.set("day-1", all_titles)
+    cache.set("day-2", build_all_titles(platforms=2, titles=200))
+
+    stats = cache.get_stats()
+    assert stats["total_entries"] == 1
+    assert stats["evictions"] == 1
+    assert cache.get("day-1") is None
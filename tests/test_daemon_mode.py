@@ -0,0 +1,45 @@
+# coding=utf-8
+"""
+常驻模式测试：桌面环境下 --daemon 的定时运行不会自动打开浏览器
+"""
+
+import os
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def desktop_analyzer(monkeypatch):
+    monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+    monkeypatch.setattr(main.NewsAnalyzer, "_detect_docker_environment", lambda self: False)
+    monkeypatch.setattr(main, "close_http_session", lambda: None)
+    monkeypatch.setattr(main, "close_smtp_connections", lambda: None)
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    yield main.NewsAnalyzer()
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+
+def test_single_run_opens_browser(desktop_analyzer):
+    assert desktop_analyzer._should_open_browser()
+
+
+def test_daemon_ticks_do_not_open_browser(desktop_analyzer):
+    ticks = []
+
+    def fake_run():
+        ticks.append(desktop_analyzer._should_open_browser())
+        # 第一次定时运行后请求退出
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    desktop_analyzer.run = fake_run
+    desktop_analyzer.run_daemon("* * * * *", immediate_run=True)
+
+    assert ticks == [False]
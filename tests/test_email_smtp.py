@@ -0,0 +1,198 @@
+# coding=utf-8
+"""
+邮件发送测试：在本地线程中启动最小 SMTP 服务器，验证
+    - 多次发送复用同一连接（只 EHLO、登录一次）
+    - 服务器断开连接后只重连一次
+    - HTML 报告未变化（mtime、大小相同）时复用已编码的 MIME 部分
+    - close_smtp_connections() 发送 QUIT
+"""
+
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+FROM_EMAIL = "radar@example.com"
+TO_EMAIL = "reader@example.com"
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """只实现 smtplib 发送用到的命令，每条命令先记录再应答"""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        server = self.server
+        conn_id = server.register(self.connection)
+        server.record(conn_id, "CONNECT")
+        self.reply("220 localhost ESMTP test")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8").strip().split(" ", 1)[0].upper()
+            server.record(conn_id, command)
+
+            if command == server.drop_on:
+                # 只断开一次，模拟服务器在空闲检查之后关闭连接
+                server.drop_on = None
+                return
+            if command == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN")
+            elif command == "AUTH":
+                self.reply("235 2.7.0 Authentication successful")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                for data_line in iter(self.rfile.readline, b""):
+                    if data_line == b".\r\n":
+                        break
+                    body.append(data_line)
+                server.messages.append(b"".join(body))
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = []
+        self.events = []
+        self.messages = []
+        self.drop_on = None
+
+    def register(self, sock) -> int:
+        with self.lock:
+            self.connections.append(sock)
+            return len(self.connections)
+
+    def record(self, conn_id: int, command: str) -> None:
+        with self.lock:
+            self.events.append((conn_id, command))
+
+    def commands(self, command: str) -> list:
+        return [conn_id for conn_id, cmd in self.events if cmd == command]
+
+    def drop_connections(self) -> None:
+        for sock in self.connections:
+            sock.shutdown(socket.SHUT_RDWR)
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    monkeypatch.setattr(main, "_smtp_connections", {})
+    monkeypatch.setattr(main, "_email_html_parts", {})
+    server = LocalSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    main.close_smtp_connections()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def report_file(tmp_path):
+    path = tmp_path / "当日汇总.html"
+    path.write_text("<html><body><h1>热点报告</h1></body></html>", encoding="utf-8")
+    return path
+
+
+def send(server: LocalSMTPServer, html_file_path) -> bool:
+    return main.send_to_email(
+        FROM_EMAIL,
+        "password",
+        TO_EMAIL,
+        "当日汇总",
+        str(html_file_path),
+        custom_smtp_server="127.0.0.1",
+        custom_smtp_port=server.server_address[1],
+        smtp_encryption="NONE",
+    )
+
+
+def test_sends_reuse_one_connection(smtp_server, report_file):
+    assert send(smtp_server, report_file)
+    assert send(smtp_server, report_file)
+
+    assert smtp_server.commands("CONNECT") == [1]
+    assert smtp_server.commands("EHLO") == [1]
+    assert smtp_server.commands("AUTH") == [1]
+    assert smtp_server.commands("NOOP") == [1]
+    assert len(smtp_server.messages) == 2
+
+
+def test_idle_disconnect_reconnects_once(smtp_server, report_file):
+    assert send(smtp_server, report_file)
+    smtp_server.drop_connections()
+    assert send(smtp_server, report_file)
+
+    assert smtp_server.commands("CONNECT") == [1, 2]
+    assert smtp_server.commands("AUTH") == [1, 2]
+    assert len(smtp_server.messages) == 2
+
+
+def test_disconnect_after_noop_reconnects_once(smtp_server, report_file):
+    assert send(smtp_server, report_file)
+    smtp_server.drop_on = "MAIL"
+    assert send(smtp_server, report_file)
+
+    assert smtp_server.commands("CONNECT") == [1, 2]
+    assert smtp_server.commands("AUTH") == [1, 2]
+    assert smtp_server.commands("MAIL") == [1, 1, 2]
+    assert len(smtp_server.messages) == 2
+
+
+def test_html_part_cached_until_file_changes(smtp_server, report_file, monkeypatch):
+    builds = []
+    build_email_html_part = main.build_email_html_part
+
+    def counting_build(html_content):
+        builds.append(html_content)
+        return build_email_html_part(html_content)
+
+    monkeypatch.setattr(main, "build_email_html_part", counting_build)
+
+    assert send(smtp_server, report_file)
+    cached_part = main.get_email_html_part(str(report_file))
+    assert send(smtp_server, report_file)
+    assert len(builds) == 1
+    assert main.get_email_html_part(str(report_file)) is cached_part
+
+    # 内容变化（大小不同）后重新编码
+    stat = report_file.stat()
+    report_file.write_text("<html><body><h1>新的热点报告</h1></body></html>", encoding="utf-8")
+    os.utime(report_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert send(smtp_server, report_file)
+    assert len(builds) == 2
+    assert main.get_email_html_part(str(report_file)) is not cached_part
+
+
+def test_close_smtp_connections_sends_quit(smtp_server, report_file):
+    assert send(smtp_server, report_file)
+    assert smtp_server.commands("QUIT") == []
+
+    main.close_smtp_connections()
+
+    assert smtp_server.commands("QUIT") == [1]
+    assert main._smtp_connections == {}
@@ -0,0 +1,136 @@
+# coding=utf-8
+"""
+频率词配置测试
+    - 原有语法（普通词、+必须词、!过滤词）与以 - = / 开头的普通词含义不变
+    - 新规则（\\-组内排除词、\\=整词、\\/正则/）的解析与匹配
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frequency_config import (  # noqa: E402
+    MultiProfileMatcher,
+    WordGroupMatcher,
+    parse_frequency_words,
+)
+
+
+def group_keys(content: str, titles: list) -> list:
+    """按配置匹配每个标题，返回命中词组的 group_key（未命中为 None）"""
+    word_groups, filter_words = parse_frequency_words(content)
+    matcher = WordGroupMatcher(word_groups, filter_words)
+    return [
+        group["group_key"] if group else None
+        for group in map(matcher.find_group, titles)
+    ]
+
+
+def test_legacy_syntax_unchanged():
+    word_groups, filter_words = parse_frequency_words(
+        "华为\n+手机\n!广告\n\n苹果\n\n\n-5G\n=AI\n/etc/\n"
+    )
+
+    assert filter_words == ["广告"]
+    assert word_groups == [
+        {"required": ["手机"], "normal": ["华为"], "excluded": [], "group_key": "华为"},
+        {"required": [], "normal": ["苹果"], "excluded": [], "group_key": "苹果"},
+        {
+            "required": [],
+            "normal": ["-5G", "=AI", "/etc/"],
+            "excluded": [],
+            "group_key": "-5G =AI /etc/",
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("运营商推出-5G套餐", "-5G =AI /etc/"),
+        ("运营商推出5G套餐", None),
+        ("配置写成 =AI 的原样文本", "-5G =AI /etc/"),
+        ("OpenAI 发布新模型", None),
+        ("Linux 的 /etc/ 目录", "-5G =AI /etc/"),
+    ],
+)
+def test_legacy_prefixed_lines_match_as_substrings(title, expected):
+    assert group_keys("-5G\n=AI\n/etc/", [title]) == [expected]
+
+
+def test_new_rule_kinds_parsed():
+    word_groups, filter_words = parse_frequency_words(
+        "\\=AI\n\\/GPT-\\d+/\n\\-广告\n\\-\\=AD\n+\\=LLM\n\n!\\/推广|软文/\n"
+    )
+
+    assert filter_words == ["\\/推广|软文/"]
+    assert word_groups == [
+        {
+            "required": ["\\=LLM"],
+            "normal": ["\\=AI", "\\/GPT-\\d+/"],
+            "excluded": ["广告", "\\=AD"],
+            "group_key": "AI /GPT-\\d+/",
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("AI 芯片出口", "AI"),
+        ("OpenAI 发布新模型", None),
+        ("MAIL 服务故障", None),
+        ("ai-native 应用", "AI"),
+        ("人工智能（AI）监管", "AI"),
+    ],
+)
+def test_whole_word_rule(title, expected):
+    assert group_keys("\\=AI", [title]) == [expected]
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("GPT-5 正式发布", "/GPT-\\d+/"),
+        ("gpt-4o 降价", "/GPT-\\d+/"),
+        ("GPT 模型", None),
+    ],
+)
+def test_regex_rule(title, expected):
+    assert group_keys("\\/GPT-\\d+/", [title]) == [expected]
+
+
+def test_exclude_only_applies_to_own_group():
+    content = "手机\n\\-广告\n\\-\\=AD\n\n广告"
+    titles = ["新款手机发布", "手机广告投放", "手机 AD 投放", "手机 ADOBE 合作"]
+    assert group_keys(content, titles) == ["手机", "广告", None, "手机"]
+
+
+def test_filter_and_required_with_new_rules():
+    content = "+\\=AI\n芯片\n\n!\\/推广|软文/"
+    titles = ["AI 芯片突破", "OpenAI 芯片", "AI 芯片推广活动", "芯片产能"]
+    assert group_keys(content, titles) == ["芯片", None, None, None]
+
+
+def test_invalid_regex_ignored(capsys):
+    word_groups, _ = parse_frequency_words("\\/[未闭合/\n华为")
+    assert word_groups[0]["normal"] == ["华为"]
+    assert "频率词规则无效" in capsys.readouterr().out
+
+
+def test_shared_scanner_keeps_literal_and_rule_apart():
+    literal = parse_frequency_words("=AI")
+    rule = parse_frequency_words("\\=AI")
+    multi_matcher = MultiProfileMatcher([literal, rule])
+
+    assert [g and g["group_key"] for g in multi_matcher.match_all("AI 新闻")] == [
+        None,
+        "AI",
+    ]
+    assert [g and g["group_key"] for g in multi_matcher.match_all("=AI 原文")] == [
+        "=AI",
+        "AI",
+    ]
@@ -0,0 +1,57 @@
+# coding=utf-8
+"""
+MCP 新闻权重测试：单独安装 MCP 服务（没有根目录的 news_weight 模块）时，
+analytics 仍可导入，内置实现与 news_weight 的权重和排序完全一致
+"""
+
+import importlib
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import mcp_server.tools.analytics as analytics  # noqa: E402
+from news_weight import calculate_news_weights  # noqa: E402
+
+
+def make_news(count: int = 300) -> list:
+    rng = random.Random(7)
+    news = []
+    for i in range(count):
+        item = {"title": f"新闻{i}", "ranks": [rng.randint(1, 30) for _ in range(rng.randint(0, 8))]}
+        if rng.random() < 0.7:
+            item["count"] = rng.randint(1, 15)
+        news.append(item)
+    return news
+
+
+@pytest.fixture
+def fallback_analytics(monkeypatch):
+    # sys.modules 中为 None 时 import 抛出 ImportError
+    monkeypatch.setitem(sys.modules, "news_weight", None)
+    yield importlib.reload(analytics)
+    monkeypatch.undo()
+    importlib.reload(analytics)
+
+
+def test_analytics_uses_news_weight():
+    assert analytics.calculate_news_weights is calculate_news_weights
+
+
+@pytest.mark.parametrize("rank_threshold", [3, 5, 10])
+def test_fallback_matches_news_weight(fallback_analytics, rank_threshold):
+    assert fallback_analytics.calculate_news_weights is None
+
+    news = make_news()
+    expected = calculate_news_weights(news, rank_threshold)
+    assert [
+        fallback_analytics.calculate_news_weight(item, rank_threshold) for item in news
+    ] == expected
+
+    sorted_news = list(news)
+    fallback_analytics.sort_news_by_weight(sorted_news, rank_threshold)
+    order = sorted(range(len(news)), key=expected.__getitem__, reverse=True)
+    assert sorted_news == [news[i] for i in order]
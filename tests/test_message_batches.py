@@ -0,0 +1,189 @@
+# coding=utf-8
+"""
+消息分批测试
+    - MessageBatchBuilder 的分批结果与原实现（每次追加都重新编码整批内容）逐字节一致
+    - 词组标题/来源标题不会与第一条新闻拆到不同批次
+    - 除无法再拆分的单条内容外，批次不超过字节上限
+"""
+
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import pytz
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy"]
+# 150 小于任一词组的 标题+第一条新闻，覆盖单条内容超限的情况
+MAX_BYTES = [150, 600, 1500, 4000, 29000]
+FIXED_NOW = pytz.timezone("Asia/Shanghai").localize(datetime(2025, 1, 2, 8, 30, 0))
+
+NEWS_LINE = re.compile(r"^  (\d+\.|•) ", re.M)
+
+
+class LegacyBatchBuilder:
+    """原实现的分批逻辑：每次追加前把整批内容重新编码后与上限比较"""
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.base_header = base_header
+        self.base_footer = base_footer
+        self.max_bytes = max_bytes
+        self.batches = []
+        self.current_batch = base_header
+        self.has_content = False
+
+    def _fits(self, text: str) -> bool:
+        test_content = self.current_batch + text
+        return (
+            len(test_content.encode("utf-8")) + len(self.base_footer.encode("utf-8"))
+            < self.max_bytes
+        )
+
+    def add(self, text: str, restart_prefix: str = "") -> None:
+        if self._fits(text):
+            self.current_batch += text
+        else:
+            if self.has_content:
+                self.batches.append(self.current_batch + self.base_footer)
+            self.current_batch = self.base_header + restart_prefix + text
+        self.has_content = True
+
+    def add_if_fits(self, text: str) -> None:
+        if self._fits(text):
+            self.current_batch += text
+
+    def append(self, text: str) -> None:
+        self.current_batch += text
+
+    def finish(self):
+        if self.has_content:
+            self.batches.append(self.current_batch + self.base_footer)
+        return self.batches
+
+
+def make_title(index: int, source_name: str, is_new: bool = False) -> dict:
+    return {
+        "title": f"第{index}条测试新闻：人工智能芯片出口管制 {'细节' * (index % 7)}",
+        "source_name": source_name,
+        "ranks": [index % 10 + 1, index % 10 + 3],
+        "rank_threshold": 5,
+        "url": f"https://example.com/news/{index}",
+        "mobile_url": f"https://m.example.com/news/{index}" if index % 2 else "",
+        "time_display": f"[08:{index % 60:02d} ~ 09:00]" if index % 3 else "",
+        "count": index % 4 + 1,
+        "is_new": is_new,
+    }
+
+
+def make_report(group_count: int = 6, new_sources: int = 3, failed: int = 2) -> dict:
+    stats = []
+    for i in range(group_count):
+        titles = [make_title(i * 10 + j, f"平台{j % 3}") for j in range(i * 3 % 13 + 1)]
+        stats.append({"word": f"关键词{i} 华为", "count": len(titles), "titles": titles})
+
+    new_titles = []
+    for i in range(new_sources):
+        titles = [make_title(100 + i * 10 + j, f"来源{i}", True) for j in range(i + 2)]
+        new_titles.append({"source_id": f"s{i}", "source_name": f"来源{i}", "titles": titles})
+
+    return {
+        "stats": stats,
+        "new_titles": new_titles,
+        "failed_ids": [f"platform-{i}" for i in range(failed)],
+        "total_new_count": sum(len(source["titles"]) for source in new_titles),
+    }
+
+
+REPORTS = {
+    "full": make_report(),
+    "stats_only": make_report(new_sources=0, failed=0),
+    "new_only": make_report(group_count=0, failed=0),
+    "failed_only": make_report(group_count=0, new_sources=0),
+    "empty": make_report(group_count=0, new_sources=0, failed=0),
+}
+
+
+@pytest.fixture(autouse=True)
+def fixed_time(monkeypatch):
+    monkeypatch.setattr(main, "get_beijing_time", lambda: FIXED_NOW)
+
+
+def split(report, format_type, max_bytes, builder=None, monkeypatch=None):
+    if builder is not None:
+        monkeypatch.setattr(main, "MessageBatchBuilder", builder)
+    return main.split_content_into_batches(
+        report,
+        format_type,
+        update_info={"remote_version": "9.9.9", "current_version": "1.0.0"},
+        max_bytes=max_bytes,
+    )
+
+
+@pytest.mark.parametrize("report_name", list(REPORTS))
+@pytest.mark.parametrize("max_bytes", MAX_BYTES)
+@pytest.mark.parametrize("format_type", FORMATS)
+def test_batches_match_legacy(monkeypatch, format_type, max_bytes, report_name):
+    report = REPORTS[report_name]
+    batches = split(report, format_type, max_bytes)
+    legacy = split(report, format_type, max_bytes, LegacyBatchBuilder, monkeypatch)
+    assert batches == legacy
+
+
+@pytest.mark.parametrize("format_type", FORMATS)
+def test_batches_match_legacy_at_every_limit(monkeypatch, format_type):
+    """逐字节扫描上限，覆盖批次恰好达到上限的边界"""
+    report = REPORTS["full"]
+    legacy = {}
+    for max_bytes in range(100, 1000):
+        legacy[max_bytes] = split(report, format_type, max_bytes, LegacyBatchBuilder, monkeypatch)
+    monkeypatch.undo()
+    monkeypatch.setattr(main, "get_beijing_time", lambda: FIXED_NOW)
+    for max_bytes, expected in legacy.items():
+        assert split(report, format_type, max_bytes) == expected, max_bytes
+
+
+@pytest.mark.parametrize("max_bytes", MAX_BYTES)
+@pytest.mark.parametrize("format_type", FORMATS)
+def test_header_kept_with_first_item(format_type, max_bytes):
+    report = REPORTS["full"]
+    batches = split(report, format_type, max_bytes)
+    total = len(report["stats"])
+
+    for i, stat in enumerate(report["stats"]):
+        marker = f"[{i + 1}/{total}]"
+        batch = next(batch for batch in batches if marker in batch)
+        header_line = next(line for line in batch.split("\n") if marker in line)
+        after_header = batch.split(header_line + "\n\n", 1)[1]
+        assert after_header.startswith("  1. ")
+        assert stat["titles"][0]["title"][:6] in after_header.split("\n", 1)[0]
+
+    for source in report["new_titles"]:
+        source_header = re.compile(rf"{source['source_name']}\** \(\d+ 条\):\n\n")
+        batch = next(batch for batch in batches if source_header.search(batch))
+        assert source_header.split(batch, 1)[1].startswith("  1. ")
+
+
+@pytest.mark.parametrize("report_name", list(REPORTS))
+@pytest.mark.parametrize("max_bytes", MAX_BYTES)
+@pytest.mark.parametrize("format_type", FORMATS)
+def test_batches_within_limit(format_type, max_bytes, report_name):
+    batches = split(REPORTS[report_name], format_type, max_bytes)
+    assert batches
+
+    for batch in batches:
+        if len(batch.encode("utf-8")) <= max_bytes:
+            continue
+        # 只允许单条无法再拆分的内容（标题+第一条新闻 / 单条新闻）独占一批时超限
+        assert max_bytes == MAX_BYTES[0] or report_name == "empty"
+        assert len(NEWS_LINE.findall(batch)) <= 1
+
+
+def test_large_limit_keeps_single_batch():
+    for format_type in FORMATS:
+        assert len(split(REPORTS["full"], format_type, 10**6)) == 1
@@ -0,0 +1,89 @@
+# coding=utf-8
+"""
+通知发件箱测试：推送目标信息（webhook 地址、令牌、Telegram chat_id）只在发送时使用，不写入发件箱
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+BOT_TOKEN = "123456789:AAEsecretBotTokenValue"
+CHAT_IDS = ["-1001234567890", "-1009876543210"]
+
+REPORT = {
+    "stats": [],
+    "new_titles": [],
+    "failed_ids": ["weibo"],
+    "total_new_count": 0,
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {"ok": True}
+
+
+class FakeSession:
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, headers=None, json=None, data=None, proxy_url=None, timeout=None):
+        self.posts.append({"url": url, "json": json})
+        return FakeResponse()
+
+
+@pytest.fixture
+def outbox_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "outbox.db"
+    session = FakeSession()
+    monkeypatch.setitem(main.CONFIG, "OUTPUT_OUTBOX_DB", str(db_path))
+    monkeypatch.setitem(
+        main.CONFIG["NOTIFICATION_OUTBOX"], "ENABLED", True
+    )
+    monkeypatch.setattr(main, "_notification_outbox", None)
+    monkeypatch.setattr(main, "get_http_session", lambda: session)
+    yield db_path, session
+    if main._notification_outbox is not None:
+        main._notification_outbox.close()
+
+
+def test_default_outbox_outside_committed_docs():
+    assert not main.CONFIG["OUTPUT_OUTBOX_DB"].startswith("docs")
+
+
+def test_telegram_chat_id_not_persisted(outbox_db):
+    db_path, session = outbox_db
+
+    for chat_id in CHAT_IDS:
+        assert main.send_to_telegram(BOT_TOKEN, chat_id, REPORT, "测试报告")
+
+    # 请求体在发送时带上 chat_id，同样内容推送到两个会话不会被幂等键合并
+    assert [post["json"]["chat_id"] for post in session.posts] == CHAT_IDS
+
+    main._notification_outbox.close()
+    main._notification_outbox = None
+    raw = db_path.read_bytes()
+    for secret in [BOT_TOKEN, *CHAT_IDS]:
+        assert secret.encode("utf-8") not in raw
+
+    with sqlite3.connect(str(db_path)) as conn:
+        rows = conn.execute("SELECT target_key, request, status FROM outbox").fetchall()
+    assert len({row[0] for row in rows}) == 2
+    assert all(row[2] == "sent" for row in rows)
+    assert all("chat_id" not in row[1] for row in rows)
+
+
+def test_resend_skips_already_sent_batches(outbox_db):
+    _, session = outbox_db
+    assert main.send_to_telegram(BOT_TOKEN, CHAT_IDS[0], REPORT, "测试报告")
+    assert main.send_to_telegram(BOT_TOKEN, CHAT_IDS[0], REPORT, "测试报告")
+    assert len(session.posts) == 1
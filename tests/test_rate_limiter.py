@@ -0,0 +1,68 @@
+# coding=utf-8
+"""
+令牌桶限速测试：爬虫按主机限速与推送按分钟限速共用 rate_limiter.TokenBucket
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import rate_limiter  # noqa: E402
+from rate_limiter import HostRateLimiter, TokenBucket, get_rate_limiter  # noqa: E402
+
+
+class FakeClock:
+    """替换 time 模块，sleep 只推进时间"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_burst_then_refill_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.5)
+    assert waits[4] == pytest.approx(0.5)
+
+
+def test_per_minute_window(clock):
+    bucket = TokenBucket.per_minute(20, burst=3)
+    start = clock.now
+    for _ in range(20):
+        bucket.acquire()
+    assert clock.now - start <= 60
+    bucket.acquire()
+    assert clock.now - start > 60
+
+
+def test_host_limiter_buckets_per_host(clock):
+    limiter = HostRateLimiter(rate=1, capacity=1)
+    assert limiter.acquire("https://a.example.com/x") == 0.0
+    assert limiter.acquire("https://b.example.com/y") == 0.0
+    assert limiter.acquire("https://a.example.com/z") == pytest.approx(1.0)
+
+
+def test_get_rate_limiter_shares_bucket_per_target():
+    feishu = get_rate_limiter("feishu", "target-1")
+    assert isinstance(feishu, TokenBucket)
+    assert get_rate_limiter("feishu", "target-1") is feishu
+    assert get_rate_limiter("feishu", "target-2") is not feishu
+    assert feishu.capacity == 5
+    assert feishu.refill_rate == pytest.approx((100 - 5) / 60)
@@ -0,0 +1,87 @@
+# coding=utf-8
+"""
+二进制快照存储测试：多个进程同时追加同一天的快照时，字符串表与数据块不会交错损坏
+"""
+
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import snapshot_store  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+WRITERS = 4
+SNAPSHOTS_PER_WRITER = 15
+TITLES_PER_PLATFORM = 40
+
+
+def make_results(writer: int, index: int) -> dict:
+    return {
+        f"platform-{writer}": {
+            f"写入者{writer}快照{index}标题{i}": {
+                "ranks": [i + 1],
+                "url": f"https://example.com/{writer}/{index}/{i}",
+                "mobileUrl": "",
+            }
+            for i in range(TITLES_PER_PLATFORM)
+        }
+    }
+
+
+def append_snapshots(day_dir: str, writer: int, start) -> None:
+    start.wait()
+    for index in range(SNAPSHOTS_PER_WRITER):
+        # 每次新建存储对象，模拟爬虫与 MCP trigger_crawl 各自打开同一天的目录
+        store = SnapshotStore(day_dir)
+        store.append(
+            f"w{writer}-{index:02d}",
+            make_results(writer, index),
+            {f"platform-{writer}": f"平台{writer}"},
+        )
+
+
+@pytest.mark.skipif(snapshot_store.fcntl is None, reason="需要 fcntl 文件锁")
+def test_concurrent_appends_keep_day_consistent(tmp_path):
+    day_dir = str(tmp_path / "snapshots")
+    Path(day_dir).mkdir()
+    context = multiprocessing.get_context("fork")
+    start = context.Event()
+    writers = [
+        context.Process(target=append_snapshots, args=(day_dir, writer, start))
+        for writer in range(WRITERS)
+    ]
+    for process in writers:
+        process.start()
+    start.set()
+    for process in writers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    store = SnapshotStore(day_dir)
+    names = store.list_snapshots()
+    assert len(names) == WRITERS * SNAPSHOTS_PER_WRITER
+
+    for name in names:
+        writer, index = (int(part) for part in name[1:].split("-"))
+        titles, id_to_name, _, _ = store.read_snapshot(name)
+        expected = make_results(writer, index)[f"platform-{writer}"]
+        assert id_to_name == {f"platform-{writer}": f"平台{writer}"}
+        assert set(titles[f"platform-{writer}"]) == set(expected)
+        for title, info in titles[f"platform-{writer}"].items():
+            assert info["url"] == expected[title]["url"]
+            assert info["ranks"] == expected[title]["ranks"]
+
+
+def test_same_minute_append_replaces_last_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.append("10时05分", make_results(0, 0), {"platform-0": "平台0"})
+    store.append("10时05分", make_results(0, 1), {"platform-0": "平台0"})
+
+    assert store.list_snapshots() == ["10时05分"]
+    titles, _, _, _ = SnapshotStore(str(tmp_path / "snapshots")).read_snapshot("10时05分")
+    assert set(titles["platform-0"]) == set(make_results(0, 1)["platform-0"])
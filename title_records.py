@@ -0,0 +1,133 @@
+# coding=utf-8
+"""
+紧凑标题记录
+替代 {"ranks": [...], "url": ..., "mobileUrl": ...} 形式的嵌套字典：
+使用 __slots__ 保存字段，排名存为 array('H')，标题时间和链接等字符串驻留复用，
+同一条标题在 all_results 和 title_info 中共用一个记录对象
+
+记录同时提供只读的字典视图（record["ranks"] / record.get("url")），
+模板和 MCP 输出按原来的键访问即可，视图中的排名是新的 list，修改不会影响记录本身
+"""
+
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+
+MAX_RANK = 0xFFFF
+
+# 字典视图的键 -> 属性名
+_KEY_TO_ATTR = {
+    "ranks": "ranks",
+    "url": "url",
+    "mobileUrl": "mobile_url",
+    "first_time": "first_time",
+    "last_time": "last_time",
+    "count": "count",
+}
+
+
+def intern_text(value: Optional[str]) -> str:
+    """驻留字符串，空值统一为空串"""
+    return sys.intern(value) if value else ""
+
+
+def pack_ranks(ranks: Iterable[int]) -> array:
+    """把排名打包为 array('H')，超出范围的值截断到 0~65535"""
+    return array("H", (min(max(int(rank), 0), MAX_RANK) for rank in ranks))
+
+
+class TitleRecord:
+    """单个平台下一条标题的累计记录"""
+
+    __slots__ = ("ranks", "url", "mobile_url", "first_time", "last_time", "count")
+
+    def __init__(
+        self,
+        ranks: Iterable[int] = (),
+        url: str = "",
+        mobile_url: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+    ):
+        self.ranks = pack_ranks(ranks)
+        self.url = intern_text(url)
+        self.mobile_url = intern_text(mobile_url)
+        self.first_time = intern_text(first_time)
+        self.last_time = intern_text(last_time)
+        self.count = count
+
+    @classmethod
+    def from_data(cls, data, time_info: str = "") -> "TitleRecord":
+        """从抓取/解析得到的标题数据创建记录，time_info 为首次出现的时间"""
+        return cls(
+            data.get("ranks", []),
+            data.get("url", ""),
+            data.get("mobileUrl", ""),
+            time_info,
+            time_info,
+            1,
+        )
+
+    def add_ranks(self, ranks: Iterable[int], unique: bool = True) -> None:
+        """追加排名，unique 为 True 时跳过已有的排名"""
+        for rank in pack_ranks(ranks):
+            if not unique or rank not in self.ranks:
+                self.ranks.append(rank)
+
+    def merge(self, data, time_info: str) -> None:
+        """合并同一标题在新快照中的数据：去重追加排名、补全链接、更新最后出现时间和次数"""
+        self.add_ranks(data.get("ranks", []))
+        if not self.url:
+            self.url = intern_text(data.get("url", ""))
+        if not self.mobile_url:
+            self.mobile_url = intern_text(data.get("mobileUrl", ""))
+        self.last_time = intern_text(time_info)
+        self.count += 1
+
+    # --- 字典视图 ---
+
+    def __getitem__(self, key: str):
+        value = getattr(self, _KEY_TO_ATTR[key])
+        if key == "ranks":
+            return value.tolist()
+        return value
+
+    def get(self, key: str, default=None):
+        """按字典键读取字段，未知的键返回 default"""
+        if key not in _KEY_TO_ATTR:
+            return default
+        return self[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in _KEY_TO_ATTR
+
+    def keys(self):
+        return _KEY_TO_ATTR.keys()
+
+    def to_dict(self) -> Dict:
+        """转换为普通字典（模板或 JSON 输出使用）"""
+        return {key: self[key] for key in _KEY_TO_ATTR}
+
+    def __repr__(self) -> str:
+        return f"TitleRecord({self.to_dict()!r})"
+
+    # --- 持久化 ---
+
+    def to_row(self) -> List:
+        """序列化为紧凑的 JSON 行：[first_time, last_time, count, ranks, url, mobileUrl]"""
+        return [
+            self.first_time,
+            self.last_time,
+            self.count,
+            self.ranks.tolist(),
+            self.url,
+            self.mobile_url,
+        ]
+
+    @classmethod
+    def from_row(cls, row: List) -> "TitleRecord":
+        """从 to_row 的结果还原记录"""
+        first_time, last_time, count, ranks, url, mobile_url = row
+        return cls(ranks, url, mobile_url, first_time, last_time, count)